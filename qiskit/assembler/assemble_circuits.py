@@ -18,9 +18,18 @@ import logging
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
                          QasmQobjConfig)
+from qiskit.tools.parallel import parallel_map
+from qiskit.validation import skip_validation
 
 logger = logging.getLogger(__name__)
 
+# Minimum number of instructions of a batch of circuits for assembling its
+# circuits with parallel_map. Pickling the circuits to the workers and the
+# experiments back costs more than assembling them, per instruction, in the
+# batches timed by test/performance/assembly_scaling.py (up to 50000
+# instructions), so smaller batches are assembled serially.
+PARALLEL_THRESHOLD = 10 ** 6
+
 
 def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
     """Assembles a list of circuits into a qobj which can be run on the backend.
@@ -39,103 +48,15 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
         qobj_config = QasmQobjConfig(**run_config.to_dict())
 
     # Pack everything into the Qobj
-    experiments = []
+    if sum(len(circuit.data) for circuit in circuits) >= PARALLEL_THRESHOLD:
+        experiments = parallel_map(_assemble_circuit, circuits)
+    else:
+        experiments = [_assemble_circuit(circuit) for circuit in circuits]
     max_n_qubits = 0
     max_memory_slots = 0
-    for circuit in circuits:
-        # header stuff
-        n_qubits = 0
-        memory_slots = 0
-        qubit_labels = []
-        clbit_labels = []
-
-        qreg_sizes = []
-        creg_sizes = []
-        for qreg in circuit.qregs:
-            qreg_sizes.append([qreg.name, qreg.size])
-            for j in range(qreg.size):
-                qubit_labels.append([qreg.name, j])
-            n_qubits += qreg.size
-        for creg in circuit.cregs:
-            creg_sizes.append([creg.name, creg.size])
-            for j in range(creg.size):
-                clbit_labels.append([creg.name, j])
-            memory_slots += creg.size
-
-        # TODO: why do we need creq_sizes and qreg_sizes in header
-        # TODO: we need to rethink memory_slots as they are tied to classical bit
-        header = QobjExperimentHeader(qubit_labels=qubit_labels,
-                                      n_qubits=n_qubits,
-                                      qreg_sizes=qreg_sizes,
-                                      clbit_labels=clbit_labels,
-                                      memory_slots=memory_slots,
-                                      creg_sizes=creg_sizes,
-                                      name=circuit.name)
-        # TODO: why do we need n_qubits and memory_slots in both the header and the config
-        config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
-
-        # Convert conditionals from QASM-style (creg ?= int) to qobj-style
-        # (register_bit ?= 1), by assuming device has unlimited register slots
-        # (supported only for simulators). Map all measures to a register matching
-        # their clbit_index, create a new register slot for every conditional gate
-        # and add a bfunc to map the creg=val mask onto the gating register bit.
-
-        is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
-        max_conditional_idx = 0
-
-        instructions = []
-        for op_context in circuit.data:
-            instruction = op_context[0].assemble()
-
-            # Add register attributes to the instruction
-            qargs = op_context[1]
-            cargs = op_context[2]
-            if qargs:
-                qubit_indices = [qubit_labels.index([qubit[0].name, qubit[1]])
-                                 for qubit in qargs]
-                instruction.qubits = qubit_indices
-            if cargs:
-                clbit_indices = [clbit_labels.index([clbit[0].name, clbit[1]])
-                                 for clbit in cargs]
-                instruction.memory = clbit_indices
-                # If the experiment has conditional instructions, assume every
-                # measurement result may be needed for a conditional gate.
-                if instruction.name == "measure" and is_conditional_experiment:
-                    instruction.register = clbit_indices
-
-            # To convert to a qobj-style conditional, insert a bfunc prior
-            # to the conditional instruction to map the creg ?= val condition
-            # onto a gating register bit.
-            if hasattr(instruction, '_control'):
-                ctrl_reg, ctrl_val = instruction._control
-                mask = 0
-                val = 0
-                for clbit in clbit_labels:
-                    if clbit[0] == ctrl_reg.name:
-                        mask |= (1 << clbit_labels.index(clbit))
-                        val |= (((ctrl_val >> clbit[1]) & 1) << clbit_labels.index(clbit))
-
-                conditional_reg_idx = memory_slots + max_conditional_idx
-                conversion_bfunc = QasmQobjInstruction(name='bfunc',
-                                                       mask="0x%X" % mask,
-                                                       relation='==',
-                                                       val="0x%X" % val,
-                                                       register=conditional_reg_idx)
-                instructions.append(conversion_bfunc)
-                instruction.conditional = conditional_reg_idx
-                max_conditional_idx += 1
-                # Delete control attribute now that we have replaced it with
-                # the conditional and bfuc
-                del instruction._control
-
-            instructions.append(instruction)
-
-        experiments.append(QasmQobjExperiment(instructions=instructions, header=header,
-                                              config=config))
-        if n_qubits > max_n_qubits:
-            max_n_qubits = n_qubits
-        if memory_slots > max_memory_slots:
-            max_memory_slots = memory_slots
+    for experiment in experiments:
+        max_n_qubits = max(max_n_qubits, experiment.config.n_qubits)
+        max_memory_slots = max(max_memory_slots, experiment.config.memory_slots)
 
     qobj_config.memory_slots = max_memory_slots
     qobj_config.n_qubits = max_n_qubits
@@ -144,3 +65,114 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
                     config=qobj_config,
                     experiments=experiments,
                     header=qobj_header)
+
+
+def _assemble_circuit(circuit):
+    """Assemble a circuit into a QasmQobjExperiment.
+
+    The Qobj models of the experiment are built from a valid circuit, so they
+    are not validated at instantiation.
+
+    Args:
+        circuit (QuantumCircuit): circuit to assemble
+
+    Returns:
+        QasmQobjExperiment: the experiment of the circuit
+    """
+    with skip_validation():
+        return _assemble_experiment(circuit)
+
+
+def _assemble_experiment(circuit):
+    """Build the QasmQobjExperiment of a circuit."""
+    # header stuff
+    n_qubits = 0
+    memory_slots = 0
+    qubit_labels = []
+    clbit_labels = []
+    # Map from (register name, index) of the bits to their index in the experiment
+    qubit_indices = {}
+    clbit_indices = {}
+    # Map from creg name to the (index of its first clbit, size) of the register
+    creg_offsets = {}
+
+    qreg_sizes = []
+    creg_sizes = []
+    for qreg in circuit.qregs:
+        qreg_sizes.append([qreg.name, qreg.size])
+        for j in range(qreg.size):
+            qubit_labels.append([qreg.name, j])
+            qubit_indices[(qreg.name, j)] = n_qubits + j
+        n_qubits += qreg.size
+    for creg in circuit.cregs:
+        creg_sizes.append([creg.name, creg.size])
+        creg_offsets[creg.name] = (memory_slots, creg.size)
+        for j in range(creg.size):
+            clbit_labels.append([creg.name, j])
+            clbit_indices[(creg.name, j)] = memory_slots + j
+        memory_slots += creg.size
+
+    # TODO: why do we need creq_sizes and qreg_sizes in header
+    # TODO: we need to rethink memory_slots as they are tied to classical bit
+    header = QobjExperimentHeader(qubit_labels=qubit_labels,
+                                  n_qubits=n_qubits,
+                                  qreg_sizes=qreg_sizes,
+                                  clbit_labels=clbit_labels,
+                                  memory_slots=memory_slots,
+                                  creg_sizes=creg_sizes,
+                                  name=circuit.name)
+    # TODO: why do we need n_qubits and memory_slots in both the header and the config
+    config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
+
+    # Convert conditionals from QASM-style (creg ?= int) to qobj-style
+    # (register_bit ?= 1), by assuming device has unlimited register slots
+    # (supported only for simulators). Map all measures to a register matching
+    # their clbit_index, create a new register slot for every conditional gate
+    # and add a bfunc to map the creg=val mask onto the gating register bit.
+
+    is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
+    max_conditional_idx = 0
+
+    instructions = []
+    for op_context in circuit.data:
+        instruction = op_context[0].assemble()
+
+        # Add register attributes to the instruction
+        qargs = op_context[1]
+        cargs = op_context[2]
+        if qargs:
+            instruction.qubits = [qubit_indices[(qubit[0].name, qubit[1])]
+                                  for qubit in qargs]
+        if cargs:
+            memory = [clbit_indices[(clbit[0].name, clbit[1])] for clbit in cargs]
+            instruction.memory = memory
+            # If the experiment has conditional instructions, assume every
+            # measurement result may be needed for a conditional gate.
+            if instruction.name == "measure" and is_conditional_experiment:
+                instruction.register = memory
+
+        # To convert to a qobj-style conditional, insert a bfunc prior
+        # to the conditional instruction to map the creg ?= val condition
+        # onto a gating register bit.
+        if hasattr(instruction, '_control'):
+            ctrl_reg, ctrl_val = instruction._control
+            offset, size = creg_offsets[ctrl_reg.name]
+            mask = ((1 << size) - 1) << offset
+            val = (ctrl_val & ((1 << size) - 1)) << offset
+
+            conditional_reg_idx = memory_slots + max_conditional_idx
+            conversion_bfunc = QasmQobjInstruction(name='bfunc',
+                                                   mask="0x%X" % mask,
+                                                   relation='==',
+                                                   val="0x%X" % val,
+                                                   register=conditional_reg_idx)
+            instructions.append(conversion_bfunc)
+            instruction.conditional = conditional_reg_idx
+            max_conditional_idx += 1
+            # Delete control attribute now that we have replaced it with
+            # the conditional and bfuc
+            del instruction._control
+
+        instructions.append(instruction)
+
+    return QasmQobjExperiment(instructions=instructions, header=header, config=config)
@@ -46,6 +46,15 @@ from qiskit.qobj.models.qasm import QasmQobjInstruction
 _CUTOFF_PRECISION = 1E-10
 
 
+def _qasm_param(param):
+    """Return the symbolic form of a numeric param, printed in OpenQASM strings."""
+    if isinstance(param, (int, float)):
+        return sympy.Number(param)
+    if isinstance(param, complex):
+        return param.real + param.imag * sympy.I
+    return param
+
+
 class Instruction:
     """Generic quantum instruction."""
 
@@ -55,7 +64,9 @@ class Instruction:
             name (str): instruction name
             num_qubits (int): instruction's qubit width
             num_clbits (int): instruction's clbit width
-            params (list[sympy.Basic|qasm.Node|int|float|complex|str|ndarray]): list of parameters
+            params (list[sympy.Basic|qasm.Node|int|float|complex|str|ndarray]): list of
+                parameters. Numbers are stored as Python numbers, and only
+                Parameters and expressions are symbolic.
         Raises:
             QiskitError: when the register is not in the correct format.
         """
@@ -123,19 +134,17 @@ class Instruction:
     def params(self, parameters):
         self._params = []
         for single_param in parameters:
+            # example: u3(0.1, 0.2, 0.3), Initialize([complex(0,1), complex(0,0)])
+            # Numbers are kept as they are, symbolic values are only used
+            # for Parameters and expressions.
+            if isinstance(single_param, (int, float, complex)):
+                self._params.append(single_param)
             # example: u2(pi/2, sin(pi/4))
-            if isinstance(single_param, (Parameter, sympy.Basic)):
+            elif isinstance(single_param, (Parameter, sympy.Basic)):
                 self._params.append(single_param)
             # example: OpenQASM parsed instruction
             elif isinstance(single_param, node.Node):
                 self._params.append(single_param.sym())
-            # example: u3(0.1, 0.2, 0.3)
-            elif isinstance(single_param, (int, float)):
-                self._params.append(sympy.Number(single_param))
-            # example: Initialize([complex(0,1), complex(0,0)])
-            elif isinstance(single_param, complex):
-                self._params.append(single_param.real +
-                                    single_param.imag * sympy.I)
             # example: snapshot('label')
             elif isinstance(single_param, str):
                 self._params.append(sympy.Symbol(single_param))
@@ -148,7 +157,7 @@ class Instruction:
             elif isinstance(single_param, sympy.Expr):
                 self._params.append(single_param)
             elif isinstance(single_param, numpy.number):
-                self._params.append(sympy.Number(single_param.item()))
+                self._params.append(single_param.item())
             else:
                 raise QiskitError("invalid param type {0} in instruction "
                                   "{1}".format(type(single_param), self.name))
@@ -170,13 +179,13 @@ class Instruction:
         instruction = QasmQobjInstruction(name=self.name)
         # Evaluate parameters
         if self.params:
-            params = [
-                x.evalf() if hasattr(x, 'evalf') else x for x in self.params
-            ]
-            params = [
-                sympy.matrix2numpy(x, dtype=complex) if isinstance(
-                    x, sympy.Matrix) else x for x in params
-            ]
+            params = []
+            for param in self.params:
+                if isinstance(param, sympy.Matrix):
+                    param = sympy.matrix2numpy(param, dtype=complex)
+                elif isinstance(param, sympy.Basic):
+                    param = param.evalf()
+                params.append(param)
             instruction.params = params
         # Add placeholder for qarg and carg params
         if self.num_qubits:
@@ -273,7 +282,7 @@ class Instruction:
         name_param = self.name
         if self.params:
             name_param = "%s(%s)" % (name_param, ",".join(
-                [str(i) for i in self.params]))
+                [str(_qasm_param(i)) for i in self.params]))
 
         return self._qasmif(name_param)
 
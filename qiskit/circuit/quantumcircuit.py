@@ -14,7 +14,7 @@
 
 """Quantum circuit object."""
 
-from copy import deepcopy
+from copy import copy, deepcopy
 import itertools
 import sys
 import multiprocessing as mp
@@ -829,6 +829,73 @@ class QuantumCircuit:
             del new_circuit._parameter_table[parameter]
         return new_circuit
 
+    def bind_parameters_batch(self, values, parameters=None):
+        """Assign rows of parameter values, yielding a new circuit per row.
+
+        Only the instructions holding one of the bound parameters are copied:
+        the bound circuits share their registers and other instructions with
+        self, so binding N rows costs O(N * number of parameterized
+        instructions) on top of copying the instruction list.
+
+        Args:
+            values (array_like): 2-D array of values, with a row per bound
+                circuit and a column per parameter in ``parameters``
+            parameters (list[Parameter]): parameters given by the columns of
+                values. Defaults to all the circuit parameters, sorted by name.
+
+        Raises:
+            QiskitError: If parameters are not present in the circuit, or a row
+                does not have a value per parameter
+
+        Returns:
+            list[QuantumCircuit]: a copy of self per row, with the row values
+                assigned to the parameters.
+        """
+        if parameters is None:
+            parameters = sorted(self.parameters, key=lambda parameter: parameter.name)
+        if not set(parameters) <= self.parameters:
+            raise QiskitError('Cannot bind parameters ({}) not present in the circuit.'.format(
+                [str(p) for p in set(parameters) - self.parameters]))
+
+        # (instruction, [(param_index, column), ...]) of each parameterized instruction
+        slots = {}
+        for column, parameter in enumerate(parameters):
+            for instruction, param_index in self._parameter_table[parameter]:
+                slots.setdefault(id(instruction), (instruction, []))[1].append(
+                    (param_index, column))
+        # an instruction may be applied more than once, e.g. by broadcasting
+        positions = [(index, id(instruction))
+                     for index, (instruction, _, _) in enumerate(self.data)
+                     if id(instruction) in slots]
+        unbound_parameters = self.parameters - set(parameters)
+
+        circuits = []
+        for row in values:
+            if len(row) != len(parameters):
+                raise QiskitError('Expected {} parameter values per row, got {}.'.format(
+                    len(parameters), len(row)))
+            bound = {}
+            for key, (instruction, instruction_slots) in slots.items():
+                bound_instruction = copy(instruction)
+                bound_instruction._params = list(instruction.params)
+                for param_index, column in instruction_slots:
+                    bound_instruction._params[param_index] = row[column]
+                bound[key] = bound_instruction
+
+            new_circuit = copy(self)
+            new_circuit.qregs = list(self.qregs)
+            new_circuit.cregs = list(self.cregs)
+            new_circuit.data = list(self.data)
+            for index, key in positions:
+                _, qargs, cargs = self.data[index]
+                new_circuit.data[index] = (bound[key], qargs, cargs)
+            new_circuit._parameter_table = ParameterTable(
+                {parameter: [(bound.get(id(instruction), instruction), param_index)
+                             for instruction, param_index in self._parameter_table[parameter]]
+                 for parameter in unbound_parameters})
+            circuits.append(new_circuit)
+        return circuits
+
     def _bind_parameter(self, parameter, value):
         """Assigns a parameter value to matching instructions in-place."""
         for (instr, param_index) in self._parameter_table[parameter]:
@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Binary serialization of QuantumCircuit.
+
+A file holds a batch of circuits:
+
+* a 16 bytes header: the magic string ``QKCIRC``, the format version (uint16),
+  flags (uint32) and a reserved uint32,
+* a record for each circuit, starting at a multiple of 8 bytes,
+* an index of the offsets of the records (uint64 each),
+* a 16 bytes footer: the number of circuits and the offset of the index
+  (uint64 each).
+
+The record of a circuit holds its name and registers, the names of its
+``Parameter`` objects, and a table of the distinct instructions (opcodes) of
+the circuit. An opcode of the table is a gate of ``qiskit.extensions.standard``
+(or a ``Measure`` or ``Reset``), stored by its class path and rebuilt only if
+the class is one of them. The instructions are stored as packed arrays of
+their opcodes, qubit and clbit indices (uint32) and parameters (float64; the
+opcode table tells the integer, complex and ``Parameter`` ones apart). All
+numbers are little endian.
+
+Other instructions (e.g. the instructions of ``to_instruction()``, or gates
+with symbolic expressions as parameters) can only be written and read with
+``allow_pickle=True``, and are then pickled together at the end of the
+record. Reading pickled data runs arbitrary code: only read files written
+with ``allow_pickle=True`` if they come from a trusted source.
+
+Since the records are indexed, ``CircuitBatchFile`` reads the circuits of a
+file on demand from a memory map.
+"""
+
+import functools
+import io
+import mmap
+import pickle
+import struct
+from collections import namedtuple
+
+import numpy
+
+from qiskit.exceptions import QiskitError
+from .classicalregister import ClassicalRegister
+from .gate import Gate
+from .instruction import Instruction
+from .measure import Measure
+from .parameter import Parameter
+from .quantumcircuit import QuantumCircuit
+from .quantumregister import QuantumRegister
+from .reset import Reset
+
+FORMAT_VERSION = 1
+
+_MAGIC = b'QKCIRC'
+_HEADER = struct.Struct('<6sHII')
+_FOOTER = struct.Struct('<QQ')
+_UINT32 = struct.Struct('<I')
+_UINT64 = struct.Struct('<Q')
+
+# Header flag set when a single circuit, rather than a list, was written
+_FLAG_SINGLE = 1
+# Opcode of the instructions pickled at the end of the record
+_OBJECT_OPCODE = 0xFFFFFFFF
+# Attributes of an instruction that are stored in the opcode table or in
+# the packed arrays
+_INSTRUCTION_ATTRIBUTES = {'name', 'num_qubits', 'num_clbits', '_params', 'control',
+                           '_definition', '_label'}
+# Kinds of the params, by type, and the number of float64 they are stored in.
+# A Parameter is stored as its index in the Parameter names of the record.
+_PARAM_FLOAT, _PARAM_INT, _PARAM_COMPLEX, _PARAM_PARAMETER = range(4)
+_PARAM_KINDS = {float: _PARAM_FLOAT, numpy.float64: _PARAM_FLOAT, int: _PARAM_INT,
+                complex: _PARAM_COMPLEX, numpy.complex128: _PARAM_COMPLEX,
+                Parameter: _PARAM_PARAMETER}
+_PARAM_SIZES = {_PARAM_FLOAT: 1, _PARAM_INT: 1, _PARAM_COMPLEX: 2, _PARAM_PARAMETER: 1}
+
+# Instructions with the same key share an opcode
+_OpcodeKey = namedtuple('_OpcodeKey', ['type', 'name', 'num_qubits', 'num_clbits',
+                                       'param_kinds', 'label'])
+
+
+@functools.lru_cache(maxsize=None)
+def _standard_classes():
+    """Return the instruction classes rebuilt from the opcode table, by class path."""
+    # imported here, since the standard gates import qiskit.circuit
+    from qiskit.extensions import standard
+    classes = [value for value in vars(standard).values()
+               if isinstance(value, type) and issubclass(value, Instruction)]
+    classes += [Measure, Reset]
+    return {_class_path(cls): cls for cls in classes}
+
+
+def _class_path(cls):
+    return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+
+def dump_circuits(circuits, file_obj, allow_pickle=False):
+    """Write circuits to a binary file.
+
+    Args:
+        circuits (QuantumCircuit or iterable[QuantumCircuit]): circuit or
+            circuits to be written.
+        file_obj (file): binary file object, e.g. as returned by
+            ``open(path, 'wb')``.
+        allow_pickle (bool): pickle the instructions that are not standard
+            gates, measurements or resets with real, complex or ``Parameter``
+            params, instead of raising. The file can then only be read with
+            ``allow_pickle=True``.
+
+    Raises:
+        QiskitError: if a circuit has instructions to be pickled and
+            ``allow_pickle`` is False.
+    """
+    single = isinstance(circuits, QuantumCircuit)
+    if single:
+        circuits = [circuits]
+    file_obj.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, _FLAG_SINGLE if single else 0, 0))
+    position = _HEADER.size
+    offsets = []
+    for circuit in circuits:
+        offsets.append(position)
+        record = _encode_circuit(circuit, allow_pickle)
+        record += bytes(-len(record) % 8)
+        file_obj.write(record)
+        position += len(record)
+    file_obj.write(numpy.array(offsets, dtype='<u8').tobytes())
+    file_obj.write(_FOOTER.pack(len(offsets), position))
+
+
+def load_circuits(source, allow_pickle=False):
+    """Read circuits written by ``dump_circuits()``.
+
+    Args:
+        source (bytes or file): the written bytes, or a binary file object
+            positioned at the start of them.
+        allow_pickle (bool): unpickle the instructions written with
+            ``allow_pickle=True``. Unpickling runs arbitrary code: never
+            set it for data that does not come from a trusted source.
+
+    Returns:
+        QuantumCircuit or list[QuantumCircuit]: the circuit, or the list of
+            circuits, that was written.
+
+    Raises:
+        QiskitError: if source does not hold circuits in a supported format,
+            or holds pickled instructions and ``allow_pickle`` is False.
+    """
+    if not isinstance(source, (bytes, bytearray, memoryview)):
+        source = source.read()
+    single, offsets = _read_index(source)
+    circuits = [_decode_circuit(source, offset, allow_pickle) for offset in offsets]
+    return circuits[0] if single else circuits
+
+
+class CircuitBatchFile:
+    """A file of circuits written by ``dump_circuits()``, read on demand.
+
+    The file is memory-mapped and each circuit is decoded when it is
+    accessed, so that large batches are not read into memory at once::
+
+        with CircuitBatchFile('circuits.bin') as batch:
+            for circuit in batch:
+                ...
+    """
+
+    def __init__(self, path, allow_pickle=False):
+        """Open a file of circuits.
+
+        Args:
+            path (str): path of the file.
+            allow_pickle (bool): unpickle the instructions written with
+                ``allow_pickle=True``. Unpickling runs arbitrary code: never
+                set it for files that do not come from a trusted source.
+
+        Raises:
+            QiskitError: if the file does not hold circuits in a supported format.
+        """
+        self._allow_pickle = allow_pickle
+        with open(path, 'rb') as file_obj:
+            self._map = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            _, self._offsets = _read_index(self._map)
+        except QiskitError:
+            self._map.close()
+            raise
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError('circuit index out of range')
+        return _decode_circuit(self._map, self._offsets[index], self._allow_pickle)
+
+    def __iter__(self):
+        for offset in self._offsets:
+            yield _decode_circuit(self._map, offset, self._allow_pickle)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the memory map of the file."""
+        self._offsets = []
+        self._map.close()
+
+
+def _read_index(buffer):
+    """Return the single flag and the offsets of the records of buffer."""
+    if len(buffer) < _HEADER.size + _FOOTER.size:
+        raise QiskitError('The data does not hold serialized circuits.')
+    magic, version, flags, _ = _HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC:
+        raise QiskitError('The data does not hold serialized circuits.')
+    if version > FORMAT_VERSION:
+        raise QiskitError('Unsupported circuit format version {}, the supported version '
+                          'is {}.'.format(version, FORMAT_VERSION))
+    n_circuits, index_offset = _FOOTER.unpack_from(buffer, len(buffer) - _FOOTER.size)
+    offsets = numpy.frombuffer(buffer, dtype='<u8', count=n_circuits, offset=index_offset)
+    return bool(flags & _FLAG_SINGLE), offsets.tolist()
+
+
+def _opcode_key(instruction):
+    """Return the key of the opcode of an instruction, None if it is pickled."""
+    # pylint: disable=too-many-return-statements
+    if _class_path(type(instruction)) not in _standard_classes():
+        return None
+    attributes = vars(instruction)
+    if not attributes.keys() <= _INSTRUCTION_ATTRIBUTES:
+        return None
+    if type(instruction)._define is Instruction._define and \
+            attributes['_definition'] is not None:
+        return None
+    params = attributes['_params']
+    try:
+        param_kinds = bytes(_PARAM_KINDS[type(param)] for param in params)
+    except KeyError:
+        return None
+    if any(kind == _PARAM_INT and abs(param) >= 2 ** 53
+           for kind, param in zip(param_kinds, params)):
+        return None
+    label = attributes.get('_label')
+    if label is not None and not isinstance(label, str):
+        return None
+    return _OpcodeKey(type(instruction), attributes['name'], attributes['num_qubits'],
+                      attributes['num_clbits'], param_kinds, label)
+
+
+class _RecordWriter:
+    """Builds the bytes of a record."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def uint32(self, value):
+        """Write an uint32."""
+        self.buffer.write(_UINT32.pack(value))
+
+    def blob(self, data):
+        """Write bytes prefixed by their length."""
+        self.uint32(len(data))
+        self.buffer.write(data)
+
+    def string(self, value):
+        """Write an UTF-8 string."""
+        self.blob(value.encode('utf-8'))
+
+    def array(self, values, dtype):
+        """Write an array of numbers, 8 bytes aligned."""
+        data = numpy.asarray(values, dtype=dtype).tobytes()
+        self.buffer.write(_UINT64.pack(len(values)))
+        self.buffer.write(bytes(-self.buffer.tell() % 8))
+        self.buffer.write(data)
+
+
+class _RecordReader:
+    """Reads the values of a record."""
+
+    def __init__(self, buffer, offset):
+        self.buffer = buffer
+        self.offset = offset
+
+    def uint32(self):
+        """Read an uint32."""
+        value, = _UINT32.unpack_from(self.buffer, self.offset)
+        self.offset += 4
+        return value
+
+    def blob(self):
+        """Read bytes prefixed by their length."""
+        size = self.uint32()
+        data = bytes(self.buffer[self.offset:self.offset + size])
+        self.offset += size
+        return data
+
+    def string(self):
+        """Read an UTF-8 string."""
+        return self.blob().decode('utf-8')
+
+    def array(self, dtype):
+        """Read an array of numbers, without copying the buffer."""
+        count, = _UINT64.unpack_from(self.buffer, self.offset)
+        self.offset += 8
+        self.offset += -self.offset % 8
+        values = numpy.frombuffer(self.buffer, dtype=dtype, count=count, offset=self.offset)
+        self.offset += values.nbytes
+        return values
+
+
+def _encode_circuit(circuit, allow_pickle):
+    """Return the record of a circuit, starting at an 8 bytes aligned offset."""
+    writer = _RecordWriter()
+    writer.string(circuit.name)
+    bit_indices = {}
+    for registers in (circuit.qregs, circuit.cregs):
+        writer.uint32(len(registers))
+        offset = 0
+        for register in registers:
+            writer.string(register.name)
+            writer.uint32(register.size)
+            for index in range(register.size):
+                bit_indices[(register, index)] = offset + index
+            offset += register.size
+
+    opcodes = {}
+    parameters = {}
+    instruction_opcodes = []
+    qargs = []
+    cargs = []
+    params = []
+    objects = []
+    conditions = []
+    for position, (instruction, qubits, clbits) in enumerate(circuit.data):
+        key = _opcode_key(instruction)
+        if key is None:
+            if not allow_pickle:
+                raise QiskitError('The instruction "{}" of circuit "{}" can only be written '
+                                  'with allow_pickle=True.'.format(instruction.name,
+                                                                   circuit.name))
+            instruction_opcodes.append(_OBJECT_OPCODE)
+            unconditioned = object.__new__(type(instruction))
+            unconditioned.__dict__.update(vars(instruction))
+            unconditioned.control = None
+            objects.append(unconditioned)
+        else:
+            instruction_opcodes.append(opcodes.setdefault(key, len(opcodes)))
+            for kind, param in zip(key.param_kinds, instruction.params):
+                if kind == _PARAM_COMPLEX:
+                    params.extend((param.real, param.imag))
+                elif kind == _PARAM_PARAMETER:
+                    params.append(parameters.setdefault(param, len(parameters)))
+                else:
+                    params.append(param)
+        qargs.extend([bit_indices[qubit] for qubit in qubits])
+        cargs.extend([bit_indices[clbit] for clbit in clbits])
+        if instruction.control:
+            register, value = instruction.control
+            conditions.append((position, circuit.cregs.index(register), value))
+
+    writer.uint32(len(parameters))
+    for parameter in parameters:
+        writer.string(parameter.name)
+    writer.uint32(len(opcodes))
+    for key in opcodes:
+        writer.string(_class_path(key.type))
+        writer.string(key.name)
+        writer.uint32(key.num_qubits)
+        writer.uint32(key.num_clbits)
+        writer.blob(key.param_kinds)
+        writer.uint32(key.label is not None)
+        if key.label is not None:
+            writer.string(key.label)
+    writer.array(instruction_opcodes, '<u4')
+    writer.array(qargs, '<u4')
+    writer.array(cargs, '<u4')
+    writer.array(params, '<f8')
+    # pickled together, so that the instructions share their Parameter objects
+    writer.blob(pickle.dumps(objects, pickle.HIGHEST_PROTOCOL) if objects else b'')
+    writer.uint32(len(conditions))
+    for position, register_index, value in conditions:
+        writer.uint32(position)
+        writer.uint32(register_index)
+        writer.blob(value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True))
+    return writer.buffer.getvalue()
+
+
+def _read_opcode(reader):
+    """Read an opcode of the table, returning its prototype and param kinds."""
+    class_path = reader.string()
+    cls = _standard_classes().get(class_path)
+    if cls is None:
+        raise QiskitError('Unsupported instruction class "{}" in the serialized '
+                          'circuits.'.format(class_path))
+    prototype = object.__new__(cls)
+    prototype.name = reader.string()
+    prototype.num_qubits = reader.uint32()
+    prototype.num_clbits = reader.uint32()
+    prototype._params = []
+    prototype.control = None
+    prototype._definition = None
+    param_kinds = reader.blob()
+    label = reader.string() if reader.uint32() else None
+    if issubclass(cls, Gate):
+        prototype._label = label
+    return prototype, param_kinds
+
+
+def _decode_circuit(buffer, offset, allow_pickle):
+    """Return the circuit of the record at offset in buffer."""
+    reader = _RecordReader(buffer, offset)
+    name = reader.string()
+    qregs = [QuantumRegister(size, register_name)
+             for register_name, size in [(reader.string(), reader.uint32())
+                                         for _ in range(reader.uint32())]]
+    cregs = [ClassicalRegister(size, register_name)
+             for register_name, size in [(reader.string(), reader.uint32())
+                                         for _ in range(reader.uint32())]]
+    qubits = [(register, index) for register in qregs for index in range(register.size)]
+    clbits = [(register, index) for register in cregs for index in range(register.size)]
+
+    parameters = [Parameter(reader.string()) for _ in range(reader.uint32())]
+    prototypes = [_read_opcode(reader) for _ in range(reader.uint32())]
+    opcodes = reader.array('<u4').tolist()
+    qargs = reader.array('<u4').tolist()
+    cargs = reader.array('<u4').tolist()
+    params = reader.array('<f8').tolist()
+    objects = reader.blob()
+    if objects and not allow_pickle:
+        raise QiskitError('The circuit "{}" holds pickled instructions, which are only read '
+                          'with allow_pickle=True. Unpickling runs arbitrary code: only set '
+                          'it for trusted data.'.format(name))
+    objects = iter(pickle.loads(objects) if objects else [])
+    conditions = {}
+    for _ in range(reader.uint32()):
+        position = reader.uint32()
+        register = cregs[reader.uint32()]
+        conditions[position] = (register, int.from_bytes(reader.blob(), 'little', signed=True))
+
+    circuit = QuantumCircuit(*qregs, *cregs, name=name)
+    qarg_index = carg_index = param_index = 0
+    for position, opcode in enumerate(opcodes):
+        tracked = opcode == _OBJECT_OPCODE
+        if tracked:
+            instruction = next(objects)
+        else:
+            prototype, param_kinds = prototypes[opcode]
+            instruction = object.__new__(type(prototype))
+            instruction.__dict__.update(vars(prototype))
+            instruction_params = []
+            for kind in param_kinds:
+                if kind == _PARAM_FLOAT:
+                    instruction_params.append(params[param_index])
+                elif kind == _PARAM_INT:
+                    instruction_params.append(int(params[param_index]))
+                elif kind == _PARAM_COMPLEX:
+                    instruction_params.append(complex(params[param_index],
+                                                      params[param_index + 1]))
+                else:
+                    instruction_params.append(parameters[int(params[param_index])])
+                    tracked = True
+                param_index += _PARAM_SIZES[kind]
+            instruction._params = instruction_params
+        instruction_qargs = [qubits[index] for index in
+                             qargs[qarg_index:qarg_index + instruction.num_qubits]]
+        qarg_index += instruction.num_qubits
+        instruction_cargs = [clbits[index] for index in
+                             cargs[carg_index:carg_index + instruction.num_clbits]]
+        carg_index += instruction.num_clbits
+        if position in conditions:
+            instruction.control = conditions[position]
+        if tracked:
+            # track the Parameters of the instruction
+            circuit._append(instruction, instruction_qargs, instruction_cargs)
+        else:
+            circuit.data.append((instruction, instruction_qargs, instruction_cargs))
+    return circuit
@@ -300,9 +300,11 @@ def _expand_parameters(circuits, run_config):
                  'Parameter binds: {} ' +
                  'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
 
-        circuits = [circuit.bind_parameters(binds)
+        parameters = list(unique_parameters)
+        values = [[binds[parameter] for parameter in parameters] for binds in parameter_binds]
+        circuits = [bound_circuit
                     for circuit in circuits
-                    for binds in parameter_binds]
+                    for bound_circuit in circuit.bind_parameters_batch(values, parameters)]
 
         # All parameters have been expanded and bound, so remove from run_config
         run_config = copy.deepcopy(run_config)
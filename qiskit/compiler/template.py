@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Parameterized circuit templates, transpiled once and bound many times."""
+
+import copy
+
+from qiskit.exceptions import QiskitError
+
+from .assemble import assemble
+
+
+class CircuitTemplate:
+    """A parameterized circuit whose parameters are bound in batches.
+
+    The template is built from a circuit that is ready to run, typically the
+    output of ``transpile()`` on a parameterized circuit. Binding writes the
+    parameter values straight into copies of the parameterized instructions,
+    so neither the pass manager nor ``QuantumCircuit.bind_parameters`` run
+    again for each set of values::
+
+        template = CircuitTemplate(transpile(circuit, backend))
+        qobj = template.assemble(values, backend=backend, shots=1024)
+
+    The instructions without parameters are shared by the template and all
+    the circuits and experiments bound from it, see
+    ``QuantumCircuit.bind_parameters_batch()``.
+    """
+
+    def __init__(self, circuit):
+        """Create a template from a circuit.
+
+        Args:
+            circuit (QuantumCircuit): parameterized circuit, e.g. as returned
+                by transpile()
+        """
+        self.circuit = circuit
+        # Parameters of the template, in the order of the columns of values
+        self.parameters = sorted(circuit.parameters, key=lambda parameter: parameter.name)
+        # Map from id of the parameterized instructions to the list of their
+        # (param_index, column) slots
+        self._slots = {}
+        for column, parameter in enumerate(self.parameters):
+            for instruction, param_index in circuit._parameter_table[parameter]:
+                self._slots.setdefault(id(instruction), []).append((param_index, column))
+
+    def _rows(self, values):
+        """Return values as a list of rows ordered like self.parameters.
+
+        Args:
+            values (list): binds, as dicts {Parameter: value} or sequences of values
+
+        Returns:
+            list[list]: a row of values for each bind
+
+        Raises:
+            QiskitError: if a row does not give a value to every parameter
+        """
+        rows = []
+        for row in values:
+            if isinstance(row, dict):
+                if set(row) != set(self.parameters):
+                    raise QiskitError('Parameter binds {} do not match the template '
+                                      'parameters {}.'.format([str(p) for p in row],
+                                                              [str(p) for p in self.parameters]))
+                row = [row[parameter] for parameter in self.parameters]
+            elif len(row) != len(self.parameters):
+                raise QiskitError('Expected {} parameter values per bind, got {}.'.format(
+                    len(self.parameters), len(row)))
+            rows.append(row)
+        return rows
+
+    def bind(self, values):
+        """Bind sets of parameter values to copies of the template circuit.
+
+        Args:
+            values (list): one bind per circuit, either a dict
+                {Parameter: value} or a sequence of values ordered like
+                ``self.parameters`` (e.g. the rows of a 2-D array)
+
+        Returns:
+            list[QuantumCircuit]: a bound circuit for each bind
+
+        Raises:
+            QiskitError: if a bind does not give a value to every parameter
+        """
+        return self.circuit.bind_parameters_batch(self._rows(values), self.parameters)
+
+    def assemble(self, values, **assemble_args):
+        """Assemble a Qobj with an experiment for each set of parameter values.
+
+        The template circuit is assembled once; each experiment is a copy of
+        it with the parameter values written into the parameterized
+        instructions.
+
+        Args:
+            values (list): one bind per experiment, as in bind()
+            assemble_args (dict): arguments of assemble(), except for
+                ``parameter_binds``
+
+        Returns:
+            QasmQobj: the Qobj to be run on the backends
+
+        Raises:
+            QiskitError: if a bind does not give a value to every parameter
+        """
+        rows = self._rows(values)
+        # Assemble the template with any values, and find the parameterized
+        # instructions of the experiment
+        placeholder = self.bind([[0.0] * len(self.parameters)])[0]
+        qobj = assemble(placeholder, **assemble_args)
+        template_experiment = qobj.experiments[0]
+        experiment_slots = []
+        instructions = iter(template_experiment.instructions)
+        for instruction, _, _ in self.circuit.data:
+            if instruction.control:
+                # skip the bfunc added by the assembler before conditional instructions
+                next(instructions)
+            qobj_instruction = next(instructions)
+            slots = self._slots.get(id(instruction))
+            if slots is not None:
+                experiment_slots.append((qobj_instruction, slots))
+
+        experiments = []
+        for row in rows:
+            bound = {}
+            for qobj_instruction, slots in experiment_slots:
+                bound_instruction = copy.copy(qobj_instruction)
+                bound_instruction.params = list(qobj_instruction.params)
+                for param_index, column in slots:
+                    bound_instruction.params[param_index] = row[column]
+                bound[id(qobj_instruction)] = bound_instruction
+            experiment = copy.copy(template_experiment)
+            experiment.instructions = [bound.get(id(qobj_instruction), qobj_instruction)
+                                       for qobj_instruction in template_experiment.instructions]
+            experiments.append(experiment)
+        qobj.experiments = experiments
+        return qobj
@@ -27,7 +27,8 @@ def transpile(circuits,
               basis_gates=None, coupling_map=None, backend_properties=None,
               initial_layout=None, seed_transpiler=None,
               optimization_level=None,
-              pass_manager=None):
+              pass_manager=None,
+              cache=None):
     """transpile one or more circuits, according to some desired
     transpilation targets.
 
@@ -117,6 +118,11 @@ def transpile(circuits,
             pass manager will be used directly (Qiskit will not attempt to
             auto-select a pass manager based on transpile options).
 
+        cache (TranspileCache):
+            Cache of transpiled circuits to look the circuits up in before
+            transpiling them, and to store the newly transpiled circuits in.
+            Circuits found in the cache are returned as copies renamed after
+            the input circuits.
 
     Returns:
         QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
@@ -137,29 +143,96 @@ def transpile(circuits,
                                               seed_transpiler, optimization_level,
                                               pass_manager)
 
-    # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    if cache is None:
+        circuits = _transpile_circuits(circuits, transpile_configs)
+    else:
+        circuits = _transpile_with_cache(circuits, transpile_configs, cache)
 
     if len(circuits) == 1:
         return circuits[0]
     return circuits
 
 
+def _transpile_circuits(circuits, transpile_configs):
+    """Transpile circuits in parallel.
+
+    The circuits sharing a TranspileConfig are sent to the workers with the
+    index of their configuration, and the distinct configurations are sent
+    once with each chunk of circuits instead of once per circuit.
+
+    Args:
+        circuits (list[QuantumCircuit]): circuits to transpile
+        transpile_configs (list[TranspileConfig]): configuration of each circuit
+
+    Returns:
+        list[QuantumCircuit]: transpiled circuits
+    """
+    config_indices = {}
+    unique_configs = []
+    values = []
+    for circuit, transpile_config in zip(circuits, transpile_configs):
+        if id(transpile_config) not in config_indices:
+            config_indices[id(transpile_config)] = len(unique_configs)
+            unique_configs.append(transpile_config)
+        values.append((circuit, config_indices[id(transpile_config)]))
+
+    return parallel_map(_transpile_circuit, values, task_args=(unique_configs,))
+
+
 # FIXME: This is a helper function because of parallel tools.
-def _transpile_circuit(circuit_config_tuple):
+def _transpile_circuit(circuit_config_tuple, transpile_configs):
     """Select a PassManager and run a single circuit through it.
 
     Args:
         circuit_config_tuple (tuple):
             circuit (QuantumCircuit): circuit to transpile
-            transpile_config (TranspileConfig): configuration dictating how to transpile
+            config_index (int): index of its configuration in transpile_configs
+        transpile_configs (list[TranspileConfig]): configurations dictating how
+            to transpile
 
     Returns:
         QuantumCircuit: transpiled circuit
     """
-    circuit, transpile_config = circuit_config_tuple
+    circuit, config_index = circuit_config_tuple
+
+    return transpile_circuit(circuit, transpile_configs[config_index])
+
+
+def _transpile_with_cache(circuits, transpile_configs, cache):
+    """Look circuits up in the cache, transpile the others in parallel and store them.
 
-    return transpile_circuit(circuit, transpile_config)
+    Args:
+        circuits (list[QuantumCircuit]): circuits to transpile
+        transpile_configs (list[TranspileConfig]): configuration of each circuit
+        cache (TranspileCache): cache of transpiled circuits
+
+    Returns:
+        list[QuantumCircuit]: transpiled circuits
+    """
+    keys = [cache.key(circuit, transpile_config)
+            for circuit, transpile_config in zip(circuits, transpile_configs)]
+    results = [None] * len(circuits)
+    missing = []
+    for index, (circuit, key) in enumerate(zip(circuits, keys)):
+        cached = cache.get(key) if key is not None else None
+        if cached is None:
+            missing.append(index)
+            continue
+        # the cached circuit may come from a circuit with another name and
+        # other Parameter objects with the same names
+        cached.name = circuit.name
+        parameters = {parameter.name: parameter for parameter in circuit.parameters}
+        cached._substitute_parameters({parameter: parameters[parameter.name]
+                                       for parameter in cached.parameters
+                                       if parameter is not parameters[parameter.name]})
+        results[index] = cached
+
+    transpiled = _transpile_circuits([circuits[index] for index in missing],
+                                     [transpile_configs[index] for index in missing])
+    for index, circuit in zip(missing, transpiled):
+        cache.put(keys[index], circuit)
+        results[index] = circuit
+    return results
 
 
 def _parse_transpile_args(circuits, backend,
@@ -196,17 +269,22 @@ def _parse_transpile_args(circuits, backend,
 
     pass_manager = _parse_pass_manager(pass_manager, num_circuits)
 
+    # Circuits given the same args share a TranspileConfig, so that it only has
+    # to be sent once to the parallel workers
     transpile_configs = []
+    shared_configs = {}
     for args in zip(basis_gates, coupling_map, backend_properties, initial_layout,
                     seed_transpiler, optimization_level, pass_manager):
-        transpile_config = TranspileConfig(basis_gates=args[0],
-                                           coupling_map=args[1],
-                                           backend_properties=args[2],
-                                           initial_layout=args[3],
-                                           seed_transpiler=args[4],
-                                           optimization_level=args[5],
-                                           pass_manager=args[6])
-        transpile_configs.append(transpile_config)
+        args_ids = tuple(id(arg) for arg in args)
+        if args_ids not in shared_configs:
+            shared_configs[args_ids] = TranspileConfig(basis_gates=args[0],
+                                                       coupling_map=args[1],
+                                                       backend_properties=args[2],
+                                                       initial_layout=args[3],
+                                                       seed_transpiler=args[4],
+                                                       optimization_level=args[5],
+                                                       pass_manager=args[6])
+        transpile_configs.append(shared_configs[args_ids])
 
     return transpile_configs
 
@@ -248,7 +326,12 @@ def _parse_coupling_map(coupling_map, backend, num_circuits):
     elif isinstance(coupling_map, list) and all(isinstance(i, list) and len(i) == 2
                                                 for i in coupling_map):
         coupling_map = [coupling_map] * num_circuits
-    coupling_map = [CouplingMap(cm) if isinstance(cm, list) else cm for cm in coupling_map]
+    # circuits given the same list share its CouplingMap
+    coupling_maps = {}
+    for edges in coupling_map:
+        if isinstance(edges, list) and id(edges) not in coupling_maps:
+            coupling_maps[id(edges)] = CouplingMap(edges)
+    coupling_map = [coupling_maps.get(id(cm), cm) for cm in coupling_map]
     return coupling_map
 
 
@@ -26,14 +26,18 @@ import re
 from collections import OrderedDict
 import copy
 import itertools
+import hashlib
 import warnings
-import networkx as nx
+
+import numpy as np
 
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
 from qiskit.circuit.gate import Gate
+from qiskit.circuit.instruction import Instruction
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
+from .graphs import GRAPH_STORAGES
 
 
 class DAGCircuit:
@@ -43,12 +47,34 @@ class DAGCircuit:
     There are 3 types of nodes in the graph: inputs, outputs, and operations.
     The nodes are connected by directed edges that correspond to qubits and
     bits.
+
+    The graph is held by a storage engine from ``qiskit.dagcircuit.graphs``:
+    ``'networkx'`` (a networkx.MultiDiGraph) or ``'wiregraph'`` (integer node
+    ids with per-wire predecessor and successor maps). The engine used by
+    DAGCircuits created without an explicit ``storage`` is given by the class
+    attribute ``DAGCircuit.default_storage``.
     """
 
     # pylint: disable=invalid-name
 
-    def __init__(self):
-        """Create an empty circuit."""
+    # Name of the graph storage engine used when none is given
+    default_storage = 'networkx'
+
+    def __init__(self, storage=None):
+        """Create an empty circuit.
+
+        Args:
+            storage (str): name of the graph storage engine, one of
+                'networkx' or 'wiregraph'. Defaults to DAGCircuit.default_storage.
+
+        Raises:
+            DAGCircuitError: if the storage engine is unknown
+        """
+        storage = storage or self.default_storage
+        if storage not in GRAPH_STORAGES:
+            raise DAGCircuitError("unknown DAGCircuit storage %s, expected one of %s"
+                                  % (storage, ', '.join(sorted(GRAPH_STORAGES))))
+        self.storage = storage
 
         # Circuit name.  Generally, this corresponds to the name
         # of the QuantumCircuit from which the DAG was generated.
@@ -73,7 +99,7 @@ class DAGCircuit:
         # Input nodes have out-degree 1 and output nodes have in-degree 1.
         # Edges carry wire labels (reg,idx) and each operation has
         # corresponding in- and out-edges with the same wire labels.
-        self._multi_graph = nx.MultiDiGraph()
+        self._multi_graph = GRAPH_STORAGES[storage]()
 
         # Map of qreg name to QuantumRegister object
         self.qregs = OrderedDict()
@@ -84,11 +110,23 @@ class DAGCircuit:
         # TO REMOVE WHEN NODE IS HAVE BEEN REMOVED FULLY
         self._id_to_node = {}
 
+        # Cached result of topological_nodes(), or None when it has to be
+        # recomputed, and the sort key of every node in it
+        self._topological_order = None
+        self._topological_keys = {}
+
+        # Set of wires on which nodes were added or removed since it was
+        # last cleared, which the PassManager uses to track the wires
+        # changed by each pass
+        self.changed_wires = set()
+
     @property
     def multi_graph(self):
         """Deprecated. Returns internal multi_graph."""
         warnings.warn('DAGCircuit.multi_graph access has been deprecated ' +
                       'in favor of access through the DAGCircuit API.', DeprecationWarning)
+        # The graph may be modified behind our back
+        self._invalidate_topological_order()
         return self._multi_graph
 
     @multi_graph.setter
@@ -96,11 +134,12 @@ class DAGCircuit:
         """Deprecated. Sets internal multi_graph."""
         warnings.warn('DAGCircuit.multi_graph access has been deprecated ' +
                       'in favor of access through the DAGCircuit API. ', DeprecationWarning)
+        self._invalidate_topological_order()
         self._multi_graph = multi_graph
 
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
-        return copy.deepcopy(self._multi_graph)
+        return self._multi_graph.to_networkx()
 
     def get_qubits(self):
         """Deprecated. Use qubits()."""
@@ -143,6 +182,9 @@ class DAGCircuit:
             raise DAGCircuitError("duplicate register name %s" % newname)
         if regname not in self.qregs and regname not in self.cregs:
             raise DAGCircuitError("no register named %s" % regname)
+        # The sort keys of the topological order contain register names
+        self._invalidate_topological_order()
+        self.changed_wires.update(self.wires)
         if regname in self.qregs:
             reg = self.qregs[regname]
             reg.name = newname
@@ -215,7 +257,9 @@ class DAGCircuit:
             DAGCircuitError: if trying to add duplicate wire
         """
         if wire not in self.wires:
+            self._invalidate_topological_order()
             self.wires.append(wire)
+            self.changed_wires.add(wire)
             self._max_node_id += 1
             input_map_wire = self.input_map[wire] = self._max_node_id
 
@@ -237,13 +281,8 @@ class DAGCircuit:
             self._multi_graph.add_node(inp_node)
             self._multi_graph.add_node(outp_node)
 
-            self._multi_graph.add_edge(inp_node,
-                                       outp_node)
-
-            self._multi_graph.adj[inp_node][outp_node][0]["name"] \
-                = "%s[%s]" % (wire[0].name, wire[1])
-            self._multi_graph.adj[inp_node][outp_node][0]["wire"] \
-                = wire
+            self._multi_graph.add_edge(inp_node, outp_node,
+                                       name=wire_name, wire=wire)
         else:
             raise DAGCircuitError("duplicate wire %s" % (wire,))
 
@@ -316,6 +355,7 @@ class DAGCircuit:
         new_node = DAGNode(data_dict=node_properties, nid=self._max_node_id)
         self._multi_graph.add_node(new_node)
         self._id_to_node[self._max_node_id] = new_node
+        self.changed_wires.update(qargs, cargs, self._bits_in_condition(condition))
 
     def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
         """Apply an operation to the output of the circuit.
@@ -344,24 +384,36 @@ class DAGCircuit:
         self._check_bits(all_cbits, self.output_map)
 
         self._add_op_node(op, qargs, cargs, condition)
+        new_node = self._id_to_node[self._max_node_id]
 
         # Add new in-edges from predecessors of the output nodes to the
         # operation node while deleting the old in-edges of the output nodes
         # and adding new edges from the operation node to each output node
         al = [qargs, all_cbits]
+        predecessors = []
         for q in itertools.chain(*al):
             ie = list(self._multi_graph.predecessors(self.output_map[q]))
 
             if len(ie) != 1:
                 raise DAGCircuitError("output node has multiple in-edges")
 
-            self._multi_graph.add_edge(ie[0], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
+            predecessors.append(ie[0])
             self._multi_graph.remove_edge(ie[0], self.output_map[q])
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], self.output_map[q],
+            self._multi_graph.add_edge(ie[0], new_node,
+                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
+            self._multi_graph.add_edge(new_node, self.output_map[q],
                                        name="%s[%s]" % (q[0].name, q[1]), wire=q)
 
-        return self._id_to_node[self._max_node_id]
+        # The new node and the output nodes after it are sinks once the
+        # output nodes are taken out, so the cached order can be updated
+        if self._topological_order is not None:
+            outputs = [self.output_map[q] for q in itertools.chain(*al)]
+            self._topological_remove(outputs)
+            self._topological_add_sink(new_node, predecessors)
+            for output in outputs:
+                self._topological_add_sink(output, [new_node])
+
+        return new_node
 
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
@@ -384,6 +436,7 @@ class DAGCircuit:
         self._check_condition(op.name, condition)
         self._check_bits(qargs, self.input_map)
         self._check_bits(all_cbits, self.input_map)
+        self._invalidate_topological_order()
         self._add_op_node(op, qargs, cargs, condition)
         # Add new out-edges to successors of the input nodes from the
         # operation node while deleting the old out-edges of the input nodes
@@ -393,9 +446,9 @@ class DAGCircuit:
             ie = list(self._multi_graph.successors(self.input_map[q]))
             if len(ie) != 1:
                 raise DAGCircuitError("input node has multiple out-edges")
+            self._multi_graph.remove_edge(self.input_map[q], ie[0])
             self._multi_graph.add_edge(self._id_to_node[self._max_node_id], ie[0],
                                        name="%s[%s]" % (q[0].name, q[1]), wire=q)
-            self._multi_graph.remove_edge(self.input_map[q], ie[0])
             self._multi_graph.add_edge(self.input_map[q], self._id_to_node[self._max_node_id],
                                        name="%s[%s]" % (q[0].name, q[1]), wire=q)
 
@@ -651,10 +704,10 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if not a directed acyclic graph
         """
-        if not nx.is_directed_acyclic_graph(self._multi_graph):
+        if not self._multi_graph.is_acyclic():
             raise DAGCircuitError("not a DAG")
 
-        depth = nx.dag_longest_path_length(self._multi_graph) - 1
+        depth = self._multi_graph.longest_path_length() - 1
         return depth if depth != -1 else 0
 
     def width(self):
@@ -667,7 +720,7 @@ class DAGCircuit:
 
     def num_tensor_factors(self):
         """Compute how many components the circuit can decompose into."""
-        return nx.number_weakly_connected_components(self._multi_graph)
+        return self._multi_graph.number_weakly_connected_components()
 
     def qasm(self):
         """Deprecated. use qiskit.converters.dag_to_circuit() then call
@@ -717,9 +770,9 @@ class DAGCircuit:
         """
 
         pred_map = {e[2]['wire']: e[0] for e in
-                    self._multi_graph.in_edges(nbunch=node, data=True)}
+                    self._multi_graph.in_edges(node, data=True)}
         succ_map = {e[2]['wire']: e[1] for e in
-                    self._multi_graph.out_edges(nbunch=node, data=True)}
+                    self._multi_graph.out_edges(node, data=True)}
         return pred_map, succ_map
 
     def _full_pred_succ_maps(self, pred_map, succ_map, input_circuit,
@@ -753,36 +806,142 @@ class DAGCircuit:
                 # Otherwise, use the corresponding output nodes of self
                 # and compute the predecessor.
                 full_succ_map[w] = self.output_map[w]
-                full_pred_map[w] = self._multi_graph.predecessors(
-                    self.output_map[w])[0]
-                if len(list(self._multi_graph.predecessors(self.output_map[w]))) != 1:
+                o_pred = list(self._multi_graph.predecessors(self.output_map[w]))
+                if len(o_pred) != 1:
                     raise DAGCircuitError("too many predecessors for %s[%d] "
                                           "output node" % (w[0], w[1]))
+                full_pred_map[w] = o_pred[0]
 
         return full_pred_map, full_succ_map
 
     def __eq__(self, other):
-        # TODO this works but is a horrible way to do this
-        slf = copy.deepcopy(self._multi_graph)
-        oth = copy.deepcopy(other._multi_graph)
+        """Two DAGCircuits are equal if they have the same wires and the same
+        sequence of nodes (compared with DAGNode.semantic_eq) along each wire.
 
-        for node in slf.nodes:
-            slf.nodes[node]['node'] = node
-        for node in oth.nodes:
-            oth.nodes[node]['node'] = node
+        Walking the wires of both DAGs side by side pairs up their nodes, so
+        the comparison takes time linear in the number of edges.
+        """
+        if not isinstance(other, DAGCircuit):
+            return False
+        if len(self._multi_graph) != len(other._multi_graph) or \
+                set(self.input_map) != set(other.input_map):
+            return False
+
+        node_map = {}
+        for wire in self.input_map:
+            self_node = self.input_map[wire]
+            other_node = other.input_map[wire]
+            while self_node is not None and other_node is not None:
+                if self_node not in node_map:
+                    if not DAGNode.semantic_eq(self_node, other_node):
+                        return False
+                    node_map[self_node] = other_node
+                elif node_map[self_node] is not other_node:
+                    return False
+                self_node = self._multi_graph.wire_successor(self_node, wire)
+                other_node = other._multi_graph.wire_successor(other_node, wire)
+            if self_node is not other_node:
+                return False
+        return True
+
+    def fingerprint(self):
+        """Return a structural hash of the DAG.
+
+        The fingerprint is computed from the nodes along each wire, visited in
+        a canonical wire order, so it does not depend on the order in which
+        the DAG was built nor on its storage engine. DAGs that compare equal
+        have the same fingerprint, unless their instruction parameters only
+        agree within the tolerance of Instruction.__eq__.
 
-        return nx.is_isomorphic(slf, oth,
-                                node_match=lambda x, y: DAGNode.semantic_eq(x['node'], y['node']))
+        Returns:
+            str: hex digest identifying the structure of the DAG
+        """
+        node_keys = {}
+        fingerprint = hashlib.sha256()
+        for wire in sorted(self.input_map, key=_bit_key):
+            fingerprint.update(repr(_bit_key(wire)).encode())
+            node = self.input_map[wire]
+            while node is not None:
+                if node not in node_keys:
+                    node_keys[node] = repr(_node_key(node)).encode()
+                fingerprint.update(node_keys[node])
+                node = self._multi_graph.wire_successor(node, wire)
+        return fingerprint.hexdigest()
 
     def topological_nodes(self):
         """
         Yield nodes in topological order.
 
+        The order is lexicographical: of the nodes whose predecessors have
+        all been yielded, the one with the smallest (str(qargs), node id) is
+        yielded next. It is cached and kept up to date by the DAGCircuit
+        methods that modify the graph.
+
         Returns:
-            generator(DAGNode): node in topological order
+            iterator(DAGNode): node in topological order
+        """
+        if self._topological_order is None:
+            keys = self._topological_keys = {}
+
+            def key(node):
+                keys[node] = (str(node.qargs), node._node_id)
+                return keys[node]
+
+            self._topological_order = list(self._multi_graph.topological_sort(key=key))
+        return iter(list(self._topological_order))
+
+    def _invalidate_topological_order(self):
+        """Discard the cached topological order."""
+        self._topological_order = None
+        self._topological_keys = {}
+
+    def _topological_remove(self, nodes):
+        """Remove sinks from the cached topological order.
+
+        Removing a sink does not change the order of the other nodes. The
+        order is scanned from its end, where the sinks usually are.
+
+        Args:
+            nodes (list[DAGNode]): nodes without successors, ignoring each other
         """
-        return nx.lexicographical_topological_sort(self._multi_graph,
-                                                   key=lambda x: str(x.qargs))
+        order = self._topological_order
+        remaining = set(nodes)
+        position = len(order)
+        while remaining and position:
+            position -= 1
+            if order[position] in remaining:
+                remaining.remove(order[position])
+                del self._topological_keys[order.pop(position)]
+        if remaining:
+            self._invalidate_topological_order()
+
+    def _topological_add_sink(self, node, predecessors):
+        """Insert a new sink in the cached topological order.
+
+        Once all of its predecessors are yielded, a sink is yielded before
+        the first node with a larger sort key. This is where it is inserted,
+        which gives the same order as sorting the graph again.
+
+        Args:
+            node (DAGNode): node without successors
+            predecessors (list[DAGNode]): the predecessors of node
+        """
+        order = self._topological_order
+        if order is None:
+            return
+        keys = self._topological_keys
+        node_key = keys[node] = (str(node.qargs), node._node_id)
+        # The sink becomes available after its last predecessor
+        predecessors = set(predecessors)
+        position = len(order)
+        while position and order[position - 1] not in predecessors:
+            position -= 1
+        if not position:
+            self._invalidate_topological_order()
+            return
+        while position < len(order) and keys[order[position]] < node_key:
+            position += 1
+        order.insert(position, node)
 
     def topological_op_nodes(self):
         """
@@ -871,8 +1030,21 @@ class DAGCircuit:
         pred_map, succ_map = self._make_pred_succ_maps(node)
         full_pred_map, full_succ_map = self._full_pred_succ_maps(pred_map, succ_map,
                                                                  input_dag, wire_map)
-        # Now that we know the connections, delete node
+        # If the node is the last one on all of its wires, the replacement
+        # nodes are added to the cached order in the same way as appended ones
+        last_node = all(succ.type == 'out' for succ in full_succ_map.values())
+        if last_node and self._topological_order is not None:
+            self._topological_remove(list(full_succ_map.values()) + [node])
+        else:
+            self._invalidate_topological_order()
+
+        # Now that we know the connections, delete node and the residual
+        # edges into the output nodes of wires that are not wire mapped
         self._multi_graph.remove_node(node)
+        self.changed_wires.update(full_pred_map)
+        for w in full_pred_map:
+            if w not in wire_map.values():
+                self._multi_graph.remove_edge(full_pred_map[w], full_succ_map[w])
 
         # Iterate over nodes of input_circuit
         for sorted_node in input_dag.topological_op_nodes():
@@ -883,35 +1055,28 @@ class DAGCircuit:
             m_cargs = list(map(lambda x: wire_map.get(x, x),
                                sorted_node.cargs))
             self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
+            new_node = self._id_to_node[self._max_node_id]
             # Add edges from predecessor nodes to new node
             # and update predecessor nodes that change
             all_cbits = self._bits_in_condition(condition)
             all_cbits.extend(m_cargs)
             al = [m_qargs, all_cbits]
+            predecessors = []
             for q in itertools.chain(*al):
-                self._multi_graph.add_edge(full_pred_map[q],
-                                           self._id_to_node[self._max_node_id],
+                predecessors.append(full_pred_map[q])
+                self._multi_graph.add_edge(full_pred_map[q], new_node,
                                            name="%s[%s]" % (q[0].name, q[1]),
                                            wire=q)
-                full_pred_map[q] = self._id_to_node[self._max_node_id]
+                full_pred_map[q] = new_node
+            self._topological_add_sink(new_node, predecessors)
 
-        # Connect all predecessors and successors, and remove
-        # residual edges between input and output nodes
+        # Connect all predecessors and successors
         for w in full_pred_map:
             self._multi_graph.add_edge(full_pred_map[w],
                                        full_succ_map[w],
                                        name="%s[%s]" % (w[0].name, w[1]),
                                        wire=w)
-            o_pred = list(self._multi_graph.predecessors(self.output_map[w]))
-            if len(o_pred) > 1:
-                if len(o_pred) != 2:
-                    raise DAGCircuitError("expected 2 predecessors here")
-
-                p = [x for x in o_pred if x != full_pred_map[w]]
-                if len(p) != 1:
-                    raise DAGCircuitError("expected 1 predecessor to pass filter")
-
-                self._multi_graph.remove_edge(p[0], self.output_map[w])
+            self._topological_add_sink(full_succ_map[w], [full_pred_map[w]])
 
     def node(self, node_id):
         """Get the node in the dag.
@@ -922,7 +1087,7 @@ class DAGCircuit:
         Returns:
             node: the node.
         """
-        return self._multi_graph.nodes[node_id]
+        return self._id_to_node[node_id]
 
     def nodes(self):
         """Iterator for node values.
@@ -930,7 +1095,7 @@ class DAGCircuit:
         Yield:
             node: the node.
         """
-        for node in self._multi_graph.nodes:
+        for node in self._multi_graph.nodes():
             yield node
 
     def edges(self, nodes=None):
@@ -1100,9 +1265,9 @@ class DAGCircuit:
         connected by a quantum edge as DAGNodes."""
 
         predecessors = []
-        for predecessor in self.predecessors(node):
-            if isinstance(self._multi_graph.get_edge_data(predecessor, node, key=0)['wire'][0],
-                          QuantumRegister):
+        for predecessor, _, edge_data in self._multi_graph.in_edges(node, data=True):
+            if isinstance(edge_data['wire'][0], QuantumRegister) and \
+                    predecessor not in predecessors:
                 predecessors.append(predecessor)
         return predecessors
 
@@ -1114,7 +1279,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.ancestors(self._multi_graph, node)
+        return self._multi_graph.ancestors(node)
 
     def descendants(self, node):
         """Returns set of the descendants of a node as DAGNodes."""
@@ -1124,7 +1289,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.descendants(self._multi_graph, node)
+        return self._multi_graph.descendants(node)
 
     def bfs_successors(self, node):
         """
@@ -1137,7 +1302,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.bfs_successors(self._multi_graph, node)
+        return self._multi_graph.bfs_successors(node)
 
     def quantum_successors(self, node):
         """Returns list of the successors of a node that are
@@ -1149,10 +1314,9 @@ class DAGCircuit:
             node = self._id_to_node[node]
 
         successors = []
-        for successor in self.successors(node):
-            if isinstance(self._multi_graph.get_edge_data(
-                    node, successor, key=0)['wire'][0],
-                          QuantumRegister):
+        for _, successor, edge_data in self._multi_graph.out_edges(node, data=True):
+            if isinstance(edge_data['wire'][0], QuantumRegister) and \
+                    successor not in successors:
                 successors.append(successor)
         return successors
 
@@ -1173,12 +1337,22 @@ class DAGCircuit:
 
         pred_map, succ_map = self._make_pred_succ_maps(node)
 
+        # If the node is the last one on all of its wires, it is a sink once
+        # its output nodes are taken out and the cached order can be updated
+        last_node = all(succ.type == 'out' for succ in succ_map.values())
+        if last_node and self._topological_order is not None:
+            self._topological_remove(list(succ_map.values()) + [node])
+        else:
+            self._invalidate_topological_order()
+
         # remove from graph and map
         self._multi_graph.remove_node(node)
+        self.changed_wires.update(pred_map)
 
         for w in pred_map.keys():
             self._multi_graph.add_edge(pred_map[w], succ_map[w],
                                        name="%s[%s]" % (w[0].name, w[1]), wire=w)
+            self._topological_add_sink(succ_map[w], [pred_map[w]])
 
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
@@ -1188,7 +1362,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self._multi_graph.ancestors(node)
         # TODO: probably better to do all at once using
         # multi_graph.remove_nodes_from; same for related functions ...
         for anc_node in anc:
@@ -1203,7 +1377,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        desc = nx.descendants(self._multi_graph, node)
+        desc = self._multi_graph.descendants(node)
         for desc_node in desc:
             if desc_node.type == "op":
                 self.remove_op_node(desc_node)
@@ -1216,7 +1390,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self._multi_graph.ancestors(node)
         comp = list(set(self._multi_graph.nodes()) - set(anc))
         for n in comp:
             if n.type == "op":
@@ -1230,7 +1404,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        dec = nx.descendants(self._multi_graph, node)
+        dec = self._multi_graph.descendants(node)
         comp = list(set(self._multi_graph.nodes()) - set(dec))
         for n in comp:
             if n.type == "op":
@@ -1256,11 +1430,6 @@ class DAGCircuit:
         except StopIteration:
             return
 
-        def add_nodes_from(layer, nodes):
-            """ Convert DAGNodes into a format that can be added to a
-             multigraph and then add to graph"""
-            layer._multi_graph.add_nodes_from(nodes)
-
         for graph_layer in graph_layers:
 
             # Get the op nodes from the layer, removing any input and output nodes.
@@ -1270,18 +1439,18 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
+            # Construct a shallow copy of self. The op nodes are shared with
+            # self, so number the new input and output nodes after them.
+            new_layer = DAGCircuit(storage=self.storage)
             new_layer.name = self.name
+            new_layer._max_node_id = self._max_node_id
 
             for creg in self.cregs.values():
                 new_layer.add_creg(creg)
             for qreg in self.qregs.values():
                 new_layer.add_qreg(qreg)
 
-            add_nodes_from(new_layer, self.input_map.values())
-            add_nodes_from(new_layer, self.output_map.values())
-            add_nodes_from(new_layer, op_nodes)
+            new_layer._multi_graph.add_nodes_from(op_nodes)
 
             # The quantum registers that have an operation in this layer.
             support_list = [
@@ -1290,20 +1459,22 @@ class DAGCircuit:
                 if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
             ]
 
-            # Now add the edges to the multi_graph
-            # By default we just wire inputs to the outputs.
-            wires = {self.input_map[wire]: self.output_map[wire]
-                     for wire in self.wires}
-            # Wire inputs to op nodes, and op nodes to outputs.
+            # Now add the edges to the multi_graph. The inputs are wired
+            # to the outputs by default, so rewire inputs to op nodes and
+            # op nodes to outputs.
             for op_node in op_nodes:
                 args = self._bits_in_condition(op_node.condition) \
                        + op_node.cargs + op_node.qargs
-                arg_ids = (self.input_map[(arg[0], arg[1])] for arg in args)
-                for arg_id in arg_ids:
-                    wires[arg_id], wires[op_node] = op_node, wires[arg_id]
+                for arg in args:
+                    in_node = new_layer.input_map[arg]
+                    out_node = new_layer.output_map[arg]
+                    arg_name = "%s[%s]" % (arg[0].name, arg[1])
+                    new_layer._multi_graph.remove_edge(in_node, out_node)
+                    new_layer._multi_graph.add_edge(in_node, op_node,
+                                                    name=arg_name, wire=arg)
+                    new_layer._multi_graph.add_edge(op_node, out_node,
+                                                    name=arg_name, wire=arg)
 
-            # Add wiring to/from the operations and between unused inputs & outputs.
-            new_layer._multi_graph.add_edges_from(wires.items())
             yield {"graph": new_layer, "partition": support_list}
 
     def serial_layers(self):
@@ -1313,7 +1484,7 @@ class DAGCircuit:
         same structure as in layers().
         """
         for next_node in self.topological_op_nodes():
-            new_layer = DAGCircuit()
+            new_layer = DAGCircuit(storage=self.storage)
             for qreg in self.qregs.values():
                 new_layer.add_qreg(qreg)
             for creg in self.cregs.values():
@@ -1378,24 +1549,41 @@ class DAGCircuit:
         # Iterate through the nodes of self in topological order
         # and form tuples containing sequences of gates
         # on the same qubit(s).
-        topo_ops = list(self.topological_op_nodes())
-        nodes_seen = dict(zip(topo_ops, [False] * len(topo_ops)))
-        for node in topo_ops:
+        nodes_seen = set()
+        for node in self.topological_op_nodes():
             if node.name in namelist and node.condition is None \
-                    and not nodes_seen[node]:
+                    and node not in nodes_seen:
                 group = [node]
-                nodes_seen[node] = True
-                s = list(self._multi_graph.successors(node))
-                while len(s) == 1 and \
-                        s[0].type == "op" and \
-                        s[0].name in namelist:
-                    group.append(s[0])
-                    nodes_seen[s[0]] = True
-                    s = list(self._multi_graph.successors(s[0]))
+                nodes_seen.add(node)
+                s = self._run_successor(node)
+                while s is not None and \
+                        s.type == "op" and \
+                        s.name in namelist:
+                    group.append(s)
+                    nodes_seen.add(s)
+                    s = self._run_successor(s)
                 if len(group) >= 1:
                     group_list.append(tuple(group))
         return set(group_list)
 
+    def _run_successor(self, node):
+        """Return the successor of an op node if it is the same on all of its wires.
+
+        Args:
+            node (DAGNode): an op node
+
+        Returns:
+            DAGNode: the only successor of node, or None if it has several
+        """
+        wire_successor = self._multi_graph.wire_successor
+        wires = itertools.chain(node.qargs, node.cargs,
+                                self._bits_in_condition(node.condition))
+        successor = wire_successor(node, next(wires, None))
+        for wire in wires:
+            if wire_successor(node, wire) is not successor:
+                return None
+        return successor
+
     def nodes_on_wire(self, wire, only_ops=False):
         """
         Iterator for nodes that affect a given wire
@@ -1416,19 +1604,13 @@ class DAGCircuit:
             raise DAGCircuitError('The given wire %s is not present in the circuit'
                                   % str(wire))
 
-        more_nodes = True
-        while more_nodes:
-            more_nodes = False
+        while current_node is not None:
             # allow user to just get ops on the wire - not the input/output nodes
             if current_node.type == 'op' or not only_ops:
                 yield current_node
 
-            # find the adjacent node that takes the wire being looked at as input
-            for node, edges in self._multi_graph.adj[current_node].items():
-                if any(wire == edge['wire'] for edge in edges.values()):
-                    current_node = node
-                    more_nodes = True
-                    break
+            # the graph indexes the adjacent node that takes the wire as input
+            current_node = self._multi_graph.wire_successor(current_node, wire)
 
     def count_ops(self):
         """Count the occurrences of operation names.
@@ -1453,3 +1635,52 @@ class DAGCircuit:
                    "factors": self.num_tensor_factors(),
                    "operations": self.count_ops()}
         return summary
+
+
+def _bit_key(bit):
+    """Return a process-independent key for a (Register, index) wire."""
+    register, index = bit
+    return type(register).__name__, register.name, register.size, index
+
+
+def _param_key(param):
+    """Return a process-independent key for an instruction parameter."""
+    if isinstance(param, np.ndarray):
+        return str(param.dtype), param.shape, param.tobytes().hex()
+    return type(param).__name__, repr(param)
+
+
+def _instruction_key(instruction):
+    """Return a process-independent key for an instruction.
+
+    The definition is only part of the key for plain Instruction and Gate
+    objects, e.g. those made by QuantumCircuit.to_instruction(); subclasses
+    derive their definition from their parameters.
+    """
+    key = (type(instruction).__name__, instruction.name,
+           instruction.num_qubits, instruction.num_clbits,
+           tuple(_param_key(param) for param in instruction.params))
+    # pylint: disable=unidiomatic-typecheck
+    if type(instruction) in (Instruction, Gate) and instruction.definition:
+        definition = tuple((_instruction_key(inst),
+                            tuple(_bit_key(qarg) for qarg in qargs),
+                            tuple(_bit_key(carg) for carg in cargs))
+                           for inst, qargs, cargs in instruction.definition)
+        key += (definition,)
+    return key
+
+
+def _node_key(node):
+    """Return a process-independent key for the content of a DAGNode."""
+    if node.type != 'op':
+        return node.type, _bit_key(node.wire)
+    qargs = [_bit_key(qarg) for qarg in node.qargs]
+    if node.name == 'barrier':
+        # qarg order is not significant for barriers, as in DAGNode.semantic_eq
+        qargs.sort()
+    condition = None
+    if node.condition is not None:
+        register, value = node.condition
+        condition = type(register).__name__, register.name, register.size, value
+    return (node.type, _instruction_key(node.op), tuple(qargs),
+            tuple(_bit_key(carg) for carg in node.cargs), condition)
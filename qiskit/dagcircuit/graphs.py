@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Graph storage engines for DAGCircuit.
+
+A DAGCircuit keeps its nodes and wire-labelled edges in one of the graph
+classes of this module. Both classes expose the same interface, a subset of
+networkx.MultiDiGraph extended with the handful of graph algorithms that
+DAGCircuit needs, so the DAGCircuit public API does not depend on the engine.
+
+* ``NetworkxGraph`` stores the circuit in a networkx.MultiDiGraph, plus an
+  index of the predecessor and successor of each node on each of its wires.
+* ``WireGraph`` stores, for every node, the predecessor and successor node id
+  on each of its wires. Every node of a circuit DAG has at most one incoming
+  and one outgoing edge per wire, so this is enough to represent the graph and
+  avoids the networkx dict-of-dict-of-dict adjacency and edge key bookkeeping.
+
+Both give the neighbours of a node on a given wire, through
+``wire_predecessor`` and ``wire_successor``, in constant time.
+"""
+
+import copy
+import heapq
+from collections import deque
+
+import networkx as nx
+
+from .exceptions import DAGCircuitError
+
+
+class NetworkxGraph(nx.MultiDiGraph):
+    """networkx.MultiDiGraph with the DAGCircuit graph storage interface.
+
+    The wire index is kept up to date by add_edge, remove_edge and
+    remove_node, the only methods DAGCircuit uses to modify the graph.
+    """
+
+    # pylint: disable=arguments-differ
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        # Map from node to {wire: predecessor node}
+        self._wire_pred = {}
+        # Map from node to {wire: successor node}
+        self._wire_succ = {}
+        super().__init__(incoming_graph_data, **attr)
+
+    def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
+        """Add an edge, see networkx.MultiDiGraph.add_edge."""
+        key = super().add_edge(u_for_edge, v_for_edge, key, **attr)
+        wire = attr.get('wire')
+        self._wire_succ.setdefault(u_for_edge, {})[wire] = v_for_edge
+        self._wire_pred.setdefault(v_for_edge, {})[wire] = u_for_edge
+        return key
+
+    def remove_edge(self, u, v, key=None):
+        """Remove an edge, see networkx.MultiDiGraph.remove_edge."""
+        keydict = self._adj.get(u, {}).get(v, {})
+        if key is None and keydict:
+            # The edge networkx removes when no key is given
+            key = list(keydict)[-1]
+        wire = keydict.get(key, {}).get('wire')
+        super().remove_edge(u, v, key)
+        if self._wire_succ[u].get(wire) is v:
+            del self._wire_succ[u][wire]
+        if self._wire_pred[v].get(wire) is u:
+            del self._wire_pred[v][wire]
+
+    def remove_node(self, n):
+        """Remove a node, see networkx.MultiDiGraph.remove_node."""
+        super().remove_node(n)
+        for wire, pred in self._wire_pred.pop(n, {}).items():
+            del self._wire_succ[pred][wire]
+        for wire, succ in self._wire_succ.pop(n, {}).items():
+            del self._wire_pred[succ][wire]
+
+    def wire_predecessor(self, node, wire):
+        """Return the predecessor of `node` on `wire`, or None."""
+        return self._wire_pred.get(node, {}).get(wire)
+
+    def wire_successor(self, node, wire):
+        """Return the successor of `node` on `wire`, or None."""
+        return self._wire_succ.get(node, {}).get(wire)
+
+    def to_networkx(self):
+        """Return a deep copy of the graph as a networkx.MultiDiGraph."""
+        return copy.deepcopy(self)
+
+    def topological_sort(self, key=None):
+        """Yield nodes in lexicographical topological order, using `key` to break ties."""
+        return nx.lexicographical_topological_sort(self, key=key)
+
+    def ancestors(self, node):
+        """Return the set of nodes having a path to `node`."""
+        return nx.ancestors(self, node)
+
+    def descendants(self, node):
+        """Return the set of nodes reachable from `node`."""
+        return nx.descendants(self, node)
+
+    def bfs_successors(self, node):
+        """Return an iterator of (node, [successors]) in breadth-first order from `node`."""
+        return nx.bfs_successors(self, node)
+
+    def is_acyclic(self):
+        """Return True if the graph has no directed cycle."""
+        return nx.is_directed_acyclic_graph(self)
+
+    def longest_path_length(self):
+        """Return the number of edges in the longest path of the graph."""
+        return nx.dag_longest_path_length(self)
+
+    def number_weakly_connected_components(self):
+        """Return the number of weakly connected components."""
+        return nx.number_weakly_connected_components(self)
+
+
+class WireGraph:
+    """Directed acyclic multigraph of DAGNodes with wire-indexed adjacency.
+
+    Nodes are addressed by their integer node id. For each node id the graph
+    keeps two maps, from wire to the (node id, edge data) pair on the other
+    end of the incoming and outgoing edge of that wire.
+    """
+
+    # pylint: disable=invalid-name
+
+    def __init__(self):
+        # Map from node id to DAGNode
+        self._nodes = {}
+        # Map from node id to {wire: (predecessor node id, edge data)}
+        self._pred = {}
+        # Map from node id to {wire: (successor node id, edge data)}
+        self._succ = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes.values())
+
+    def __contains__(self, node):
+        return self._nodes.get(node._node_id) is node
+
+    def order(self):
+        """Return the number of nodes."""
+        return len(self._nodes)
+
+    def nodes(self):
+        """Return an iterator over the nodes, in insertion order."""
+        return iter(self._nodes.values())
+
+    def _node_id(self, node):
+        """Return the id of `node`, checking that `node` belongs to the graph."""
+        nid = node._node_id
+        if self._nodes.get(nid) is not node:
+            raise DAGCircuitError("node %s is not in the graph" % nid)
+        return nid
+
+    def add_node(self, node):
+        """Add a node without edges. Adding a node twice has no effect."""
+        nid = node._node_id
+        current = self._nodes.get(nid)
+        if current is node:
+            return
+        if current is not None:
+            raise DAGCircuitError("duplicate node id %s" % nid)
+        self._nodes[nid] = node
+        self._pred[nid] = {}
+        self._succ[nid] = {}
+
+    def add_nodes_from(self, nodes):
+        """Add every node of the iterable `nodes`."""
+        for node in nodes:
+            self.add_node(node)
+
+    def remove_node(self, node):
+        """Remove a node and all of its incident edges."""
+        nid = self._node_id(node)
+        for wire, (pred_id, _) in self._pred.pop(nid).items():
+            del self._succ[pred_id][wire]
+        for wire, (succ_id, _) in self._succ.pop(nid).items():
+            del self._pred[succ_id][wire]
+        del self._nodes[nid]
+
+    def add_edge(self, u, v, name=None, wire=None):
+        """Add an edge from `u` to `v` carrying `wire`.
+
+        Raises:
+            DAGCircuitError: if `u` already has an outgoing edge or `v` already
+                has an incoming edge on `wire`.
+        """
+        uid = self._node_id(u)
+        vid = self._node_id(v)
+        if wire in self._succ[uid] or wire in self._pred[vid]:
+            raise DAGCircuitError("wire %s is already connected" % name)
+        data = {'name': name, 'wire': wire}
+        self._succ[uid][wire] = (vid, data)
+        self._pred[vid][wire] = (uid, data)
+
+    def remove_edge(self, u, v):
+        """Remove one edge from `u` to `v`.
+
+        Raises:
+            DAGCircuitError: if there is no edge from `u` to `v`.
+        """
+        uid = self._node_id(u)
+        vid = self._node_id(v)
+        for wire, (succ_id, _) in self._succ[uid].items():
+            if succ_id == vid:
+                del self._succ[uid][wire]
+                del self._pred[vid][wire]
+                return
+        raise DAGCircuitError("no edge between nodes %s and %s" % (uid, vid))
+
+    def predecessors(self, node):
+        """Return an iterator over the distinct predecessors of `node`."""
+        nodes = self._nodes
+        seen = set()
+        for pred_id, _ in self._pred[self._node_id(node)].values():
+            if pred_id not in seen:
+                seen.add(pred_id)
+                yield nodes[pred_id]
+
+    def successors(self, node):
+        """Return an iterator over the distinct successors of `node`."""
+        nodes = self._nodes
+        seen = set()
+        for succ_id, _ in self._succ[self._node_id(node)].values():
+            if succ_id not in seen:
+                seen.add(succ_id)
+                yield nodes[succ_id]
+
+    def wire_predecessor(self, node, wire):
+        """Return the predecessor of `node` on `wire`, or None."""
+        edge = self._pred[self._node_id(node)].get(wire)
+        return None if edge is None else self._nodes[edge[0]]
+
+    def wire_successor(self, node, wire):
+        """Return the successor of `node` on `wire`, or None."""
+        edge = self._succ[self._node_id(node)].get(wire)
+        return None if edge is None else self._nodes[edge[0]]
+
+    def in_degree(self, node):
+        """Return the number of incoming edges of `node`."""
+        return len(self._pred[self._node_id(node)])
+
+    def out_degree(self, node):
+        """Return the number of outgoing edges of `node`."""
+        return len(self._succ[self._node_id(node)])
+
+    def number_of_edges(self, u, v):
+        """Return the number of edges from `u` to `v`."""
+        vid = self._node_id(v)
+        return sum(1 for succ_id, _ in self._succ[self._node_id(u)].values()
+                   if succ_id == vid)
+
+    def in_edges(self, node, data=False):
+        """Return the list of incoming edges of `node` as (u, v[, data]) tuples."""
+        nid = self._node_id(node)
+        nodes = self._nodes
+        if data:
+            return [(nodes[pred_id], node, edge_data)
+                    for pred_id, edge_data in self._pred[nid].values()]
+        return [(nodes[pred_id], node) for pred_id, _ in self._pred[nid].values()]
+
+    def out_edges(self, node, data=False):
+        """Return the list of outgoing edges of `node` as (u, v[, data]) tuples."""
+        nid = self._node_id(node)
+        nodes = self._nodes
+        if data:
+            return [(node, nodes[succ_id], edge_data)
+                    for succ_id, edge_data in self._succ[nid].values()]
+        return [(node, nodes[succ_id]) for succ_id, _ in self._succ[nid].values()]
+
+    def edges(self, nbunch=None, data=False):
+        """Return an iterator over the outgoing edges of the nodes in `nbunch`.
+
+        Args:
+            nbunch (DAGNode or list[DAGNode] or None): a node, a list of nodes,
+                or None for every node in the graph.
+            data (bool): whether to include the edge data dicts.
+
+        Yields:
+            tuple: (u, v) or (u, v, data) edges.
+        """
+        if nbunch is None:
+            nbunch = self._nodes.values()
+        elif not isinstance(nbunch, (list, tuple, set)):
+            nbunch = [nbunch]
+        for node in nbunch:
+            yield from self.out_edges(node, data)
+
+    def to_networkx(self):
+        """Return a deep copy of the graph as a networkx.MultiDiGraph."""
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self._nodes.values())
+        graph.add_edges_from((u, v, dict(data)) for u, v, data in self.edges(data=True))
+        return copy.deepcopy(graph)
+
+    def _topological_ids(self, key=None):
+        """Yield node ids in topological order.
+
+        Ties are broken by `key` of the node and then by insertion order,
+        which reproduces networkx.lexicographical_topological_sort.
+
+        Yields:
+            int: node id.
+
+        Raises:
+            DAGCircuitError: if the graph contains a cycle.
+        """
+        nodes = self._nodes
+        pred = self._pred
+        succ = self._succ
+        order = {nid: i for i, nid in enumerate(nodes)}
+        indegree = {}
+        ready = []
+        for nid in nodes:
+            degree = len(pred[nid])
+            if degree:
+                indegree[nid] = degree
+            elif key is None:
+                ready.append((order[nid], nid))
+            else:
+                ready.append((key(nodes[nid]), order[nid], nid))
+        heapq.heapify(ready)
+        while ready:
+            nid = heapq.heappop(ready)[-1]
+            for succ_id, _ in succ[nid].values():
+                indegree[succ_id] -= 1
+                if not indegree[succ_id]:
+                    del indegree[succ_id]
+                    if key is None:
+                        heapq.heappush(ready, (order[succ_id], succ_id))
+                    else:
+                        heapq.heappush(ready, (key(nodes[succ_id]), order[succ_id], succ_id))
+            yield nid
+        if indegree:
+            raise DAGCircuitError("graph contains a cycle")
+
+    def topological_sort(self, key=None):
+        """Yield nodes in lexicographical topological order, using `key` to break ties."""
+        nodes = self._nodes
+        for nid in self._topological_ids(key):
+            yield nodes[nid]
+
+    def _reachable(self, node, adjacency):
+        """Return the set of nodes reachable from `node` through `adjacency`."""
+        nodes = self._nodes
+        nid = self._node_id(node)
+        seen = {nid}
+        stack = [nid]
+        while stack:
+            for next_id, _ in adjacency[stack.pop()].values():
+                if next_id not in seen:
+                    seen.add(next_id)
+                    stack.append(next_id)
+        seen.discard(nid)
+        return {nodes[seen_id] for seen_id in seen}
+
+    def ancestors(self, node):
+        """Return the set of nodes having a path to `node`."""
+        return self._reachable(node, self._pred)
+
+    def descendants(self, node):
+        """Return the set of nodes reachable from `node`."""
+        return self._reachable(node, self._succ)
+
+    def bfs_successors(self, node):
+        """Yield (node, [successors]) in breadth-first order from `node`."""
+        seen = {self._node_id(node)}
+        queue = deque([node])
+        while queue:
+            parent = queue.popleft()
+            children = []
+            for child in self.successors(parent):
+                if child._node_id not in seen:
+                    seen.add(child._node_id)
+                    children.append(child)
+            if children:
+                queue.extend(children)
+                yield parent, children
+
+    def is_acyclic(self):
+        """Return True if the graph has no directed cycle."""
+        try:
+            for _ in self._topological_ids():
+                pass
+        except DAGCircuitError:
+            return False
+        return True
+
+    def longest_path_length(self):
+        """Return the number of edges in the longest path of the graph."""
+        pred = self._pred
+        length = {}
+        for nid in self._topological_ids():
+            length[nid] = max((length[pred_id] + 1 for pred_id, _ in pred[nid].values()),
+                              default=0)
+        return max(length.values(), default=0)
+
+    def number_weakly_connected_components(self):
+        """Return the number of weakly connected components."""
+        pred = self._pred
+        succ = self._succ
+        seen = set()
+        components = 0
+        for start in self._nodes:
+            if start in seen:
+                continue
+            components += 1
+            seen.add(start)
+            stack = [start]
+            while stack:
+                nid = stack.pop()
+                for adjacency in (pred[nid], succ[nid]):
+                    for next_id, _ in adjacency.values():
+                        if next_id not in seen:
+                            seen.add(next_id)
+                            stack.append(next_id)
+        return components
+
+
+GRAPH_STORAGES = {
+    'networkx': NetworkxGraph,
+    'wiregraph': WireGraph,
+}
@@ -56,10 +56,11 @@ class BasicAerJob(BaseJob):
     else:
         _executor = futures.ProcessPoolExecutor()
 
-    def __init__(self, backend, job_id, fn, qobj):
+    def __init__(self, backend, job_id, fn, qobj, validate_qobj=True):
         super().__init__(backend, job_id)
         self._fn = fn
         self._qobj = qobj
+        self._validate_qobj = validate_qobj
         self._future = None
 
     def submit(self):
@@ -67,14 +68,16 @@ class BasicAerJob(BaseJob):
 
         Raises:
             QobjValidationError: if the JSON serialization of the Qobj passed
-            during construction does not validate against the Qobj schema.
+            during construction does not validate against the Qobj schema,
+            unless the job was created with ``validate_qobj=False``.
 
             JobError: if trying to re-submit the job.
         """
         if self._future is not None:
             raise JobError("We have already submitted the job!")
 
-        validate_qobj_against_schema(self._qobj)
+        if self._validate_qobj:
+            validate_qobj_against_schema(self._qobj)
         self._future = self._executor.submit(self._fn, self._job_id, self._qobj)
 
     @requires_submit
@@ -16,7 +16,7 @@
 
 """
 
-from string import ascii_uppercase, ascii_lowercase
+from string import ascii_letters, ascii_uppercase, ascii_lowercase
 import numpy as np
 from qiskit.exceptions import QiskitError
 
@@ -71,6 +71,256 @@ def cx_gate_matrix():
                      [0, 1, 0, 0]], dtype=complex)
 
 
+# Names of the instructions compiled into gates, and of the ones dropped
+_SINGLE_QUBIT_GATES = ('U', 'u1', 'u2', 'u3')
+_TWO_QUBIT_GATES = ('CX', 'cx')
+_IDENTITY_INSTRUCTIONS = ('id', 'u0', 'barrier')
+
+_IDENTITY = np.eye(2, dtype=complex)
+_SWAP = np.array([[1, 0, 0, 0],
+                  [0, 0, 1, 0],
+                  [0, 1, 0, 0],
+                  [0, 0, 0, 1]], dtype=complex)
+
+
+class FusedGate:
+    """A gate of a compiled instruction stream, fusing one or more gates.
+
+    Attributes:
+        matrix (ndarray): the complex unitary matrix of the gate.
+        qubits (tuple[int]): the qubits of the gate, the first one being the
+            least significant in the basis of the matrix.
+        conditional (int or QobjConditional): the conditional of the gate, or
+            None.
+    """
+
+    def __init__(self, matrix, qubits, conditional=None):
+        self.matrix = matrix
+        self.qubits = qubits
+        self.conditional = conditional
+
+    def _expanded(self, qubits):
+        """Return the matrix of this gate in the basis of qubits."""
+        if self.qubits == qubits:
+            return self.matrix
+        if len(self.qubits) == len(qubits):
+            return _SWAP.dot(self.matrix).dot(_SWAP)
+        if self.qubits[0] == qubits[0]:
+            return np.kron(_IDENTITY, self.matrix)
+        return np.kron(self.matrix, _IDENTITY)
+
+    def append(self, gate):
+        """Fuse a gate, on a subset of the qubits, applied after this gate."""
+        self.matrix = gate._expanded(self.qubits).dot(self.matrix)
+
+    def prepend(self, gate):
+        """Fuse a gate, on a subset of the qubits, applied before this gate."""
+        self.matrix = self.matrix.dot(gate._expanded(self.qubits))
+
+
+def compile_instructions(instructions):
+    """Compile the instructions of an experiment into a stream for the simulators.
+
+    The matrices of the gates are built once, and the gates are fused: runs of
+    1-qubit gates on a qubit, and the gates on a pair of qubits following a
+    2-qubit gate on that pair, are multiplied into a single matrix. Identity
+    gates and barriers are dropped. Fusion is stopped on a qubit by the
+    other instructions on it and by conditional gates.
+
+    Args:
+        instructions (list[QasmQobjInstruction]): instructions of an
+            experiment.
+
+    Returns:
+        list: ``FusedGate`` objects for the gates and the other instructions
+            as they are, in an order equivalent to ``instructions``.
+    """
+    stream = []
+    # Map from qubit to the gate on it still being fused
+    open_gates = {}
+
+    def close(qubits):
+        for qubit in qubits:
+            gate = open_gates.get(qubit)
+            if gate is not None:
+                for gate_qubit in gate.qubits:
+                    del open_gates[gate_qubit]
+                stream.append(gate)
+
+    for instruction in instructions:
+        name = instruction.name
+        if name in _SINGLE_QUBIT_GATES:
+            matrix = single_gate_matrix(name, getattr(instruction, 'params', None))
+        elif name in _TWO_QUBIT_GATES:
+            matrix = cx_gate_matrix()
+        elif name in _IDENTITY_INSTRUCTIONS:
+            continue
+        else:
+            close(getattr(instruction, 'qubits', []))
+            stream.append(instruction)
+            continue
+
+        gate = FusedGate(matrix, tuple(instruction.qubits),
+                         getattr(instruction, 'conditional', None))
+        if gate.conditional is not None:
+            close(gate.qubits)
+            stream.append(gate)
+            continue
+
+        open_on_qubits = []
+        for qubit in gate.qubits:
+            open_gate = open_gates.get(qubit)
+            if open_gate is not None and open_gate not in open_on_qubits:
+                open_on_qubits.append(open_gate)
+        if len(open_on_qubits) == 1 and set(gate.qubits) <= set(open_on_qubits[0].qubits):
+            open_on_qubits[0].append(gate)
+            continue
+        for open_gate in open_on_qubits:
+            if len(open_gate.qubits) < len(gate.qubits):
+                gate.prepend(open_gate)
+                for qubit in open_gate.qubits:
+                    del open_gates[qubit]
+            else:
+                close(open_gate.qubits)
+        for qubit in gate.qubits:
+            open_gates[qubit] = gate
+
+    close(list(open_gates))
+    return stream
+
+
+# Number of amplitudes per block of the subarrays of the statevector updated
+# at once by apply_matrix(), for the blocks and their copies to fit in cache
+_BLOCK_SIZE = 2 ** 14
+
+
+def _gate_view(statevector, qubits):
+    """Return a view of a statevector with an axis of length 2 per qubit.
+
+    Args:
+        statevector (ndarray): contiguous array of 2**N amplitudes, of any
+            shape.
+        qubits (list[int]): the qubits of the axes.
+
+    Returns:
+        tuple: the view, of shape (d_0, 2, d_1, ..., 2, d_k) for k qubits
+            without the axes d_i of length 1, and the list of the axes of the
+            qubits.
+    """
+    number_of_qubits = statevector.size.bit_length() - 1
+    shape = []
+    axes = {}
+    previous = number_of_qubits
+    for qubit in sorted(qubits, reverse=True):
+        if previous - 1 > qubit:
+            shape.append(1 << (previous - 1 - qubit))
+        axes[qubit] = len(shape)
+        shape.append(2)
+        previous = qubit
+    if previous:
+        shape.append(1 << previous)
+    return statevector.reshape(shape), [axes[qubit] for qubit in qubits]
+
+
+def apply_matrix(statevector, matrix, qubits, scratch=None):
+    """Multiply a statevector in place by the matrix of a gate.
+
+    The subarrays of the statevector with a fixed value of the gate qubits
+    are updated by blocks: the blocks of the subarrays are copied into a
+    buffer, multiplied by the matrix and copied back, so that no full size
+    array is allocated. Diagonal matrices are applied to the subarrays
+    directly.
+
+    Args:
+        statevector (ndarray): contiguous complex array of 2**N amplitudes,
+            of any shape, modified in place.
+        matrix (ndarray): the 2**k x 2**k matrix of a gate on k qubits.
+        qubits (list[int]): the qubits of the gate, the first one being the
+            least significant in the basis of the matrix.
+        scratch (ndarray): complex buffer returned by a previous call, or None.
+
+    Returns:
+        ndarray: the buffer used for the copies of the blocks, to be passed to
+            the next call to avoid allocating it again.
+    """
+    view, axes = _gate_view(statevector, qubits)
+    dimension = len(matrix)
+    # Index of the subarray of each basis state of the gate qubits
+    subarrays = []
+    for state in range(dimension):
+        index = [slice(None)] * view.ndim
+        for position, axis in enumerate(axes):
+            index[axis] = (state >> position) & 1
+        subarrays.append(tuple(index))
+
+    if not np.count_nonzero(matrix - np.diag(np.diagonal(matrix))):
+        for state, index in enumerate(subarrays):
+            if matrix[state, state] != 1:
+                view[index] *= matrix[state, state]
+        return scratch
+
+    # Split the subarrays into blocks along their outermost axis long enough
+    # to make blocks of _BLOCK_SIZE amplitudes, or else their longest axis
+    other_axes = [axis for axis in range(view.ndim) if axis not in axes]
+    if not other_axes:
+        view = view.reshape((1,) + view.shape)
+        axes = [axis + 1 for axis in axes]
+        subarrays = [(slice(None),) + index for index in subarrays]
+        other_axes = [0]
+    number_of_blocks = view.size // dimension // _BLOCK_SIZE
+    block_axis = max(other_axes, key=lambda axis: view.shape[axis])
+    for axis in other_axes:
+        if view.shape[axis] >= number_of_blocks:
+            block_axis = axis
+            break
+    length = view.shape[block_axis]
+    block_length = max(1, length * _BLOCK_SIZE * dimension // view.size)
+    block_size = view.size // dimension // length * block_length
+    if scratch is None or scratch.size < 2 * dimension * block_size:
+        scratch = np.empty(2 * dimension * block_size, dtype=complex)
+
+    for start in range(0, length, block_length):
+        block = slice(start, min(start + block_length, length))
+        blocks = []
+        for index in subarrays:
+            index = list(index)
+            index[block_axis] = block
+            blocks.append(view[tuple(index)])
+        size = blocks[0].size
+        shape = blocks[0].shape
+        amplitudes = scratch[:dimension * size].reshape((dimension,) + shape)
+        results = scratch[dimension * block_size:dimension * (block_size + size)].reshape(
+            (dimension, size))
+        for row, block_view in enumerate(blocks):
+            amplitudes[row] = block_view
+        np.matmul(matrix, amplitudes.reshape((dimension, size)), out=results)
+        for row, block_view in enumerate(blocks):
+            block_view[...] = results[row].reshape(shape)
+    return scratch
+
+
+def measure_probabilities(statevector, qubits):
+    """Return the probabilities of the outcomes of measuring qubits.
+
+    Args:
+        statevector (ndarray): contiguous complex array of 2**N amplitudes,
+            of any shape.
+        qubits (list[int]): the measured qubits, in increasing order.
+
+    Returns:
+        ndarray: the probability of each outcome, as an integer whose bit i is
+            the outcome of ``qubits[i]``.
+    """
+    view, axes = _gate_view(statevector, qubits)
+    subscripts = ascii_letters[:view.ndim]
+    indexes = '{0},{0}->{1}'.format(subscripts,
+                                    ''.join(subscripts[axis] for axis in reversed(axes)))
+    # sum of the squared real and imaginary parts, without copying the statevector
+    probabilities = (np.einsum(indexes, view.real, view.real) +
+                     np.einsum(indexes, view.imag, view.imag))
+    return np.reshape(probabilities, 2 ** len(qubits))
+
+
 def einsum_matmul_index(gate_indices, number_of_qubits):
     """Return the index string for Numpy.eignsum matrix-matrix multiplication.
 
@@ -30,23 +30,23 @@ later be queried for the Result object. The result will contain a 'memory' data
 field, which is a result of measurements for each shot.
 """
 
+import copy
 import uuid
 import time
 import logging
 
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit.util import local_hardware_info
+from qiskit.tools.parallel import parallel_map
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.result import Result
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
+from .basicaertools import compile_instructions, FusedGate
+from .basicaertools import apply_matrix, measure_probabilities
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +106,8 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "max_parallel_experiments": 1
     }
 
     # Class level variable to return the final state at the end of simulation
@@ -129,10 +130,22 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
         self._qobj_config = None
+        # Buffer reused by the gate kernels
+        self._scratch = None
         # TEMP
         self._sample_measure = False
 
+    def _add_unitary(self, gate):
+        """Apply the matrix of a compiled gate.
+
+        Args:
+            gate (FusedGate): the gate to apply
+        """
+        self._scratch = apply_matrix(self._statevector, gate.matrix, gate.qubits,
+                                     self._scratch)
+
     def _add_unitary_single(self, gate, qubit):
         """Apply an arbitrary 1-qubit unitary matrix.
 
@@ -140,15 +153,9 @@ class QasmSimulatorPy(BaseBackend):
             gate (matrix_like): a single qubit gate matrix
             qubit (int): the qubit to apply gate to
         """
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index([qubit], self._number_of_qubits)
-        # Convert to complex rank-2 tensor
-        gate_tensor = np.array(gate, dtype=complex)
-        # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor,
-                                      self._statevector,
-                                      dtype=complex,
-                                      casting='no')
+        # Apply matrix multiplication in place
+        self._scratch = apply_matrix(self._statevector, np.array(gate, dtype=complex),
+                                     [qubit], self._scratch)
 
     def _add_unitary_two(self, gate, qubit0, qubit1):
         """Apply a two-qubit unitary matrix.
@@ -158,15 +165,20 @@ class QasmSimulatorPy(BaseBackend):
             qubit0 (int): gate qubit-0
             qubit1 (int): gate qubit-1
         """
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index([qubit0, qubit1], self._number_of_qubits)
-        # Convert to complex rank-4 tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), 4 * [2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor,
-                                      self._statevector,
-                                      dtype=complex,
-                                      casting='no')
+        # Apply matrix multiplication in place
+        self._scratch = apply_matrix(self._statevector, np.array(gate, dtype=complex),
+                                     [qubit0, qubit1], self._scratch)
+
+    def _get_measure_probabilities(self, qubit):
+        """Return the probabilities of the outcomes of measuring a qubit.
+
+        Args:
+            qubit (int): the qubit to measure
+
+        Return:
+            ndarray: the probabilities of the outcomes '0' and '1'.
+        """
+        return measure_probabilities(self._statevector, [qubit])
 
     def _get_measure_outcome(self, qubit):
         """Simulate the outcome of measurement of a qubit.
@@ -178,65 +190,99 @@ class QasmSimulatorPy(BaseBackend):
             tuple: pair (outcome, probability) where outcome is '0' or '1' and
             probability is the probability of the returned outcome.
         """
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
-        # Compute einsum index string for 1-qubit matrix multiplication
+        probabilities = self._get_measure_probabilities(qubit)
         random_number = self._local_random.rand()
         if random_number < probabilities[0]:
             return '0', probabilities[0]
         # Else outcome was '1'
         return '1', probabilities[1]
 
+    def _get_branch_outcomes(self, qubit, shots):
+        """Split the shots of a branch between the outcomes of measuring a qubit.
+
+        The number of shots with outcome '1' is drawn from a binomial
+        distribution, which gives the same distribution of outcomes as
+        measuring the qubit once per shot.
+
+        Args:
+            qubit (int): the qubit to measure
+            shots (int): the number of shots of the branch
+
+        Return:
+            list[tuple]: triples (outcome, probability, shots) for the outcomes
+            measured in at least one shot, the most frequent first.
+        """
+        probabilities = self._get_measure_probabilities(qubit)
+        shots_one = self._local_random.binomial(
+            shots, min(probabilities[1] / np.sum(probabilities), 1))
+        outcomes = [('0', probabilities[0], shots - shots_one),
+                    ('1', probabilities[1], shots_one)]
+        if shots_one > shots - shots_one:
+            outcomes.reverse()
+        return [outcome for outcome in outcomes if outcome[2] > 0]
+
     def _add_sample_measure(self, measure_params, num_samples):
         """Generate memory samples from current statevector.
 
+        The samples are counted with numpy, and the memory value of each
+        distinct sample is only computed once.
+
         Args:
             measure_params (list): List of (qubit, cmembit) values for
                                    measure instructions to sample.
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            tuple(dict, list): the counts of the memory values in hex format,
+                and the list of the memory values of the samples if the
+                memory was requested, else None.
         """
         # Get unique qubits that are actually measured
-        measured_qubits = list({qubit for qubit, cmembit in measure_params})
+        measured_qubits = sorted({qubit for qubit, cmembit in measure_params})
         num_measured = len(measured_qubits)
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        for qubit in reversed(measured_qubits):
-            # Remove from largest qubit to smallest so list position is correct
-            # with respect to position from end of the list
-            axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.reshape(np.sum(np.abs(self._statevector) ** 2,
-                                          axis=tuple(axis)),
-                                   2 ** num_measured)
-        # Generate samples on measured qubits
-        samples = self._local_random.choice(range(2 ** num_measured),
-                                            num_samples, p=probabilities)
-        # Convert to bit-strings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for count, (qubit, cmembit) in enumerate(sorted(measure_params)):
-                qubit_outcome = int((sample & (1 << count)) >> count)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
-        return memory
-
-    def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
+        probabilities = measure_probabilities(self._statevector, measured_qubits)
+        # Generate samples on measured qubits, as integers whose bit i is the
+        # outcome of measured_qubits[i]
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        outcomes, inverse, counts = np.unique(samples, return_inverse=True, return_counts=True)
+        # Convert the distinct outcomes to memory values
+        bit_positions = [(measured_qubits.index(qubit), cmembit)
+                         for qubit, cmembit in measure_params]
+        if self._number_of_cmembits < 63:
+            classical_memory = np.full(len(outcomes), self._classical_memory, dtype=np.int64)
+            for position, cmembit in bit_positions:
+                classical_memory &= ~(1 << cmembit)
+                classical_memory |= ((outcomes >> position) & 1) << cmembit
+            values = [hex(value) for value in classical_memory.tolist()]
+        else:
+            # memory values that do not fit in int64
+            values = []
+            for outcome in outcomes.tolist():
+                classical_memory = self._classical_memory
+                for position, cmembit in bit_positions:
+                    membit = 1 << cmembit
+                    qubit_outcome = (outcome >> position) & 1
+                    classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
+                values.append(hex(classical_memory))
+        memory = None
+        if self._memory:
+            memory = np.array(values)[inverse].tolist()
+        return dict(zip(values, counts.tolist())), memory
+
+    def _add_qasm_measure(self, qubit, cmembit, cregbit=None, outcome=None, probability=None):
         """Apply a measure instruction to a qubit.
 
         Args:
             qubit (int): qubit is the qubit measured.
             cmembit (int): is the classical memory bit to store outcome in.
             cregbit (int, optional): is the classical register bit to store outcome in.
+            outcome (str, optional): the outcome '0' or '1' of the measurement,
+                drawn at random if not given.
+            probability (float, optional): the probability of ``outcome``.
         """
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
+        if outcome is None:
+            outcome, probability = self._get_measure_outcome(qubit)
         # update classical state
         membit = 1 << cmembit
         self._classical_memory = (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
@@ -254,18 +300,22 @@ class QasmSimulatorPy(BaseBackend):
         # update classical state
         self._add_unitary_single(update_diag, qubit)
 
-    def _add_qasm_reset(self, qubit):
+    def _add_qasm_reset(self, qubit, outcome=None, probability=None):
         """Apply a reset instruction to a qubit.
 
         Args:
             qubit (int): the qubit being rest
+            outcome (str, optional): the outcome '0' or '1' of the simulated
+                measurement, drawn at random if not given.
+            probability (float, optional): the probability of ``outcome``.
 
         This is done by doing a simulating a measurement
         outcome and projecting onto the outcome state while
         renormalizing.
         """
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
+        if outcome is None:
+            outcome, probability = self._get_measure_outcome(qubit)
         # update quantum state
         if outcome == '0':
             update = [[1 / np.sqrt(probability), 0], [0, 0]]
@@ -274,6 +324,22 @@ class QasmSimulatorPy(BaseBackend):
             update = [[0, 1 / np.sqrt(probability)], [0, 0]]
             self._add_unitary_single(update, qubit)
 
+    def _add_qasm_outcome(self, operation, outcome, probability):
+        """Apply a measure or reset instruction with a given measurement outcome.
+
+        Args:
+            operation (QasmQobjInstruction): the measure or reset instruction.
+            outcome (str): the outcome '0' or '1' of measuring its qubit.
+            probability (float): the probability of ``outcome``.
+        """
+        qubit = operation.qubits[0]
+        if operation.name == 'reset':
+            self._add_qasm_reset(qubit, outcome, probability)
+        else:
+            cmembit = operation.memory[0]
+            cregbit = operation.register[0] if hasattr(operation, 'register') else None
+            self._add_qasm_measure(qubit, cmembit, cregbit, outcome, probability)
+
     def _validate_initial_statevector(self):
         """Validate an initial statevector"""
         # If initial statevector isn't set we don't need to validate
@@ -291,6 +357,7 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
         if backend_options is None:
             backend_options = {}
 
@@ -314,6 +381,15 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for the number of experiments run in parallel
+        if 'max_parallel_experiments' in backend_options:
+            self._max_parallel_experiments = backend_options['max_parallel_experiments']
+        elif hasattr(qobj_config, 'max_parallel_experiments'):
+            self._max_parallel_experiments = qobj_config.max_parallel_experiments
+        if not isinstance(self._max_parallel_experiments, int) or \
+                self._max_parallel_experiments < 0:
+            raise BasicAerError('max_parallel_experiments must be a non-negative integer: '
+                                '{}'.format(self._max_parallel_experiments))
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -337,6 +413,36 @@ class QasmSimulatorPy(BaseBackend):
         vec[abs(vec) < self._chop_threshold] = 0.0
         return vec
 
+    @staticmethod
+    def _final_measures_start(instructions):
+        """Return the position of the measurements that can be sampled at the
+        end of compiled instructions.
+
+        These are the measurements in the trailing instructions made only of
+        unconditional measurements and gates, that are not followed by a
+        gate on the measured qubit.
+
+        Args:
+            instructions (list): instructions from ``compile_instructions()``.
+
+        Returns:
+            int: the position of the first measurement to sample, or the
+                number of instructions if there is none.
+        """
+        start = len(instructions)
+        gate_qubits = set()
+        for position in reversed(range(len(instructions))):
+            operation = instructions[position]
+            if getattr(operation, 'conditional', None) is not None:
+                break
+            if isinstance(operation, FusedGate):
+                gate_qubits.update(operation.qubits)
+            elif operation.name == 'measure' and operation.qubits[0] not in gate_qubits:
+                start = position
+            else:
+                break
+        return start
+
     def _validate_measure_sampling(self, experiment):
         """Determine if measure sampling is allowed for an experiment
 
@@ -390,12 +496,27 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "max_parallel_experiments": int
+                * "validate_qobj": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "max_parallel_experiments" option specifies the number of
+            processes running the experiments of the qobj concurrently, or 0
+            for one process per CPU. The default value is 1, running the
+            experiments one after the other. The experiments are distributed
+            with ``parallel_map``, so they run one after the other on Windows
+            and when the job is run from a ``parallel_map`` task. The results
+            are in the order of the experiments, and the seeds of the
+            experiments do not depend on the number of processes.
+
+            The "validate_qobj" option specifies whether the qobj is validated
+            against the Qobj schema when the job is submitted. The default
+            value is True.
+
             Example::
 
                 backend_options = {
@@ -405,7 +526,8 @@ class QasmSimulatorPy(BaseBackend):
         self._set_options(qobj_config=qobj.config,
                           backend_options=backend_options)
         job_id = str(uuid.uuid4())
-        job = BasicAerJob(self, job_id, self._run_job, qobj)
+        validate_qobj = (backend_options or {}).get('validate_qobj', True)
+        job = BasicAerJob(self, job_id, self._run_job, qobj, validate_qobj=validate_qobj)
         job.submit()
         return job
 
@@ -425,8 +547,21 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = getattr(qobj.config, 'memory', False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        max_workers = self._max_parallel_experiments or local_hardware_info()['cpus']
+        if max_workers == 1 or len(qobj.experiments) <= 1:
+            for experiment in qobj.experiments:
+                result_list.append(self.run_experiment(experiment))
+        else:
+            # The seeds are drawn in the order of the experiments, as when
+            # running them one after the other
+            seeds = [self._get_seed_simulator(experiment) for experiment in qobj.experiments]
+            # The workers get the options of the job with the simulator, but
+            # not its provider
+            simulator = copy.copy(self)
+            simulator._provider = None
+            result_list = parallel_map(_run_experiment_with_seed,
+                                       list(zip(qobj.experiments, seeds)),
+                                       task_args=(simulator,), num_processes=max_workers)
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -440,11 +575,33 @@ class QasmSimulatorPy(BaseBackend):
 
         return Result.from_dict(result)
 
-    def run_experiment(self, experiment):
+    def _get_seed_simulator(self, experiment):
+        """Return the seed of an experiment.
+
+        The seed is looked up in the experiment config, then in the qobj
+        config, and drawn at random if not set.
+
+        Args:
+            experiment (QobjExperiment): experiment from qobj experiments list
+
+        Returns:
+            int: the seed of the random numbers of the experiment.
+        """
+        if hasattr(experiment.config, 'seed_simulator'):
+            return experiment.config.seed_simulator
+        if hasattr(self._qobj_config, 'seed_simulator'):
+            return self._qobj_config.seed_simulator
+        # For compatibility on Windows force dyte to be int32
+        # and set the maximum value to be (2 ** 31) - 1
+        return np.random.randint(2147483647, dtype='int32')
+
+    def run_experiment(self, experiment, seed_simulator=None):
         """Run an experiment (circuit) and return a single experiment result.
 
         Args:
             experiment (QobjExperiment): experiment from qobj experiments list
+            seed_simulator (int): the seed of the experiment, instead of the
+                seed from the experiment and qobj configs.
 
         Returns:
              dict: A result dictionary which looks something like::
@@ -468,6 +625,7 @@ class QasmSimulatorPy(BaseBackend):
         start = time.time()
         self._number_of_qubits = experiment.config.n_qubits
         self._number_of_cmembits = experiment.config.memory_slots
+        self._scratch = None
         self._statevector = 0
         self._classical_memory = 0
         self._classical_register = 0
@@ -475,36 +633,43 @@ class QasmSimulatorPy(BaseBackend):
         # Validate the dimension of initial statevector if set
         self._validate_initial_statevector()
         # Get the seed looking in circuit, qobj, and then random.
-        if hasattr(experiment.config, 'seed_simulator'):
-            seed_simulator = experiment.config.seed_simulator
-        elif hasattr(self._qobj_config, 'seed_simulator'):
-            seed_simulator = self._qobj_config.seed_simulator
-        else:
-            # For compatibility on Windows force dyte to be int32
-            # and set the maximum value to be (2 ** 31) - 1
-            seed_simulator = np.random.randint(2147483647, dtype='int32')
+        if seed_simulator is None:
+            seed_simulator = self._get_seed_simulator(experiment)
 
         self._local_random.seed(seed=seed_simulator)
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
-        # List of final counts for all shots
+        # Final counts and memory list for all shots
         memory = []
-        # Check if we can sample measurements, if so we only perform 1 shot
-        # and sample all outcomes from the final state vector
+        counts = {}
+        # Build the gate matrices once for all the shots
+        instructions = compile_instructions(experiment.instructions)
+        # Check if we can sample measurements, if so the measurements from
+        # sample_start are sampled from the final statevector of a branch
         if self._sample_measure:
-            shots = 1
-            # Store (qubit, cmembit) pairs for all measure ops in circuit to
-            # be sampled
-            measure_sample_ops = []
+            sample_start = 0
+        elif self._shots > 1:
+            sample_start = self._final_measures_start(instructions)
         else:
-            shots = self._shots
-        for _ in range(shots):
-            self._initialize_statevector()
-            # Initialize classical memory to all 0
-            self._classical_memory = 0
-            self._classical_register = 0
-            for operation in experiment.instructions:
+            sample_start = len(instructions)
+        self._initialize_statevector()
+        # The shots are simulated together until a measure or reset that is
+        # not sampled, where they are split between branches for its
+        # outcomes. A branch is a tuple (position of its next instruction,
+        # statevector, classical memory, classical register, number of
+        # shots), and is run to the end of the circuit before the next one is
+        # started.
+        branches = [(0, self._statevector, 0, 0, self._shots)]
+        n_leaves = 0
+        while branches:
+            (first_position, self._statevector, self._classical_memory,
+             self._classical_register, shots) = branches.pop()
+            # Store (qubit, cmembit) pairs for the measure ops of the branch
+            # to be sampled
+            measure_sample_ops = []
+            for position in range(first_position, len(instructions)):
+                operation = instructions[position]
                 conditional = getattr(operation, 'conditional', None)
                 if isinstance(conditional, int):
                     conditional_bit_set = (self._classical_register >> conditional) & 1
@@ -520,40 +685,31 @@ class QasmSimulatorPy(BaseBackend):
                         if value != int(operation.conditional.val, 16):
                             continue
 
-                # Check if single  gate
-                if operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary_single(gate, qubit)
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary_two(gate, qubit0, qubit1)
-                # Check if reset
-                elif operation.name == 'reset':
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
-                # Check if measure
-                elif operation.name == 'measure':
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, 'register') else None
-
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
+                # Check if compiled gate
+                if isinstance(operation, FusedGate):
+                    self._add_unitary(operation)
+                # Check if measure to sample
+                elif operation.name == 'measure' and position >= sample_start:
+                    # If sampling measurements record the qubit and cmembit
+                    # for this measurement for later sampling
+                    measure_sample_ops.append((operation.qubits[0], operation.memory[0]))
+                # Check if measure or reset
+                elif operation.name in ('measure', 'reset'):
+                    outcomes = self._get_branch_outcomes(operation.qubits[0], shots)
+                    # Start a branch from a copy of the state for the least
+                    # frequent outcome, and follow the most frequent one
+                    for outcome, probability, branch_shots in outcomes[1:]:
+                        state = (self._statevector, self._classical_memory,
+                                 self._classical_register)
+                        self._statevector = self._statevector.copy()
+                        self._add_qasm_outcome(operation, outcome, probability)
+                        branches.append((position + 1, self._statevector,
+                                         self._classical_memory, self._classical_register,
+                                         branch_shots))
+                        (self._statevector, self._classical_memory,
+                         self._classical_register) = state
+                    outcome, probability, shots = outcomes[0]
+                    self._add_qasm_outcome(operation, outcome, probability)
                 elif operation.name == 'bfunc':
                     mask = int(operation.mask, 16)
                     relation = operation.relation
@@ -593,17 +749,30 @@ class QasmSimulatorPy(BaseBackend):
                     raise BasicAerError(err_msg.format(backend, operation.name))
 
             # Add final creg data to memory list
+            n_leaves += 1
             if self._number_of_cmembits > 0:
-                if self._sample_measure:
-                    # If sampling we generate all shot samples from the final statevector
-                    memory = self._add_sample_measure(measure_sample_ops, self._shots)
+                if measure_sample_ops:
+                    # If sampling we generate the shot samples of the branch
+                    # from its final statevector
+                    branch_counts, branch_memory = self._add_sample_measure(
+                        measure_sample_ops, shots)
+                    for outcome, count in branch_counts.items():
+                        counts[outcome] = counts.get(outcome, 0) + count
+                    if self._memory:
+                        memory.extend(branch_memory)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
-
+                    # Turn classical_memory (int) into hex string for the shots of the branch
+                    outcome = hex(self._classical_memory)
+                    counts[outcome] = counts.get(outcome, 0) + shots
+                    if self._memory:
+                        memory.extend([outcome] * shots)
+
+        if self._memory and n_leaves > 1:
+            # The memory of the branches is grouped by branch, shuffle it
+            # into the order of shots simulated one at a time
+            self._local_random.shuffle(memory)
         # Add data
-        data = {'counts': dict(Counter(memory))}
+        data = {'counts': counts}
         # Optionally add memory list
         if self._memory:
             data['memory'] = memory
@@ -641,3 +810,19 @@ class QasmSimulatorPy(BaseBackend):
             elif 'measure' not in [op.name for op in experiment.instructions]:
                 logger.warning('No measurements in circuit "%s", '
                                'classical register will remain all zeros.', name)
+
+
+def _run_experiment_with_seed(experiment_seed, simulator):
+    """Run an experiment with its seed on a simulator, in a parallel_map worker.
+
+    Args:
+        experiment_seed (tuple(QobjExperiment, int)): the experiment and the
+            seed drawn for it by the parent process.
+        simulator (QasmSimulatorPy): the simulator with the options and the
+            qobj config of the job.
+
+    Returns:
+        dict: the result of the experiment, as from ``run_experiment()``.
+    """
+    experiment, seed_simulator = experiment_seed
+    return simulator.run_experiment(experiment, seed_simulator=seed_simulator)
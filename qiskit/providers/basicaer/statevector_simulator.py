@@ -111,6 +111,8 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
                 * "chop_threshold": double
+                * "max_parallel_experiments": int
+                * "validate_qobj": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
@@ -121,6 +123,14 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             setting small values to zero in the output statevector. The default
             value is 1e-15.
 
+            The "max_parallel_experiments" option specifies the number of
+            processes running the experiments of the qobj concurrently, or 0
+            for one process per CPU. The default value is 1.
+
+            The "validate_qobj" option specifies whether the qobj is validated
+            against the Qobj schema when the job is submitted. The default
+            value is True.
+
             Example::
 
                 backend_options = {
@@ -39,9 +39,8 @@ from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from qiskit.result import Result
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_matmul_index
+from .basicaertools import compile_instructions, FusedGate
+from .basicaertools import apply_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -112,41 +111,20 @@ class UnitarySimulatorPy(BaseBackend):
         self._unitary = None
         self._number_of_qubits = 0
         self._initial_unitary = None
+        # Buffer reused by the gate kernels
+        self._scratch = None
         self._chop_threshold = 1e-15
 
-    def _add_unitary_single(self, gate, qubit):
-        """Apply an arbitrary 1-qubit unitary matrix.
+    def _add_unitary(self, gate):
+        """Apply the matrix of a compiled gate.
 
         Args:
-            gate (matrix_like): a single qubit gate matrix
-            qubit (int): the qubit to apply gate to
+            gate (FusedGate): the gate to apply
         """
-        # Convert to complex rank-2 tensor
-        gate_tensor = np.array(gate, dtype=complex)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_matmul_index([qubit], self._number_of_qubits)
-        # Apply matrix multiplication
-        self._unitary = np.einsum(indexes, gate_tensor, self._unitary,
-                                  dtype=complex, casting='no')
-
-    def _add_unitary_two(self, gate, qubit0, qubit1):
-        """Apply a two-qubit unitary matrix.
-
-        Args:
-            gate (matrix_like): a the two-qubit gate matrix
-            qubit0 (int): gate qubit-0
-            qubit1 (int): gate qubit-1
-        """
-
-        # Convert to complex rank-4 tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), 4 * [2])
-
-        # Compute einsum index string for 2-qubit matrix multiplication
-        indexes = einsum_matmul_index([qubit0, qubit1], self._number_of_qubits)
-
-        # Apply matrix multiplication
-        self._unitary = np.einsum(indexes, gate_tensor, self._unitary,
-                                  dtype=complex, casting='no')
+        # The rows of the unitary are indexed by the most significant half of
+        # the bits of its flat index
+        qubits = [qubit + self._number_of_qubits for qubit in gate.qubits]
+        self._scratch = apply_matrix(self._unitary, gate.matrix, qubits, self._scratch)
 
     def _validate_initial_unitary(self):
         """Validate an initial unitary matrix"""
@@ -234,6 +212,7 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "validate_qobj": bool
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -244,6 +223,10 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "validate_qobj" option specifies whether the qobj is validated
+            against the Qobj schema when the job is submitted. The default
+            value is True.
+
             Example::
 
                 backend_options = {
@@ -257,7 +240,8 @@ class UnitarySimulatorPy(BaseBackend):
         self._set_options(qobj_config=qobj.config,
                           backend_options=backend_options)
         job_id = str(uuid.uuid4())
-        job = BasicAerJob(self, job_id, self._run_job, qobj)
+        validate_qobj = (backend_options or {}).get('validate_qobj', True)
+        job = BasicAerJob(self, job_id, self._run_job, qobj, validate_qobj=validate_qobj)
         job.submit()
         return job
 
@@ -318,29 +302,16 @@ class UnitarySimulatorPy(BaseBackend):
         """
         start = time.time()
         self._number_of_qubits = experiment.header.n_qubits
+        self._scratch = None
 
         # Validate the dimension of initial unitary if set
         self._validate_initial_unitary()
         self._initialize_unitary()
 
-        for operation in experiment.instructions:
-            # Check if single  gate
-            if operation.name in ('U', 'u1', 'u2', 'u3'):
-                params = getattr(operation, 'params', None)
-                qubit = operation.qubits[0]
-                gate = single_gate_matrix(operation.name, params)
-                self._add_unitary_single(gate, qubit)
-            elif operation.name in ('id', 'u0'):
-                pass
-            # Check if CX gate
-            elif operation.name in ('CX', 'cx'):
-                qubit0 = operation.qubits[0]
-                qubit1 = operation.qubits[1]
-                gate = cx_gate_matrix()
-                self._add_unitary_two(gate, qubit0, qubit1)
-            # Check if barrier
-            elif operation.name == 'barrier':
-                pass
+        for operation in compile_instructions(experiment.instructions):
+            # Check if compiled gate
+            if isinstance(operation, FusedGate):
+                self._add_unitary(operation)
             else:
                 backend = self.name()
                 err_msg = '{0} encountered unrecognized operation "{1}"'
@@ -28,3 +28,5 @@ from .models.qasm import (QasmQobjInstruction, QasmQobjExperimentConfig,
 from .qobj import Qobj, QasmQobj, PulseQobj
 
 from .utils import validate_qobj_against_schema
+
+from .serialization import dump_qobj, load_qobj, stream_qobj
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Streaming serialization of Qobj to and from JSON-lines files.
+
+A Qobj is written as JSON lines: the first line is the Qobj with an empty
+list of experiments, and each of the following lines is an experiment. The
+experiments are converted and written, or read and built, one at a time, so
+that Qobjs with many experiments can be archived and replayed in bounded
+memory.
+
+Complex instruction parameters, which ``to_dict()`` turns into ``[re, im]``
+pairs that cannot be told apart from lists, are written as
+``{"__complex__": [re, im]}`` and restored as ``complex`` when read.
+"""
+
+import json
+
+import numpy
+
+from qiskit.qobj.models.pulse import PulseQobjExperiment
+from qiskit.qobj.models.qasm import QasmQobjExperiment
+from qiskit.qobj.qobj import QasmQobj, PulseQobj
+from qiskit.qobj.utils import QobjType, _qobj_dict_without_experiments
+from qiskit.exceptions import QiskitError
+
+_QOBJ_CLASSES = {
+    QobjType.QASM.value: (QasmQobj, QasmQobjExperiment),
+    QobjType.PULSE.value: (PulseQobj, PulseQobjExperiment),
+}
+
+_COMPLEX_TAG = '__complex__'
+
+
+class _QobjEncoder(json.JSONEncoder):
+    """JSON encoder for the numpy and complex values left by ``to_dict()``."""
+
+    def default(self, o):  # pylint: disable=method-hidden
+        if isinstance(o, numpy.ndarray):
+            return o.tolist()
+        if isinstance(o, numpy.generic):
+            return o.item()
+        if isinstance(o, complex):
+            return {_COMPLEX_TAG: [o.real, o.imag]}
+        return super().default(o)
+
+
+def _decode_complex(obj):
+    """``object_hook`` restoring the complex values tagged by ``_QobjEncoder``."""
+    if len(obj) == 1 and _COMPLEX_TAG in obj:
+        real, imag = obj[_COMPLEX_TAG]
+        return complex(real, imag)
+    return obj
+
+
+def _tag_complex(raw, serialized):
+    """Put back the complex ``raw`` values that ``serialized`` holds as ``[re, im]``."""
+    if isinstance(raw, (complex, numpy.complexfloating)):
+        return complex(raw)
+    if isinstance(raw, (list, tuple, numpy.ndarray)) and isinstance(serialized, list):
+        return [_tag_complex(raw_item, item) for raw_item, item in zip(raw, serialized)]
+    return serialized
+
+
+def _has_complex(value):
+    if isinstance(value, list):
+        return any(_has_complex(item) for item in value)
+    return isinstance(value, complex)
+
+
+def _experiment_to_dict(experiment):
+    """Return ``experiment.to_dict()`` with the complex parameters kept as ``complex``."""
+    experiment_dict = experiment.to_dict()
+    for instruction, instruction_dict in zip(getattr(experiment, 'instructions', []),
+                                             experiment_dict.get('instructions', [])):
+        if 'params' in instruction_dict:
+            instruction_dict['params'] = _tag_complex(instruction.params,
+                                                      instruction_dict['params'])
+    return experiment_dict
+
+
+def _experiment_from_dict(experiment_class, experiment_dict):
+    """Build an experiment, setting the complex parameters the schema cannot parse."""
+    complex_params = {}
+    for index, instruction_dict in enumerate(experiment_dict.get('instructions', [])):
+        if _has_complex(instruction_dict.get('params')):
+            complex_params[index] = instruction_dict.pop('params')
+    experiment = experiment_class.from_dict(experiment_dict)
+    for index, params in complex_params.items():
+        experiment.instructions[index].params = params
+    return experiment
+
+
+def dump_qobj(qobj, file_obj, experiments=None):
+    """Write a Qobj to a text file as JSON lines, one experiment per line.
+
+    Args:
+        qobj (QasmQobj or PulseQobj): Qobj to be written.
+        file_obj (file): text file object, e.g. as returned by ``open(path, 'w')``
+            or ``gzip.open(path, 'wt')``.
+        experiments (iterable): experiments to write instead of
+            ``qobj.experiments``, e.g. a generator building them one at a
+            time. The experiments of ``qobj`` are then ignored.
+
+    Returns:
+        int: the number of experiments written.
+    """
+    encoder = _QobjEncoder(separators=(',', ':'))
+    file_obj.write(encoder.encode(_qobj_dict_without_experiments(qobj)))
+    file_obj.write('\n')
+    count = 0
+    for experiment in qobj.experiments if experiments is None else experiments:
+        file_obj.write(encoder.encode(_experiment_to_dict(experiment)))
+        file_obj.write('\n')
+        count += 1
+    return count
+
+
+def stream_qobj(file_obj):
+    """Read a Qobj written by ``dump_qobj()``, with its experiments as an iterator.
+
+    Args:
+        file_obj (file): text file object positioned at the start of the Qobj.
+
+    Returns:
+        tuple(Qobj, iterator): the Qobj with an empty list of experiments, and
+            an iterator building its experiments as they are read from
+            ``file_obj``.
+
+    Raises:
+        QiskitError: if the file does not start with a Qobj of a known type.
+    """
+    line = file_obj.readline()
+    try:
+        qobj_dict = json.loads(line, object_hook=_decode_complex)
+        qobj_class, experiment_class = _QOBJ_CLASSES[qobj_dict['type']]
+    except (ValueError, TypeError, KeyError):
+        raise QiskitError('The file does not start with a serialized Qobj.')
+    qobj_dict['experiments'] = []
+    qobj = qobj_class.from_dict(qobj_dict)
+
+    def _experiments():
+        for experiment_line in file_obj:
+            if experiment_line.strip():
+                experiment_dict = json.loads(experiment_line, object_hook=_decode_complex)
+                yield _experiment_from_dict(experiment_class, experiment_dict)
+
+    return qobj, _experiments()
+
+
+def load_qobj(file_obj):
+    """Read a Qobj written by ``dump_qobj()``.
+
+    Args:
+        file_obj (file): text file object positioned at the start of the Qobj.
+
+    Returns:
+        QasmQobj or PulseQobj: the Qobj with all its experiments.
+    """
+    qobj, experiments = stream_qobj(file_obj)
+    qobj.experiments = list(experiments)
+    return qobj
@@ -17,6 +17,10 @@
 from enum import Enum
 
 from qiskit.validation.jsonschema import validate_json_against_schema
+from qiskit.validation.jsonschema.schema_validation import _is_valid_json
+
+# Number of experiments converted to JSON and checked together
+_VALIDATION_CHUNK_SIZE = 64
 
 
 class QobjType(str, Enum):
@@ -34,10 +38,41 @@ class MeasReturnType(str, Enum):
 def validate_qobj_against_schema(qobj):
     """Validates a QObj against the .json schema.
 
+    The qobj schema constrains each experiment on its own, so the
+    experiments are converted to JSON and checked in chunks, each along with
+    the rest of the qobj, so that the whole qobj is never held as JSON. If a
+    chunk is invalid, the whole qobj is validated to report the error.
+
     Args:
         qobj (Qobj): Qobj to be validated.
     """
-    validate_json_against_schema(
-        qobj.as_dict(), 'qobj',
-        err_msg='Qobj failed validation. Set Qiskit log level to DEBUG '
-                'for further information.')
+    err_msg = 'Qobj failed validation. Set Qiskit log level to DEBUG ' \
+              'for further information.'
+    experiments = getattr(qobj, 'experiments', None)
+    if isinstance(experiments, list) and experiments:
+        shell_dict = _qobj_dict_without_experiments(qobj)
+
+        chunks = (experiments[index:index + _VALIDATION_CHUNK_SIZE]
+                  for index in range(0, len(experiments), _VALIDATION_CHUNK_SIZE))
+        if all(_is_valid_chunk(chunk, shell_dict) for chunk in chunks):
+            return
+
+    validate_json_against_schema(qobj.as_dict(), 'qobj', err_msg=err_msg)
+
+
+def _qobj_dict_without_experiments(qobj):
+    """Return qobj as a dict with an empty list of experiments.
+
+    The experiments of qobj are not converted.
+    """
+    shell = type(qobj).__new__(type(qobj))
+    shell.__dict__.update(qobj.__dict__)
+    shell.experiments = []
+    return shell.to_dict()
+
+
+def _is_valid_chunk(experiments, shell_dict):
+    """Return whether the qobj shell_dict with the given experiments is valid."""
+    chunk_dict = dict(shell_dict)
+    chunk_dict['experiments'] = [experiment.to_dict() for experiment in experiments]
+    return _is_valid_json(chunk_dict, 'qobj')
@@ -50,8 +50,12 @@ Routines for running Python functions in parallel using process pools
 from the multiprocessing library.
 """
 
+import atexit
+import functools
+import logging
 import os
 import platform
+import threading
 from multiprocessing import Pool
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
@@ -63,6 +67,85 @@ os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# Worker pool shared by the parallel_map calls, created on first use
+_POOL = None
+_POOL_SIZE = 0
+# Held while the pool is created, used or terminated, since parallel_map can
+# be called from several threads (e.g. by the jobs of the BasicAer backends)
+_POOL_LOCK = threading.RLock()
+
+# Parent process state last applied by this worker process
+_WORKER_STATE = None
+
+
+def _parent_state():
+    """Return the state of the parent pushed to the workers with the tasks:
+    the environment variables and the configuration of the qiskit loggers."""
+    loggers = tuple(
+        (name, item.level, item.disabled, item.propagate)
+        for name, item in sorted(logging.Logger.manager.loggerDict.items())
+        if isinstance(item, logging.Logger) and name.split('.')[0] == 'qiskit')
+    return tuple(sorted(os.environ.items())), loggers
+
+
+def _apply_parent_state(state):
+    """Apply in a worker the state of the parent returned by _parent_state."""
+    global _WORKER_STATE  # pylint: disable=global-statement
+    if state == _WORKER_STATE:
+        return
+    environ, loggers = state
+    os.environ.clear()
+    os.environ.update(environ)
+    for name, level, disabled, propagate in loggers:
+        worker_logger = logging.getLogger(name)
+        worker_logger.setLevel(level)
+        worker_logger.disabled = disabled
+        worker_logger.propagate = propagate
+    _WORKER_STATE = state
+
+
+def _get_pool(num_processes):
+    """Return the shared worker pool, (re)creating it with num_processes workers.
+
+    The workers are forked when the pool is created, with QISKIT_IN_PARALLEL
+    set so that they never start pools of their own.
+    """
+    global _POOL, _POOL_SIZE  # pylint: disable=global-statement
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_SIZE != num_processes:
+            shutdown_pool()
+            _POOL = Pool(processes=num_processes)
+            _POOL_SIZE = num_processes
+        return _POOL
+
+
+def shutdown_pool():
+    """Terminate the worker pool used by parallel_map, if any.
+
+    The next parallel_map call creates a new pool, forked with the current
+    state of the process: call it after defining functions in ``__main__``,
+    patching functions or classes, or changing other module state, that the
+    tasks depend on. This is registered to run at interpreter exit.
+    """
+    global _POOL, _POOL_SIZE  # pylint: disable=global-statement
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.terminate()
+            _POOL.join()
+        _POOL = None
+        _POOL_SIZE = 0
+
+
+atexit.register(shutdown_pool)
+
+
+def _indexed_task(task, task_args, task_kwargs, state, indexed_value):
+    """Run task on a value in the state of the parent, returning the result
+    along with the index of the value."""
+    _apply_parent_state(state)
+    index, value = indexed_value
+    return index, task(value, *task_args, **task_kwargs)
+
 
 def parallel_map(  # pylint: disable=dangerous-default-value
         task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT):
@@ -75,6 +158,15 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    The worker processes are kept between calls and reused as long as
+    ``num_processes`` does not change. The environment variables and the
+    levels of the qiskit loggers are sent to the reused workers with the
+    values. Other changes to the parent process, such as functions defined in
+    ``__main__``, monkeypatched functions or module attributes, are not seen
+    by reused workers: call ``shutdown_pool()`` after them so that the next
+    call forks new workers.
+    Values are sent to the workers in chunks.
+
     Args:
         task (func): Function that is to be called for each value in ``values``.
         values (array_like): List or array of values for which the ``task``
@@ -111,27 +203,29 @@ def parallel_map(  # pylint: disable=dangerous-default-value
        and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
         os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
         try:
-            pool = Pool(processes=num_processes)
-
-            async_res = [pool.apply_async(task, (value,) + task_args, task_kwargs,
-                                          _callback) for value in values]
-
-            while not all([item.ready() for item in async_res]):
-                for item in async_res:
-                    item.wait(timeout=0.1)
-
-            pool.terminate()
-            pool.join()
+            with _POOL_LOCK:
+                pool = _get_pool(num_processes)
+                # A few chunks per worker amortize the inter-process
+                # communication while keeping the load balanced
+                chunksize = max(1, len(values) // (4 * num_processes))
+                results = [None] * len(values)
+                indexed_task = functools.partial(_indexed_task, task, task_args, task_kwargs,
+                                                 _parent_state())
+                for index, result in pool.imap_unordered(indexed_task, enumerate(values),
+                                                         chunksize):
+                    results[index] = result
+                    _callback(result)
 
         except KeyboardInterrupt:
-            pool.terminate()
-            pool.join()
+            shutdown_pool()
             Publisher().publish("terra.parallel.finish")
             raise QiskitError('Keyboard interrupt in parallel_map.')
 
+        finally:
+            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+
         Publisher().publish("terra.parallel.finish")
-        os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
-        return [ar.get() for ar in async_res]
+        return results
 
     # Cannot do parallel on Windows , if another parallel_map is running in parallel,
     # or len(values) == 1.
@@ -97,5 +97,14 @@ class AnalysisPass(BasePass):  # pylint: disable=abstract-method
 
 
 class TransformationPass(BasePass):  # pylint: disable=abstract-method
-    """ A transformation pass: change DAG, not property set. """
-    pass
+    """ A transformation pass: change DAG, not property set.
+
+    A pass that only changes the DAG it is given through the DAGCircuit methods
+    (apply_operation_back, remove_op_node, substitute_node_with_dag, ...) can set
+    marks_changed_wires to True: these methods mark the wires they change in
+    DAGCircuit.changed_wires, from which the PassManager reports the changed wires
+    to the other passes in property_set['dirty_wires']. After a pass that does not
+    (for instance, one that edits node.op or its params in place), the changed wires
+    are unknown and property_set['dirty_wires'] is None.
+    """
+    marks_changed_wires = False
@@ -22,18 +22,62 @@ are grouped into a set of gates that commute.
 This pass also provides useful methods to determine if two gates
 can commute in the circuit.
 
-TODO: the current pass determines commutativity through matrix multiplication.
-A rule-based analysis would be potentially faster, but more limited.
+Commutation is first decided by rules on the standard gates, from the basis
+in which each gate is diagonal on each of its qubits. The gates the rules do
+not cover are compared by the products of their matrices, and the outcome is
+memoized by the classes and parameters of the standard gates and the relative
+placement of their qubits.
 """
 
 from collections import defaultdict
 import numpy as np
-from qiskit.transpiler.exceptions import TranspilerError
 
+from qiskit.circuit import Gate
+from qiskit.exceptions import QiskitError
+from qiskit.extensions import standard
+from qiskit.quantum_info.operators import Operator
 from qiskit.transpiler.basepasses import AnalysisPass
 
 _CUTOFF_PRECISION = 1E-10
 
+# Gate classes of qiskit.extensions.standard, the only ones whose names
+# identify their matrices
+_STANDARD_GATES = frozenset(value for value in vars(standard).values()
+                            if isinstance(value, type) and issubclass(value, Gate))
+
+# Basis in which each standard gate is diagonal on each of its qubits: 'z',
+# 'x' or 'y', or 'i' if the gate acts as the identity on the qubit. Two gates
+# commute if they are diagonal in the same basis on each of their shared
+# qubits.
+_DIAGONAL_BASES = {
+    'id': ('i',),
+    'u0': ('i',),
+    'z': ('z',),
+    's': ('z',),
+    'sdg': ('z',),
+    't': ('z',),
+    'tdg': ('z',),
+    'rz': ('z',),
+    'u1': ('z',),
+    'x': ('x',),
+    'rx': ('x',),
+    'y': ('y',),
+    'ry': ('y',),
+    'cx': ('z', 'x'),
+    'cy': ('z', 'y'),
+    'cz': ('z', 'z'),
+    'crz': ('z', 'z'),
+    'cu1': ('z', 'z'),
+    'rzz': ('z', 'z'),
+    'ccx': ('z', 'z', 'x'),
+}
+
+# Commutation of the pairs of standard gates compared by their matrices,
+# keyed by the classes and parameters of the gates and the placement of
+# their qubits
+_COMMUTATION_CACHE = {}
+_COMMUTATION_CACHE_SIZE = 2 ** 16
+
 
 class CommutationAnalysis(AnalysisPass):
     """An analysis pass to find commutation relations between DAG nodes."""
@@ -53,191 +97,120 @@ class CommutationAnalysis(AnalysisPass):
         # Build a dictionary to keep track of the gates on each qubit
         for wire in dag.wires:
             wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
-            self.property_set['commutation_set'][wire_name] = []
-
-        # Add edges to the dictionary for each qubit
-        for node in dag.topological_op_nodes():
-            for (_, _, edge_data) in dag.edges(node):
-
-                edge_name = edge_data['name']
-                self.property_set['commutation_set'][(node, edge_name)] = -1
-
-        for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire[0].name), str(wire[1]))
+            current_comm_set = self.property_set['commutation_set'][wire_name] = []
 
             for current_gate in dag.nodes_on_wire(wire):
-
-                current_comm_set = self.property_set['commutation_set'][wire_name]
-                if not current_comm_set:
+                if current_comm_set and _commute(current_gate, current_comm_set[-1][-1]):
+                    current_comm_set[-1].append(current_gate)
+                else:
                     current_comm_set.append([current_gate])
 
-                if current_gate not in current_comm_set[-1]:
-                    prev_gate = current_comm_set[-1][-1]
-                    does_commute = False
-                    try:
-                        does_commute = _commute(current_gate, prev_gate)
-                    except TranspilerError:
-                        pass
-                    if does_commute:
-                        current_comm_set[-1].append(current_gate)
-
-                    else:
-                        current_comm_set.append([current_gate])
-
                 temp_len = len(current_comm_set)
                 self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
 
 
-def _gate_master_def(name, params=None):
-    # pylint: disable=too-many-return-statements
-
-    if name == 'h':
-        return 1. / np.sqrt(2) * np.array([[1.0, 1.0],
-                                           [1.0, -1.0]], dtype=np.complex)
-    if name == 'x':
-        return np.array([[0.0, 1.0],
-                         [1.0, 0.0]], dtype=np.complex)
-    if name == 'y':
-        return np.array([[0.0, -1.0j],
-                         [1.0j, 0.0]], dtype=np.complex)
-    if name == 'cx':
-        return np.array([[1.0, 0.0, 0.0, 0.0],
-                         [0.0, 1.0, 0.0, 0.0],
-                         [0.0, 0.0, 0.0, 1.0],
-                         [0.0, 0.0, 1.0, 0.0]], dtype=np.complex)
-    if name == 'cz':
-        return np.array([[1.0, 0.0, 0.0, 0.0],
-                         [0.0, 1.0, 0.0, 0.0],
-                         [0.0, 0.0, 1.0, 0.0],
-                         [0.0, 0.0, 0.0, -1.0]], dtype=np.complex)
-    if name == 'cy':
-        return np.array([[1.0, 0.0, 0.0, 0.0],
-                         [0.0, 1.0, 0.0, 0.0],
-                         [0.0, 0.0, 0.0, 1.0j],
-                         [0.0, 0.0, -1.0j, 0.0]], dtype=np.complex)
-    if name == 'z':
-        return np.array([[1.0, 0.0],
-                         [0.0, -1.0]], dtype=np.complex)
-    if name == 't':
-        return np.array([[1.0, 0.0],
-                         [0.0, np.exp(1j * np.pi / 4.0)]], dtype=np.complex)
-    if name == 's':
-        return np.array([[1.0, 0.0],
-                         [0.0, np.exp(1j * np.pi / 2.0)]], dtype=np.complex)
-    if name == 'sdag':
-        return np.array([[1.0, 0.0],
-                         [0.0, -np.exp(1j * np.pi / 2.0)]], dtype=np.complex)
-    if name == 'tdag':
-        return np.array([[1.0, 0.0],
-                         [0.0, -np.exp(1j * np.pi / 4.0)]], dtype=np.complex)
-    if name in ('rz', 'u1'):
-        return np.array([[np.exp(-1j * float(params[0]) / 2), 0],
-                         [0, np.exp(1j * float(params[0]) / 2)]], dtype=np.complex)
-    if name == 'rx':
-        return np.array([[np.cos(float(params[0]) / 2), -1j * np.sin(float(params[0]) / 2)],
-                         [-1j * np.sin(float(params[0]) / 2), np.cos(float(params[0]) / 2)]],
-                        dtype=np.complex)
-    if name == 'ry':
-        return np.array([[np.cos(float(params[0]) / 2), - np.sin(float(params[0]) / 2)],
-                         [np.sin(float(params[0]) / 2), np.cos(float(params[0]) / 2)]],
-                        dtype=np.complex)
-    if name == 'u2':
-        return 1. / np.sqrt(2) * np.array(
-            [[1, -np.exp(1j * float(params[1]))],
-             [np.exp(1j * float(params[0])), np.exp(1j * (float(params[0]) + float(params[1])))]],
-            dtype=np.complex)
-
-    if name == 'u3':
-        return 1./np.sqrt(2) * np.array(
-            [[np.cos(float(params[0]) / 2.),
-              -np.exp(1j * float(params[2])) * np.sin(float(params[0]) / 2.)],
-             [np.exp(1j * float(params[1])) * np.sin(float(params[0]) / 2.),
-              np.cos(float(params[0]) / 2.) * np.exp(1j * (float(params[2]) + float(params[1])))]],
-            dtype=np.complex)
-
-    if name == 'P0':
-        return np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.complex)
-
-    if name == 'P1':
-        return np.array([[0.0, 0.0], [0.0, 1.0]], dtype=np.complex)
-
-    if name == 'Id':
-        return np.identity(2)
-
-    raise TranspilerError("The gate %s isn't supported" % name)
-
-
-def _calc_product(node1, node2):
-
-    wire_num = len(set(node1.qargs + node2.qargs))
-    wires = sorted(list(map(lambda x: "{0}[{1}]".format(str(x[0].name), str(x[1])),
-                            list(set(node1.qargs + node2.qargs)))))
-    final_unitary = np.identity(2 ** wire_num, dtype=np.complex)
-
-    for node in [node1, node2]:
-
-        qstate_list = [np.identity(2)] * wire_num
-
-        if node.name in ['cx', 'cy', 'cz']:
-
-            qstate_list_ext = [np.identity(2)] * wire_num
-
-            node_ctrl = "{0}[{1}]".format(str(node.qargs[0][0].name), str(node.qargs[0][1]))
-            node_tgt = "{0}[{1}]".format(str(node.qargs[1][0].name), str(node.qargs[1][1]))
-            ctrl = wires.index(node_ctrl)
-            tgt = wires.index(node_tgt)
-
-            qstate_list[ctrl] = _gate_master_def(name='P0')
-            qstate_list[tgt] = _gate_master_def(name='Id')
-            qstate_list_ext[ctrl] = _gate_master_def(name='P1')
-            if node.name == 'cx':
-                qstate_list_ext[tgt] = _gate_master_def(name='x')
-            if node.name == 'cy':
-                qstate_list_ext[tgt] = _gate_master_def(name='y')
-            if node.name == 'cz':
-                qstate_list_ext[tgt] = _gate_master_def(name='z')
-
-            rt_list = [qstate_list] + [qstate_list_ext]
-
-        else:
-
-            mat = _gate_master_def(name=node.name, params=node.op.params)
-            node_num = "{0}[{1}]".format(str(node.qargs[0][0].name),
-                                         str(node.qargs[0][1]))
-            qstate_list[wires.index(node_num)] = mat
-
-            rt_list = [qstate_list]
-
-        crt = np.zeros([2 ** wire_num, 2 ** wire_num])
-
-        for state in rt_list:
-            crt = crt + _kron_list(state)
-
-        final_unitary = np.dot(crt, final_unitary)
-    return final_unitary
-
-
-def _kron_list(args):
-    ret = args[0]
-    for item in args[1:]:
-        ret = np.kron(ret, item)
-    return ret
-
-
-def _matrix_commute(node1, node2):
-    # Good for composite gates or any future
-    # user-defined gate of equal or less than 2 qubits.
-    ret = False
-    if set(node1.qargs) & set(node2.qargs) == set():
-        ret = True
-    if _calc_product(node1, node2) is not None:
-        ret = np.allclose(_calc_product(node1, node2),
-                          _calc_product(node2, node1),
-                          atol=_CUTOFF_PRECISION)
-    return ret
-
-
 def _commute(node1, node2):
+    """Return whether the operations of two DAG nodes commute.
+
+    Operations that are not gates, such as measurements, and conditional
+    gates never commute.
+    """
     if node1.type != "op" or node2.type != "op":
         return False
-    return _matrix_commute(node1, node2)
+    for node in (node1, node2):
+        if node.condition is not None or not isinstance(node.op, Gate):
+            return False
+    qubits = list(node1.qargs)
+    qubits.extend(qubit for qubit in node2.qargs if qubit not in node1.qargs)
+    if len(qubits) == len(node1.qargs) + len(node2.qargs):
+        return True
+    if _rule_commute(node1, node2):
+        return True
+
+    placement1 = tuple(range(len(node1.qargs)))
+    placement2 = tuple(qubits.index(qubit) for qubit in node2.qargs)
+    key = None
+    # only the matrices of standard gates are identified by their class and params
+    if _is_standard(node1.op) and _is_standard(node2.op):
+        key = (node1.op.__class__, tuple(node1.op.params), placement1,
+               node2.op.__class__, tuple(node2.op.params), placement2)
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable parameters
+            key = None
+    if key is None:
+        return _matrix_commute(node1.op, placement1, node2.op, placement2, len(qubits))
+    if key not in _COMMUTATION_CACHE:
+        if len(_COMMUTATION_CACHE) >= _COMMUTATION_CACHE_SIZE:
+            _COMMUTATION_CACHE.clear()
+        _COMMUTATION_CACHE[key] = _matrix_commute(node1.op, placement1,
+                                                  node2.op, placement2, len(qubits))
+    return _COMMUTATION_CACHE[key]
+
+
+def _is_standard(gate):
+    """Return whether a gate is of a class of the standard gates."""
+    return gate.__class__ in _STANDARD_GATES
+
+
+def _rule_commute(node1, node2):
+    """Return True if the gates of two nodes are diagonal in the same basis on
+    each of their shared qubits, False if the rules do not decide."""
+    if not (_is_standard(node1.op) and _is_standard(node2.op)):
+        return False
+    bases1 = _DIAGONAL_BASES.get(node1.name)
+    bases2 = _DIAGONAL_BASES.get(node2.name)
+    if bases1 is None or bases2 is None:
+        return False
+    for qubit, basis1 in zip(node1.qargs, bases1):
+        if qubit in node2.qargs:
+            basis2 = bases2[node2.qargs.index(qubit)]
+            if basis1 != basis2 and 'i' not in (basis1, basis2):
+                return False
+    return True
+
+
+def _matrix_commute(gate1, placement1, gate2, placement2, num_qubits):
+    """Return whether two gates commute, by comparing the products of their
+    matrices on num_qubits qubits in both orders.
+
+    The gates that have neither a matrix nor a definition in terms of gates
+    with a matrix, e.g. gates with unbound parameters, are assumed not to
+    commute.
+    """
+    try:
+        matrix1 = _gate_matrix(gate1)
+        matrix2 = _gate_matrix(gate2)
+    except (QiskitError, TypeError):
+        return False
+    identity = np.reshape(np.eye(2 ** num_qubits, dtype=complex), 2 * num_qubits * [2])
+    product12 = _apply_matrix(matrix2, placement2,
+                              _apply_matrix(matrix1, placement1, identity, num_qubits),
+                              num_qubits)
+    product21 = _apply_matrix(matrix1, placement1,
+                              _apply_matrix(matrix2, placement2, identity, num_qubits),
+                              num_qubits)
+    return np.allclose(product12, product21, atol=_CUTOFF_PRECISION)
+
+
+def _gate_matrix(gate):
+    """Return the matrix of a gate, from its definition if it has no
+    to_matrix() method."""
+    try:
+        return gate.to_matrix()
+    except QiskitError:
+        return Operator(gate).data
+
+
+def _apply_matrix(matrix, placement, tensor, num_qubits):
+    """Multiply the rank 2N tensor of a matrix on N qubits by the matrix of a
+    gate on the qubits of placement, the first one being the least
+    significant in the basis of the gate matrix."""
+    num_gate_qubits = len(placement)
+    matrix = np.reshape(matrix, 2 * num_gate_qubits * [2])
+    # tensor axis of each qubit of the gate, from the most significant one
+    axes = [num_qubits - 1 - qubit for qubit in reversed(placement)]
+    product = np.tensordot(matrix, tensor, axes=(range(num_gate_qubits, 2 * num_gate_qubits),
+                                                 axes))
+    return np.moveaxis(product, range(num_gate_qubits), axes)
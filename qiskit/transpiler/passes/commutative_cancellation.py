@@ -33,6 +33,8 @@ class CommutativeCancellation(TransformationPass):
     (self-adjoint) gates through commutation relations
     """
 
+    marks_changed_wires = True
+
     def __init__(self):
         super().__init__()
         self.requires.append(CommutationAnalysis())
@@ -19,12 +19,28 @@ Replace each block of consecutive gates by a single Unitary node.
 The blocks are collected by a previous pass, such as Collect2qBlocks.
 """
 
-from qiskit.circuit import QuantumRegister, QuantumCircuit
+import numpy as np
+
+from qiskit.circuit import QuantumRegister, QuantumCircuit, Gate
 from qiskit.dagcircuit import DAGCircuit
+from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators import Operator
+from qiskit.quantum_info.synthesis import two_qubit_cnot_decompose
 from qiskit.extensions import UnitaryGate
 from qiskit.transpiler.basepasses import TransformationPass
 
+# Matrices of gates on the 2 qubits of a block, keyed by the class and
+# parameters of the gate and the positions of its qubits in the block. Only
+# the gates with a to_matrix() method are cached: the matrix of a gate
+# defined by its decomposition is not determined by its class and params.
+_GATE_MATRIX_CACHE = {}
+_GATE_MATRIX_CACHE_SIZE = 2 ** 12
+
+_SWAP = np.array([[1, 0, 0, 0],
+                  [0, 0, 1, 0],
+                  [0, 1, 0, 0],
+                  [0, 0, 0, 1]], dtype=complex)
+
 
 class ConsolidateBlocks(TransformationPass):
     """
@@ -34,16 +50,29 @@ class ConsolidateBlocks(TransformationPass):
     Important note: this pass assumes that the 'blocks_list' property that
     it reads is given such that blocks are in topological order.
     """
+
+    marks_changed_wires = True
+
+    def __init__(self, force_consolidate=True):
+        """
+        Args:
+            force_consolidate (bool): if False, a 2-qubit block is only
+                replaced when the resynthesis of its unitary needs fewer
+                2-qubit gates than the block has, and is kept as it is
+                otherwise.
+        """
+        super().__init__()
+        self.force_consolidate = force_consolidate
+        # the replacement of each block of the last run of the pass, keyed
+        # by the content of the block, so that the blocks left unchanged by
+        # the passes run since are not computed again
+        self._block_cache = {}
+        self._last_block_cache = {}
+
     def run(self, dag):
         """iterate over each block and replace it with an equivalent Unitary
         on the same wires.
         """
-        new_dag = DAGCircuit()
-        for qreg in dag.qregs.values():
-            new_dag.add_qreg(qreg)
-        for creg in dag.cregs.values():
-            new_dag.add_creg(creg)
-
         # compute ordered indices for the global circuit wires
         global_index_map = {}
         for wire in dag.wires:
@@ -53,6 +82,28 @@ class ConsolidateBlocks(TransformationPass):
             global_index_map[wire] = global_qregs.index(wire[0]) + wire[1]
 
         blocks = self.property_set['block_list']
+        self._last_block_cache, self._block_cache = self._block_cache, {}
+
+        # find the qubits involved in each block, and the unitary replacing it
+        block_replacements = []
+        for block in blocks or []:
+            block_qargs = set()
+            for nd in block:
+                block_qargs |= set(nd.qargs)
+            block_index_map = self._block_qargs_to_indices(block_qargs,
+                                                           global_index_map)
+            block_replacements.append((block_qargs, block_index_map,
+                                       self._block_unitary(block, block_index_map)))
+        # the dag is left as it is when all the blocks are kept
+        if all(unitary is None for _, _, unitary in block_replacements):
+            return dag
+
+        new_dag = DAGCircuit()
+        for qreg in dag.qregs.values():
+            new_dag.add_qreg(qreg)
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
+
         nodes_seen = set()
 
         for node in dag.topological_op_nodes():
@@ -62,23 +113,18 @@ class ConsolidateBlocks(TransformationPass):
             # check if the node belongs to the next block
             if blocks and node in blocks[0]:
                 block = blocks[0]
-                # find the qubits involved in this block
-                block_qargs = set()
-                for nd in block:
-                    block_qargs |= set(nd.qargs)
-                # convert block to a sub-circuit, then simulate unitary and add
-                block_width = len(block_qargs)
-                q = QuantumRegister(block_width)
-                subcirc = QuantumCircuit(q)
-                block_index_map = self._block_qargs_to_indices(block_qargs,
-                                                               global_index_map)
+                block_qargs, block_index_map, unitary = block_replacements[0]
                 for nd in block:
                     nodes_seen.add(nd)
-                    subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
-                unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
-                new_dag.apply_operation_back(
-                    unitary, sorted(block_qargs, key=lambda x: block_index_map[x]))
+                if unitary is None:
+                    # the block is kept, as its resynthesis would not be cheaper
+                    for nd in block:
+                        new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
+                else:
+                    new_dag.apply_operation_back(
+                        unitary, sorted(block_qargs, key=lambda x: block_index_map[x]))
                 del blocks[0]
+                del block_replacements[0]
             else:
                 # the node could belong to some future block, but in that case
                 # we simply skip it. It is guaranteed that we will revisit that
@@ -93,6 +139,64 @@ class ConsolidateBlocks(TransformationPass):
 
         return new_dag
 
+    def _block_unitary(self, block, block_index_map):
+        """
+        Compute the unitary gate replacing a block, or None if the block
+        is to be kept as it is.
+        Args:
+            block (list): the nodes of the block, in topological order
+            block_index_map (dict): mapping from qarg to position in block
+        Returns:
+            UnitaryGate: the gate replacing the block, or None
+        """
+        # the gates defined by their decomposition are not identified by
+        # their class and params, so their blocks are not cached
+        key = None
+        if all(_has_matrix_method(nd.op) for nd in block):
+            key = tuple((type(nd.op), tuple(nd.op.params),
+                         tuple(block_index_map[q] for q in nd.qargs)) for nd in block)
+            try:
+                if key in self._last_block_cache:
+                    self._block_cache[key] = self._last_block_cache[key]
+                if key in self._block_cache:
+                    return self._block_cache[key]
+            except TypeError:  # unhashable parameters
+                key = None
+
+        block_width = len(block_index_map)
+        if block_width > 2:
+            # convert block to a sub-circuit, then simulate unitary
+            q = QuantumRegister(block_width)
+            subcirc = QuantumCircuit(q)
+            for nd in block:
+                subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
+            unitary = UnitaryGate(Operator(subcirc))
+        elif block_width == 2 and not self.force_consolidate and \
+                sum(1 for nd in block if len(nd.qargs) == 2) <= 1:
+            # a block with a single 2-qubit gate can not be made cheaper
+            unitary = None
+        else:
+            matrix = np.eye(2 ** block_width, dtype=complex)
+            for nd in block:
+                positions = tuple(block_index_map[q] for q in nd.qargs)
+                matrix = np.dot(_gate_matrix(nd.op, positions, block_width), matrix)
+            if block_width == 2 and not self.force_consolidate:
+                # synthesize the unitary now, rather than when it is unrolled,
+                # to compare its cost with that of the block
+                circuit = two_qubit_cnot_decompose(matrix)
+                num_2q_gates = sum(1 for nd in block if len(nd.qargs) == 2)
+                if circuit.count_ops().get('cx', 0) < num_2q_gates:
+                    unitary = UnitaryGate(matrix)
+                    unitary.definition = circuit
+                else:
+                    unitary = None
+            else:
+                unitary = UnitaryGate(matrix)
+
+        if key is not None:
+            self._block_cache[key] = unitary
+        return unitary
+
     def _block_qargs_to_indices(self, block_qargs, global_index_map):
         """
         Map each qubit in block_qargs to its wire position among the block's wires.
@@ -108,3 +212,43 @@ class ConsolidateBlocks(TransformationPass):
         block_positions = {q: ordered_block_indices.index(global_index_map[q])
                            for q in block_qargs}
         return block_positions
+
+
+def _has_matrix_method(gate):
+    """Return whether the class of a gate defines to_matrix()."""
+    return getattr(type(gate), 'to_matrix', Gate.to_matrix) is not Gate.to_matrix
+
+
+def _gate_matrix(gate, positions, block_width):
+    """Return the matrix of a gate on the given positions of the qubits of a
+    block of at most 2 qubits, the first qubit being the least significant.
+    """
+    key = None
+    if _has_matrix_method(gate):
+        key = (type(gate), tuple(gate.params), positions, block_width)
+        try:
+            return _GATE_MATRIX_CACHE[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable parameters
+            key = None
+
+    try:
+        matrix = gate.to_matrix()
+    except QiskitError:
+        matrix = Operator(gate).data
+    if block_width == 2:
+        if len(positions) == 1:
+            identity = np.eye(2, dtype=complex)
+            if positions[0] == 0:
+                matrix = np.kron(identity, matrix)
+            else:
+                matrix = np.kron(matrix, identity)
+        elif positions == (1, 0):
+            matrix = np.dot(_SWAP, np.dot(matrix, _SWAP))
+
+    if key is not None:
+        if len(_GATE_MATRIX_CACHE) >= _GATE_MATRIX_CACHE_SIZE:
+            _GATE_MATRIX_CACHE.clear()
+        _GATE_MATRIX_CACHE[key] = matrix
+    return matrix
@@ -14,21 +14,33 @@
 
 """ Detects when the DAG reached a fixed point (it's not modified anymore)
 """
-from copy import deepcopy
-
 from qiskit.transpiler.basepasses import AnalysisPass
 
 
 class DAGFixedPoint(AnalysisPass):
     """ A dummy analysis pass that checks if the DAG a fixed point. The results is saved
         in property_set['dag_fixed_point'] as a boolean.
+
+        The DAG is compared with the one seen by the previous run through its
+        fingerprint (see DAGCircuit.fingerprint()), so no copy of it is kept. Instruction
+        parameters are therefore compared exactly. When the PassManager reports that no
+        wire changed since the previous run, the fingerprint is not computed again. It
+        only does so when every transformation pass run since then sets
+        marks_changed_wires (see TransformationPass).
     """
 
     def run(self, dag):
-        if self.property_set['_dag_fixed_point_previous_dag'] is None:
+        previous_fingerprint = self.property_set['_dag_fixed_point_previous_fingerprint']
+        if previous_fingerprint is not None and self.property_set['dirty_wires'] == set():
+            self.property_set['dag_fixed_point'] = True
+            return
+
+        fingerprint = dag.fingerprint()
+        if self.property_set['_dag_fixed_point_previous_fingerprint'] is None:
             self.property_set['dag_fixed_point'] = False
         else:
-            fixed_point_reached = self.property_set['_dag_fixed_point_previous_dag'] == dag
+            fixed_point_reached = \
+                self.property_set['_dag_fixed_point_previous_fingerprint'] == fingerprint
             self.property_set['dag_fixed_point'] = fixed_point_reached
 
-        self.property_set['_dag_fixed_point_previous_dag'] = deepcopy(dag)
+        self.property_set['_dag_fixed_point_previous_fingerprint'] = fingerprint
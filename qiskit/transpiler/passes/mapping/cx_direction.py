@@ -21,6 +21,7 @@ from math import pi
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 
+from qiskit.circuit import QuantumRegister
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.layout import Layout
 from qiskit.extensions.standard import U2Gate
@@ -38,6 +39,8 @@ class CXDirection(TransformationPass):
         ----.----      --[H]--(+)--[H]--
     """
 
+    marks_changed_wires = True
+
     def __init__(self, coupling_map, initial_layout=None):
         """
         Args:
@@ -61,43 +64,36 @@ class CXDirection(TransformationPass):
             TranspilerError: If the circuit cannot be mapped just by flipping the
                 cx nodes.
         """
-        new_dag = DAGCircuit()
-
         if self.layout is None:
             # LegacySwap renames the register in the DAG and does not match the property set
             self.layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
-        for layer in dag.serial_layers():
-            subdag = layer['graph']
-
-            for cnot_node in subdag.named_nodes('cx', 'CX'):
-                control = cnot_node.qargs[0]
-                target = cnot_node.qargs[1]
-
-                physical_q0 = self.layout[control]
-                physical_q1 = self.layout[target]
-                if self.coupling_map.distance(physical_q0, physical_q1) != 1:
-                    raise TranspilerError('The circuit requires a connection between physical '
-                                          'qubits %s and %s' % (physical_q0, physical_q1))
-
-                if (physical_q0, physical_q1) not in self.coupling_map.get_edges():
-                    # A flip needs to be done
-
-                    # Create the involved registers
-                    if control[0] not in subdag.qregs.values():
-                        subdag.add_qreg(control[0])
-                    if target[0] not in subdag.qregs.values():
-                        subdag.add_qreg(target[0])
-
-                    # Add H gates around
-                    subdag.apply_operation_back(U2Gate(0, pi), [target], [])
-                    subdag.apply_operation_back(U2Gate(0, pi), [control], [])
-                    subdag.apply_operation_front(U2Gate(0, pi), [target], [])
-                    subdag.apply_operation_front(U2Gate(0, pi), [control], [])
-
-                    # Flips the CX
-                    cnot_node.qargs[0], cnot_node.qargs[1] = target, control
-
-            new_dag.extend_back(subdag)
-
-        return new_dag
+        edges = set(self.coupling_map.get_edges())
+        for cnot_node in dag.named_nodes('cx', 'CX'):
+            control = cnot_node.qargs[0]
+            target = cnot_node.qargs[1]
+
+            physical_q0 = self.layout[control]
+            physical_q1 = self.layout[target]
+            if self.coupling_map.distance(physical_q0, physical_q1) != 1:
+                raise TranspilerError('The circuit requires a connection between physical '
+                                      'qubits %s and %s' % (physical_q0, physical_q1))
+
+            if (physical_q0, physical_q1) not in edges:
+                # A flip needs to be done, only the flipped nodes are replaced
+                dag.substitute_node_with_dag(cnot_node, self._flipped_cx(cnot_node.op))
+
+        return dag
+
+    @staticmethod
+    def _flipped_cx(op):
+        """The DAG of a cx gate flipped with H gates around, on wires (control, target)."""
+        qr = QuantumRegister(2, 'q')
+        flipped = DAGCircuit()
+        flipped.add_qreg(qr)
+        flipped.apply_operation_back(U2Gate(0, pi), [qr[0]], [])
+        flipped.apply_operation_back(U2Gate(0, pi), [qr[1]], [])
+        flipped.apply_operation_back(op, [qr[1], qr[0]], [])
+        flipped.apply_operation_back(U2Gate(0, pi), [qr[0]], [])
+        flipped.apply_operation_back(U2Gate(0, pi), [qr[1]], [])
+        return flipped
@@ -34,136 +34,40 @@ from qiskit.circuit import QuantumRegister, Parameter
 
 _CHOP_THRESHOLD = 1e-15
 
+# Tolerance on the Euler angles of the product of a run of gates, under which
+# they are rounded to the angles of a u1 or u2 gate, or to 0
+_EULER_TOLERANCE = 1e-12
+
 
 class Optimize1qGates(TransformationPass):
     """Simplify runs of single qubit gates in the ["u1", "u2", "u3", "cx", "id"] basis."""
+
+    marks_changed_wires = True
+
     def run(self, dag):
         """Return a new circuit that has been optimized."""
         runs = dag.collect_runs(["u1", "u2", "u3", "id"])
+        dirty_wires = self.property_set['dirty_wires']
+        if dirty_wires is not None:
+            # the runs on the other wires were merged by the last run of the pass
+            runs = [run for run in runs if run[0].qargs[0] in dirty_wires]
         runs = _split_runs_on_parameters(runs)
         for run in runs:
-            right_name = "u1"
-            right_parameters = (0, 0, 0)  # (theta, phi, lambda)
-
             for current_node in run:
-                left_name = current_node.name
                 if (current_node.condition is not None
                         or len(current_node.qargs) != 1
-                        or left_name not in ["u1", "u2", "u3", "id"]):
+                        or current_node.name not in ["u1", "u2", "u3", "id"]):
                     raise TranspilerError("internal error")
-                if left_name == "u1":
-                    left_parameters = (0, 0, current_node.op.params[0])
-                elif left_name == "u2":
-                    left_parameters = (np.pi / 2, current_node.op.params[0],
-                                       current_node.op.params[1])
-                elif left_name == "u3":
-                    left_parameters = tuple(current_node.op.params)
-                else:
-                    left_name = "u1"  # replace id with u1
-                    left_parameters = (0, 0, 0)
-                # If there are any sympy objects coming from the gate convert
-                # to numpy.
-                left_parameters = tuple([float(x) for x in left_parameters])
-                # Compose gates
-                name_tuple = (left_name, right_name)
-                if name_tuple == ("u1", "u1"):
-                    # u1(lambda1) * u1(lambda2) = u1(lambda1 + lambda2)
-                    right_parameters = (0, 0, right_parameters[2] +
-                                        left_parameters[2])
-                elif name_tuple == ("u1", "u2"):
-                    # u1(lambda1) * u2(phi2, lambda2) = u2(phi2 + lambda1, lambda2)
-                    right_parameters = (np.pi / 2, right_parameters[1] +
-                                        left_parameters[2], right_parameters[2])
-                elif name_tuple == ("u2", "u1"):
-                    # u2(phi1, lambda1) * u1(lambda2) = u2(phi1, lambda1 + lambda2)
-                    right_name = "u2"
-                    right_parameters = (np.pi / 2, left_parameters[1],
-                                        right_parameters[2] + left_parameters[2])
-                elif name_tuple == ("u1", "u3"):
-                    # u1(lambda1) * u3(theta2, phi2, lambda2) =
-                    #     u3(theta2, phi2 + lambda1, lambda2)
-                    right_parameters = (right_parameters[0], right_parameters[1] +
-                                        left_parameters[2], right_parameters[2])
-                elif name_tuple == ("u3", "u1"):
-                    # u3(theta1, phi1, lambda1) * u1(lambda2) =
-                    #     u3(theta1, phi1, lambda1 + lambda2)
-                    right_name = "u3"
-                    right_parameters = (left_parameters[0], left_parameters[1],
-                                        right_parameters[2] + left_parameters[2])
-                elif name_tuple == ("u2", "u2"):
-                    # Using Ry(pi/2).Rz(2*lambda).Ry(pi/2) =
-                    #    Rz(pi/2).Ry(pi-2*lambda).Rz(pi/2),
-                    # u2(phi1, lambda1) * u2(phi2, lambda2) =
-                    #    u3(pi - lambda1 - phi2, phi1 + pi/2, lambda2 + pi/2)
-                    right_name = "u3"
-                    right_parameters = (np.pi - left_parameters[2] -
-                                        right_parameters[1], left_parameters[1] +
-                                        np.pi / 2, right_parameters[2] +
-                                        np.pi / 2)
-                elif name_tuple[1] == "nop":
-                    right_name = left_name
-                    right_parameters = left_parameters
-                else:
-                    # For composing u3's or u2's with u3's, use
-                    # u2(phi, lambda) = u3(pi/2, phi, lambda)
-                    # together with the qiskit.mapper.compose_u3 method.
-                    right_name = "u3"
-                    # Evaluate the symbolic expressions for efficiency
-                    right_parameters = Optimize1qGates.compose_u3(left_parameters[0],
-                                                                  left_parameters[1],
-                                                                  left_parameters[2],
-                                                                  right_parameters[0],
-                                                                  right_parameters[1],
-                                                                  right_parameters[2])
-                    # Why evalf()? This program:
-                    #   OPENQASM 2.0;
-                    #   include "qelib1.inc";
-                    #   qreg q[2];
-                    #   creg c[2];
-                    #   u3(0.518016983430947*pi,1.37051598592907*pi,1.36816383603222*pi) q[0];
-                    #   u3(1.69867232277986*pi,0.371448347747471*pi,0.461117217930936*pi) q[0];
-                    #   u3(0.294319836336836*pi,0.450325871124225*pi,1.46804720442555*pi) q[0];
-                    #   measure q -> c;
-                    # took >630 seconds (did not complete) to optimize without
-                    # calling evalf() at all, 19 seconds to optimize calling
-                    # evalf() AFTER compose_u3, and 1 second to optimize
-                    # calling evalf() BEFORE compose_u3.
-                # 1. Here down, when we simplify, we add f(theta) to lambda to
-                # correct the global phase when f(theta) is 2*pi. This isn't
-                # necessary but the other steps preserve the global phase, so
-                # we continue in that manner.
-                # 2. The final step will remove Z rotations by 2*pi.
-                # 3. Note that is_zero is true only if the expression is exactly
-                # zero. If the input expressions have already been evaluated
-                # then these final simplifications will not occur.
-                # TODO After we refactor, we should have separate passes for
-                # exact and approximate rewriting.
-
-                # Y rotation is 0 mod 2*pi, so the gate is a u1
-                if np.mod(right_parameters[0], (2 * np.pi)) == 0 \
-                        and right_name != "u1":
-                    right_name = "u1"
-                    right_parameters = (0, 0, right_parameters[1] +
-                                        right_parameters[2] +
-                                        right_parameters[0])
-                # Y rotation is pi/2 or -pi/2 mod 2*pi, so the gate is a u2
-                if right_name == "u3":
-                    # theta = pi/2 + 2*k*pi
-                    if np.mod((right_parameters[0] - np.pi / 2), (2 * np.pi)) == 0:
-                        right_name = "u2"
-                        right_parameters = (np.pi / 2, right_parameters[1],
-                                            right_parameters[2] +
-                                            (right_parameters[0] - np.pi / 2))
-                    # theta = -pi/2 + 2*k*pi
-                    if np.mod((right_parameters[0] + np.pi / 2), (2 * np.pi)) == 0:
-                        right_name = "u2"
-                        right_parameters = (np.pi / 2, right_parameters[1] +
-                                            np.pi, right_parameters[2] -
-                                            np.pi + (right_parameters[0] +
-                                                     np.pi / 2))
-                # u1 and lambda is 0 mod 2*pi so gate is nop (up to a global phase)
-                if right_name == "u1" and np.mod(right_parameters[2], (2 * np.pi)) == 0:
-                    right_name = "nop"
+        # The runs of more than one u2 or u3 gate are merged at once through
+        # the products of their matrices, the others gate by gate
+        matrix_indexes = [index for index, run in enumerate(runs)
+                          if sum(node.name in ("u2", "u3") for node in run) > 1]
+        merged = dict(zip(matrix_indexes, _merge_runs([runs[index] for index in matrix_indexes])))
+        for index, run in enumerate(runs):
+            if index in merged:
+                right_name, right_parameters = merged[index]
+            else:
+                right_name, right_parameters = Optimize1qGates._merge_run(run)
 
             # Replace the the first node in the run with a dummy DAG which contains a dummy
             # qubit. The name is irrelevant, because substitute_node_with_dag will take care of
@@ -177,6 +81,11 @@ class Optimize1qGates(TransformationPass):
             if right_name == "u3":
                 new_op = U3Gate(*right_parameters)
 
+            # Leave the gates that are already merged
+            if len(run) == 1 and new_op.name == run[0].name and \
+                    _same_params(new_op.params, run[0].op.params):
+                continue
+
             if right_name != 'nop':
                 new_dag = DAGCircuit()
                 new_dag.add_qreg(run_qarg[0])
@@ -191,6 +100,131 @@ class Optimize1qGates(TransformationPass):
 
         return dag
 
+    @staticmethod
+    def _merge_run(run):
+        """Return the name and the (theta, phi, lambda) parameters of the gate
+        equivalent to a run of u1, u2, u3 and id gates, merging them one by
+        one, or "nop" if the run is the identity."""
+        right_name = "u1"
+        right_parameters = (0, 0, 0)  # (theta, phi, lambda)
+
+        for current_node in run:
+            left_name = current_node.name
+            if left_name == "u1":
+                left_parameters = (0, 0, current_node.op.params[0])
+            elif left_name == "u2":
+                left_parameters = (np.pi / 2, current_node.op.params[0],
+                                   current_node.op.params[1])
+            elif left_name == "u3":
+                left_parameters = tuple(current_node.op.params)
+            else:
+                left_name = "u1"  # replace id with u1
+                left_parameters = (0, 0, 0)
+            # If there are any sympy objects coming from the gate convert
+            # to numpy.
+            left_parameters = tuple([float(x) for x in left_parameters])
+            # Compose gates
+            name_tuple = (left_name, right_name)
+            if name_tuple == ("u1", "u1"):
+                # u1(lambda1) * u1(lambda2) = u1(lambda1 + lambda2)
+                right_parameters = (0, 0, right_parameters[2] +
+                                    left_parameters[2])
+            elif name_tuple == ("u1", "u2"):
+                # u1(lambda1) * u2(phi2, lambda2) = u2(phi2 + lambda1, lambda2)
+                right_parameters = (np.pi / 2, right_parameters[1] +
+                                    left_parameters[2], right_parameters[2])
+            elif name_tuple == ("u2", "u1"):
+                # u2(phi1, lambda1) * u1(lambda2) = u2(phi1, lambda1 + lambda2)
+                right_name = "u2"
+                right_parameters = (np.pi / 2, left_parameters[1],
+                                    right_parameters[2] + left_parameters[2])
+            elif name_tuple == ("u1", "u3"):
+                # u1(lambda1) * u3(theta2, phi2, lambda2) =
+                #     u3(theta2, phi2 + lambda1, lambda2)
+                right_parameters = (right_parameters[0], right_parameters[1] +
+                                    left_parameters[2], right_parameters[2])
+            elif name_tuple == ("u3", "u1"):
+                # u3(theta1, phi1, lambda1) * u1(lambda2) =
+                #     u3(theta1, phi1, lambda1 + lambda2)
+                right_name = "u3"
+                right_parameters = (left_parameters[0], left_parameters[1],
+                                    right_parameters[2] + left_parameters[2])
+            elif name_tuple == ("u2", "u2"):
+                # Using Ry(pi/2).Rz(2*lambda).Ry(pi/2) =
+                #    Rz(pi/2).Ry(pi-2*lambda).Rz(pi/2),
+                # u2(phi1, lambda1) * u2(phi2, lambda2) =
+                #    u3(pi - lambda1 - phi2, phi1 + pi/2, lambda2 + pi/2)
+                right_name = "u3"
+                right_parameters = (np.pi - left_parameters[2] -
+                                    right_parameters[1], left_parameters[1] +
+                                    np.pi / 2, right_parameters[2] +
+                                    np.pi / 2)
+            elif name_tuple[1] == "nop":
+                right_name = left_name
+                right_parameters = left_parameters
+            else:
+                # For composing u3's or u2's with u3's, use
+                # u2(phi, lambda) = u3(pi/2, phi, lambda)
+                # together with the qiskit.mapper.compose_u3 method.
+                right_name = "u3"
+                # Evaluate the symbolic expressions for efficiency
+                right_parameters = Optimize1qGates.compose_u3(left_parameters[0],
+                                                              left_parameters[1],
+                                                              left_parameters[2],
+                                                              right_parameters[0],
+                                                              right_parameters[1],
+                                                              right_parameters[2])
+                # Why evalf()? This program:
+                #   OPENQASM 2.0;
+                #   include "qelib1.inc";
+                #   qreg q[2];
+                #   creg c[2];
+                #   u3(0.518016983430947*pi,1.37051598592907*pi,1.36816383603222*pi) q[0];
+                #   u3(1.69867232277986*pi,0.371448347747471*pi,0.461117217930936*pi) q[0];
+                #   u3(0.294319836336836*pi,0.450325871124225*pi,1.46804720442555*pi) q[0];
+                #   measure q -> c;
+                # took >630 seconds (did not complete) to optimize without
+                # calling evalf() at all, 19 seconds to optimize calling
+                # evalf() AFTER compose_u3, and 1 second to optimize
+                # calling evalf() BEFORE compose_u3.
+            # 1. Here down, when we simplify, we add f(theta) to lambda to
+            # correct the global phase when f(theta) is 2*pi. This isn't
+            # necessary but the other steps preserve the global phase, so
+            # we continue in that manner.
+            # 2. The final step will remove Z rotations by 2*pi.
+            # 3. Note that is_zero is true only if the expression is exactly
+            # zero. If the input expressions have already been evaluated
+            # then these final simplifications will not occur.
+            # TODO After we refactor, we should have separate passes for
+            # exact and approximate rewriting.
+
+            # Y rotation is 0 mod 2*pi, so the gate is a u1
+            if np.mod(right_parameters[0], (2 * np.pi)) == 0 \
+                    and right_name != "u1":
+                right_name = "u1"
+                right_parameters = (0, 0, right_parameters[1] +
+                                    right_parameters[2] +
+                                    right_parameters[0])
+            # Y rotation is pi/2 or -pi/2 mod 2*pi, so the gate is a u2
+            if right_name == "u3":
+                # theta = pi/2 + 2*k*pi
+                if np.mod((right_parameters[0] - np.pi / 2), (2 * np.pi)) == 0:
+                    right_name = "u2"
+                    right_parameters = (np.pi / 2, right_parameters[1],
+                                        right_parameters[2] +
+                                        (right_parameters[0] - np.pi / 2))
+                # theta = -pi/2 + 2*k*pi
+                if np.mod((right_parameters[0] + np.pi / 2), (2 * np.pi)) == 0:
+                    right_name = "u2"
+                    right_parameters = (np.pi / 2, right_parameters[1] +
+                                        np.pi, right_parameters[2] -
+                                        np.pi + (right_parameters[0] +
+                                                 np.pi / 2))
+            # u1 and lambda is 0 mod 2*pi so gate is nop (up to a global phase)
+            if right_name == "u1" and np.mod(right_parameters[2], (2 * np.pi)) == 0:
+                right_name = "nop"
+        return right_name, right_parameters
+
     @staticmethod
     def compose_u3(theta1, phi1, lambda1, theta2, phi2, lambda2):
         """Return a triple theta, phi, lambda for the product.
@@ -236,6 +270,94 @@ class Optimize1qGates(TransformationPass):
         return out_angles
 
 
+def _merge_runs(runs):
+    """Return the name and the (theta, phi, lambda) parameters of the gate
+    equivalent to each run of u1, u2, u3 and id gates, or "nop" if the run is
+    the identity up to a global phase.
+
+    The matrices of the gates of all the runs are built and multiplied
+    together in numpy, pairing the neighbouring gates of the runs at each
+    step, and the Euler angles are extracted once from the product of each
+    run.
+    """
+    if not runs:
+        return []
+    lengths = np.array([len(run) for run in runs])
+    angles = np.zeros((lengths.sum(), 3))  # (theta, phi, lambda)
+    position = 0
+    for run in runs:
+        for node in run:
+            if node.name == "u1":
+                angles[position, 2] = float(node.op.params[0])
+            elif node.name == "u2":
+                angles[position] = (np.pi / 2, float(node.op.params[0]),
+                                    float(node.op.params[1]))
+            elif node.name == "u3":
+                angles[position] = [float(param) for param in node.op.params]
+            position += 1
+    theta, phi, lam = angles.T
+    matrices = np.empty((len(angles), 2, 2), dtype=complex)
+    matrices[:, 0, 0] = np.cos(theta / 2)
+    matrices[:, 0, 1] = -np.exp(1j * lam) * np.sin(theta / 2)
+    matrices[:, 1, 0] = np.exp(1j * phi) * np.sin(theta / 2)
+    matrices[:, 1, 1] = np.exp(1j * (phi + lam)) * np.cos(theta / 2)
+
+    # Multiply each gate at an even position in its run by the next one,
+    # until a single matrix is left per run
+    while len(matrices) > len(runs):
+        starts = np.cumsum(lengths) - lengths
+        owners = np.repeat(np.arange(len(runs)), lengths)
+        positions = np.arange(len(matrices)) - starts[owners]
+        evens = np.flatnonzero(positions % 2 == 0)
+        pairs = evens[positions[evens] + 1 < lengths[owners[evens]]]
+        products = np.matmul(matrices[pairs + 1], matrices[pairs])
+        matrices[pairs] = products
+        matrices = matrices[evens]
+        lengths = (lengths + 1) // 2
+
+    # Euler angles of u3(theta, phi, lambda) up to a global phase
+    cos_abs = np.abs(matrices[:, 0, 0])
+    sin_abs = np.abs(matrices[:, 1, 0])
+    theta = 2 * np.arctan2(sin_abs, cos_abs)
+    phase = np.where(cos_abs > _EULER_TOLERANCE, np.angle(matrices[:, 0, 0]),
+                     np.angle(matrices[:, 1, 0]))
+    phi = _wrap_angles(np.angle(matrices[:, 1, 0]) - phase)
+    lam = _wrap_angles(np.angle(-matrices[:, 0, 1]) - phase)
+    phi_plus_lam = _wrap_angles(np.angle(matrices[:, 1, 1]) - phase)
+
+    merged = []
+    for run_theta, run_phi, run_lam, run_sum in zip(theta.tolist(), phi.tolist(),
+                                                    lam.tolist(), phi_plus_lam.tolist()):
+        if abs(run_theta) < _EULER_TOLERANCE:
+            if abs(run_sum) < _EULER_TOLERANCE:
+                merged.append(("nop", (0, 0, 0)))
+            else:
+                merged.append(("u1", (0, 0, run_sum)))
+        elif abs(run_theta - np.pi / 2) < _EULER_TOLERANCE:
+            merged.append(("u2", (np.pi / 2, run_phi, run_lam)))
+        else:
+            merged.append(("u3", (run_theta, run_phi, run_lam)))
+    return merged
+
+
+def _wrap_angles(angles):
+    """Return angles in the interval (-pi, pi], rounding the angles close to
+    -pi to pi, and the angles close to 0 to 0."""
+    angles = np.pi - np.mod(np.pi - angles, 2 * np.pi)
+    angles[np.abs(angles + np.pi) < _EULER_TOLERANCE] = np.pi
+    angles[np.abs(angles) < _EULER_TOLERANCE] = 0
+    return angles
+
+
+def _same_params(params1, params2):
+    """Return whether two lists of gate parameters have the same values of
+    the same types, so that symbolic parameters are never taken for the
+    numbers they evaluate to."""
+    return len(params1) == len(params2) and \
+        all(type(param1) is type(param2) and param1 == param2
+            for param1, param2 in zip(params1, params2))
+
+
 def _split_runs_on_parameters(runs):
     """Finds runs containing parameterized gates and splits them into sequential
     runs excluding the parameterized gates.
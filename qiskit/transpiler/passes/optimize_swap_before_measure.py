@@ -27,6 +27,8 @@ from qiskit.dagcircuit import DAGCircuit
 class OptimizeSwapBeforeMeasure(TransformationPass):
     """Remove the swaps followed by measurement (and adapt the measurement)"""
 
+    marks_changed_wires = True
+
     def run(self, dag):
         """Return a new circuit that has been optimized."""
         swaps = dag.op_nodes(SwapGate)
@@ -28,6 +28,8 @@ class RemoveDiagonalGatesBeforeMeasure(TransformationPass):
     """Remove diagonal gates (like RZ, T, Z, etc) before a measurement.
     Including diagonal 2Q gates."""
 
+    marks_changed_wires = True
+
     def run(self, dag):
         """Return a new circuit that has been optimized."""
         diagonal_1q_gates = (RZGate, ZGate, TGate, SGate, TdgGate, SdgGate, U1Gate)
@@ -24,6 +24,8 @@ from qiskit.transpiler.basepasses import TransformationPass
 class RemoveResetInZeroState(TransformationPass):
     """Remove reset gate when the qubit is in zero state"""
 
+    marks_changed_wires = True
+
     def run(self, dag):
         """Return a new circuit that has been optimized."""
         resets = dag.op_nodes(Reset)
@@ -17,7 +17,13 @@
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.exceptions import QiskitError
-from qiskit.circuit import Parameter
+from qiskit.circuit import Parameter, Instruction
+
+# Unrolled decompositions of the instructions whose definition is derived
+# from their class and parameters, keyed by the class, name, parameters and
+# number of qubits and clbits of the instruction, and the target basis
+_UNROLLED_CACHE = {}
+_UNROLLED_CACHE_SIZE = 2 ** 12
 
 
 class Unroller(TransformationPass):
@@ -26,6 +32,8 @@ class Unroller(TransformationPass):
     to a desired basis, using decomposition rules defined for each instruction.
     """
 
+    marks_changed_wires = True
+
     def __init__(self, basis):
         """
         Args:
@@ -47,6 +55,7 @@ class Unroller(TransformationPass):
         Returns:
             DAGCircuit: output unrolled dag
         """
+        basis = tuple(self.basis)
         # Walk through the DAG and expand each non-basis node
         for node in dag.op_nodes():
             basic_insts = ['measure', 'reset', 'barrier', 'snapshot']
@@ -58,27 +67,82 @@ class Unroller(TransformationPass):
             if node.name in self.basis:  # If already a base, ignore.
                 continue
 
-            # TODO: allow choosing other possible decompositions
-            try:
-                rule = node.op.definition
-            except TypeError as err:
-                if any(isinstance(p, Parameter) for p in node.op.params):
-                    raise QiskitError('Unrolling gates parameterized by expressions '
-                                      'is currently unsupported.')
-                raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
-
-            if not rule:
-                raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
-                                  "No rule to expand instruction %s." %
-                                  (str(self.basis), node.op.name))
-
-            # hacky way to build a dag on the same register as the rule is defined
-            # TODO: need anonymous rules to address wires by index
-            decomposition = DAGCircuit()
-            decomposition.add_qreg(rule[0][1][0][0])
-            for inst in rule:
-                decomposition.apply_operation_back(*inst)
-
-            unrolled_dag = self.run(decomposition)  # recursively unroll ops
+            key = _unrolled_cache_key(node.op, basis)
+            unrolled_dag = _UNROLLED_CACHE.get(key) if key is not None else None
+            if unrolled_dag is None:
+                unrolled_dag = self._unroll_definition(node)
+                if key is not None:
+                    if len(_UNROLLED_CACHE) >= _UNROLLED_CACHE_SIZE:
+                        _UNROLLED_CACHE.clear()
+                    _UNROLLED_CACHE[key] = unrolled_dag
+            if key is not None and node.condition:
+                # the substitution of a conditional node modifies the dag
+                # substituted, which is shared by the cache
+                unrolled_dag = _copy_dag(unrolled_dag)
             dag.substitute_node_with_dag(node, unrolled_dag)
         return dag
+
+    def _unroll_definition(self, node):
+        """Return the decomposition of the instruction of a node, unrolled
+        recursively to the basis.
+
+        Args:
+            node (DAGNode): op node not in the basis
+
+        Raises:
+            QiskitError: if unable to unroll given the basis due to undefined
+            decomposition rules (such as a bad basis) or excessive recursion.
+
+        Returns:
+            DAGCircuit: the unrolled decomposition
+        """
+        # TODO: allow choosing other possible decompositions
+        try:
+            rule = node.op.definition
+        except TypeError as err:
+            if any(isinstance(p, Parameter) for p in node.op.params):
+                raise QiskitError('Unrolling gates parameterized by expressions '
+                                  'is currently unsupported.')
+            raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
+
+        if not rule:
+            raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
+                              "No rule to expand instruction %s." %
+                              (str(self.basis), node.op.name))
+
+        # hacky way to build a dag on the same register as the rule is defined
+        # TODO: need anonymous rules to address wires by index
+        decomposition = DAGCircuit()
+        decomposition.add_qreg(rule[0][1][0][0])
+        for inst in rule:
+            decomposition.apply_operation_back(*inst)
+
+        return self.run(decomposition)  # recursively unroll ops
+
+
+def _unrolled_cache_key(op, basis):
+    """Return the key of the unrolled decomposition of an instruction in the
+    cache, or None if its definition is not derived from its class and
+    parameters, e.g. for an instruction built from a circuit, or if its
+    parameters are not hashable."""
+    if type(op)._define is Instruction._define:
+        return None
+    key = (type(op), op.name, tuple(op.params), op.num_qubits, op.num_clbits, basis)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _copy_dag(dag):
+    """Return a copy of a dag of unconditional instructions, with copies of
+    the instructions."""
+    copied = DAGCircuit()
+    for qreg in dag.qregs.values():
+        copied.add_qreg(qreg)
+    for creg in dag.cregs.values():
+        copied.add_creg(creg)
+    for node in dag.topological_op_nodes():
+        copied.apply_operation_back(node.op.copy(), node.qargs, node.cargs)
+    return copied
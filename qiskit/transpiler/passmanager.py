@@ -56,6 +56,10 @@ class PassManager():
         # passes already run that have not been invalidated
         self.valid_passes = set()
 
+        # wires of the DAG changed since the last run of each pass already run, or no
+        # entry when unknown. Passes read theirs in property_set['dirty_wires'].
+        self.dirty_wires = {}
+
         # pass manager's overriding options for the passes it runs (for debugging)
         self.passmanager_options = {'ignore_requires': ignore_requires,
                                     'ignore_preserves': ignore_preserves,
@@ -126,6 +130,7 @@ class PassManager():
         """ "Resets the pass manager instance """
         self.valid_passes = set()
         self.property_set.clear()
+        self.dirty_wires = {}
 
     def run(self, circuit):
         """Run all the passes on a QuantumCircuit
@@ -170,17 +175,21 @@ class PassManager():
 
         # Run the pass itself, if not already run
         if pass_ not in self.valid_passes:
+            self.property_set['dirty_wires'] = self.dirty_wires.get(pass_)
             if pass_.is_transformation_pass:
                 pass_.property_set = self.fenced_property_set
+                dag.changed_wires.clear()
                 new_dag = pass_.run(dag)
                 if not isinstance(new_dag, DAGCircuit):
                     raise TranspilerError("Transformation passes should return a transformed dag."
                                           "The pass %s is returning a %s" % (type(pass_).__name__,
                                                                              type(new_dag)))
+                self._update_dirty_wires(pass_, dag, new_dag)
                 dag = new_dag
             elif pass_.is_analysis_pass:
                 pass_.property_set = self.property_set
                 pass_.run(FencedDAGCircuit(dag))
+                self.dirty_wires[pass_] = set()
             else:
                 raise TranspilerError("I dont know how to handle this type of pass")
 
@@ -189,6 +198,20 @@ class PassManager():
 
         return dag
 
+    def _update_dirty_wires(self, pass_, dag, new_dag):
+        """Add the wires changed by a transformation pass to the dirty wires of
+        every pass, including its own, as running it again may find more to do.
+        All the wires are dirty when the pass returns a new DAG, or when it does not
+        declare that DAGCircuit.changed_wires holds all its changes (see
+        TransformationPass.marks_changed_wires)."""
+        self.dirty_wires[pass_] = set()
+        if new_dag is not dag or not pass_.marks_changed_wires:
+            self.dirty_wires.clear()
+            return
+        for dirty_wires in self.dirty_wires.values():
+            dirty_wires.update(dag.changed_wires)
+        dag.changed_wires.clear()
+
     def _update_valid_passes(self, pass_, ignore_preserves):
         self.valid_passes.add(pass_)
         if not pass_.is_analysis_pass:  # Analysis passes preserve all
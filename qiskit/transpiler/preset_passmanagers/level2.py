@@ -35,6 +35,7 @@ from qiskit.transpiler.passes import LegacySwap
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 from qiskit.transpiler.passes import FixedPoint
+from qiskit.transpiler.passes import DAGFixedPoint
 from qiskit.transpiler.passes import Depth
 from qiskit.transpiler.passes import RemoveResetInZeroState
 from qiskit.transpiler.passes import Optimize1qGates
@@ -106,11 +107,13 @@ def level_2_pass_manager(transpile_config):
     # 6. Remove zero-state reset
     _reset = RemoveResetInZeroState()
 
-    # 7. 1q rotation merge and commutative cancellation iteratively until no more change in depth
+    # 7. 1q rotation merge and commutative cancellation iteratively until no more change in depth,
+    # or no more change at all in the last iteration
     _depth_check = [Depth(), FixedPoint('depth')]
+    _dag_check = [DAGFixedPoint()]
 
     def _opt_control(property_set):
-        return not property_set['depth_fixed_point']
+        return not property_set['depth_fixed_point'] and not property_set['dag_fixed_point']
 
     _opt = [Optimize1qGates(), CommutativeCancellation()]
 
@@ -126,6 +129,6 @@ def level_2_pass_manager(transpile_config):
         # pm2.append(_direction_check)  # TODO
         pm2.append(_direction, condition=_direction_condition)
     pm2.append(_reset)
-    pm2.append(_depth_check + _opt, do_while=_opt_control)
+    pm2.append(_depth_check + _opt + _dag_check, do_while=_opt_control)
 
     return pm2
@@ -33,6 +33,7 @@ from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 from qiskit.transpiler.passes import FixedPoint
+from qiskit.transpiler.passes import DAGFixedPoint
 from qiskit.transpiler.passes import Depth
 from qiskit.transpiler.passes import RemoveResetInZeroState
 from qiskit.transpiler.passes import Optimize1qGates
@@ -97,14 +98,16 @@ def level_3_pass_manager(transpile_config):
     # 4. Unroll to the basis
     _unroll = Unroller(basis_gates)
 
-    # 5. 1q rotation merge and commutative cancellation iteratively until no more change in depth
+    # 5. 1q rotation merge and commutative cancellation iteratively until no more change in depth,
+    # or no more change at all in the last iteration
     _depth_check = [Depth(), FixedPoint('depth')]
+    _dag_check = [DAGFixedPoint()]
 
     def _opt_control(property_set):
-        return not property_set['depth_fixed_point']
+        return not property_set['depth_fixed_point'] and not property_set['dag_fixed_point']
 
     _opt = [RemoveResetInZeroState(),
-            Collect2qBlocks(), ConsolidateBlocks(),
+            Collect2qBlocks(), ConsolidateBlocks(force_consolidate=False),
             Unroller(basis_gates), CXDirection(coupling_map),  # unroll unitaries and match coupling
             Optimize1qGates(), CommutativeCancellation(),
             OptimizeSwapBeforeMeasure(), RemoveDiagonalGatesBeforeMeasure()]
@@ -118,6 +121,6 @@ def level_3_pass_manager(transpile_config):
     if coupling_map:
         pm3.append(_swap_check)
         pm3.append(_swap, condition=_swap_condition)
-    pm3.append(_depth_check + _opt, do_while=_opt_control)
+    pm3.append(_depth_check + _opt + _dag_check, do_while=_opt_control)
 
     return pm3
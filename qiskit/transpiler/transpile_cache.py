@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of transpiled circuits, keyed by circuit structure and transpile options."""
+
+from collections import OrderedDict
+import copy
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+from qiskit.converters import circuit_to_dag
+from qiskit.version import __version__
+
+
+class TranspileCache:
+    """Content-addressed cache of transpiled circuits.
+
+    Circuits are keyed by the fingerprint of their DAG (see
+    ``DAGCircuit.fingerprint()``) and by the options of their
+    ``TranspileConfig``, so structurally identical circuits transpiled with
+    the same options share an entry. Entries are kept in an in-memory LRU
+    tier of ``max_size`` circuits and, if ``cache_dir`` is given, pickled in
+    that directory, which is trimmed to ``max_disk_size`` bytes by removing
+    the least recently used files.
+
+    Circuits transpiled with a custom ``pass_manager`` are not cached. When
+    ``seed_transpiler`` is not set, a cache hit returns the result of one of
+    the possible stochastic transpilations.
+
+    Attributes:
+        hits (int): number of lookups that found a transpiled circuit
+        misses (int): number of lookups that did not
+    """
+
+    def __init__(self, max_size=128, cache_dir=None, max_disk_size=2 ** 30):
+        """Create an empty cache.
+
+        Args:
+            max_size (int): number of circuits kept in memory
+            cache_dir (str): directory of the on-disk tier, or None to only
+                keep circuits in memory
+            max_disk_size (int): maximum size in bytes of the files in cache_dir
+        """
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.max_disk_size = max_disk_size
+        self.hits = 0
+        self.misses = 0
+        self._circuits = OrderedDict()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._circuits)
+
+    @staticmethod
+    def key(circuit, transpile_config):
+        """Return the cache key of a circuit and its transpile options.
+
+        Args:
+            circuit (QuantumCircuit): circuit to transpile
+            transpile_config (TranspileConfig): configuration dictating how to transpile
+
+        Returns:
+            str: hex digest of the circuit structure and the transpile
+                options, or None if the transpilation can not be cached
+        """
+        if getattr(transpile_config, 'pass_manager', None) is not None:
+            return None
+        parameter_names = {parameter.name for parameter in circuit.parameters}
+        if len(parameter_names) != len(circuit.parameters):
+            # cached circuits are matched with circuit parameters by name
+            return None
+
+        basis_gates = getattr(transpile_config, 'basis_gates', None)
+        coupling_map = getattr(transpile_config, 'coupling_map', None)
+        backend_properties = getattr(transpile_config, 'backend_properties', None)
+        initial_layout = getattr(transpile_config, 'initial_layout', None)
+        if coupling_map is not None:
+            coupling_map = sorted(coupling_map.get_edges())
+        if backend_properties is not None:
+            backend_properties = json.dumps(backend_properties.to_dict(),
+                                            sort_keys=True, default=str)
+        if initial_layout is not None:
+            initial_layout = sorted((register.name, index, physical) for (register, index), physical
+                                    in initial_layout.get_virtual_bits().items())
+        options = (__version__,
+                   None if basis_gates is None else sorted(basis_gates),
+                   coupling_map,
+                   backend_properties,
+                   initial_layout,
+                   getattr(transpile_config, 'seed_transpiler', None),
+                   getattr(transpile_config, 'optimization_level', None))
+
+        key = hashlib.sha256(circuit_to_dag(circuit).fingerprint().encode())
+        key.update(repr(options).encode())
+        return key.hexdigest()
+
+    def get(self, key):
+        """Return a copy of the transpiled circuit stored under key.
+
+        Args:
+            key (str): cache key, as returned by TranspileCache.key()
+
+        Returns:
+            QuantumCircuit: the transpiled circuit, or None if it is not cached
+        """
+        circuit = None
+        if key in self._circuits:
+            self._circuits.move_to_end(key)
+            circuit = self._circuits[key]
+        elif key is not None and self.cache_dir is not None:
+            circuit = self._load(key)
+            if circuit is not None:
+                self._remember(key, circuit)
+
+        if circuit is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(circuit)
+
+    def put(self, key, circuit):
+        """Store a copy of a transpiled circuit under key.
+
+        Args:
+            key (str): cache key, as returned by TranspileCache.key()
+            circuit (QuantumCircuit): transpiled circuit
+        """
+        if key is None:
+            return
+        circuit = copy.deepcopy(circuit)
+        self._remember(key, circuit)
+        if self.cache_dir is not None:
+            self._dump(key, circuit)
+
+    def clear(self):
+        """Remove all the circuits from the cache, including the on-disk tier."""
+        self._circuits.clear()
+        for path in self._disk_files():
+            os.remove(path)
+
+    def _remember(self, key, circuit):
+        """Add a circuit to the in-memory tier, evicting the least recently used."""
+        self._circuits[key] = circuit
+        self._circuits.move_to_end(key)
+        while len(self._circuits) > self.max_size:
+            self._circuits.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.pickle')
+
+    def _disk_files(self):
+        if self.cache_dir is None:
+            return []
+        return glob.glob(os.path.join(self.cache_dir, '*.pickle'))
+
+    def _load(self, key):
+        """Load a circuit from the on-disk tier, or return None."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                circuit = pickle.load(file)
+            # mark as recently used for the eviction
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        return circuit
+
+    def _dump(self, key, circuit):
+        """Write a circuit to the on-disk tier and trim it to max_disk_size."""
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as file:
+            pickle.dump(circuit, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+
+        files = []
+        for path in self._disk_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total_size <= self.max_disk_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
@@ -14,5 +14,5 @@
 
 """Models and schemas for Terra."""
 
-from .base import BaseModel, BaseSchema, bind_schema, ModelTypeValidator
+from .base import BaseModel, BaseSchema, bind_schema, ModelTypeValidator, skip_validation
 from .exceptions import ModelValidationError
@@ -30,7 +30,9 @@ together by using ``bind_schema``::
         pass
 """
 
+from contextlib import contextmanager
 from functools import wraps
+import threading
 from types import SimpleNamespace, MethodType
 
 from marshmallow import ValidationError
@@ -40,6 +42,28 @@ from marshmallow.utils import is_collection
 
 from .exceptions import ModelValidationError
 
+# Per-thread flag telling models to skip the validation of their instantiation
+_VALIDATION_STATE = threading.local()
+
+
+@contextmanager
+def skip_validation():
+    """Context manager for instantiating models without validating them.
+
+    Inside the context, the models bound with ``bind_schema`` skip the
+    validation of their arguments at instantiation. It is meant for trusted
+    code building many models from data that is known to be valid, e.g. the
+    assembler building Qobj instructions from circuits; the result can still
+    be validated in bulk afterwards (e.g. with ``_validate()``). The flag is
+    local to the current thread.
+    """
+    previous = getattr(_VALIDATION_STATE, 'skip', False)
+    _VALIDATION_STATE.skip = True
+    try:
+        yield
+    finally:
+        _VALIDATION_STATE.skip = previous
+
 
 class ModelTypeValidator(_fields.Field):
     """A field able to validate the correct type of a value."""
@@ -245,11 +269,12 @@ class _SchemaBinder:
 
         @wraps(init_method)
         def _decorated(self, **kwargs):
-            try:
-                _ = self.shallow_schema.validate(kwargs)
-            except ValidationError as ex:
-                raise ModelValidationError(
-                    ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
+            if not getattr(_VALIDATION_STATE, 'skip', False):
+                try:
+                    _ = self.shallow_schema.validate(kwargs)
+                except ValidationError as ex:
+                    raise ModelValidationError(
+                        ex.messages, ex.field_names, ex.fields, ex.data, **ex.kwargs) from None
 
             init_method(self, **kwargs)
 
@@ -260,8 +285,9 @@ def bind_schema(schema):
     """Class decorator for adding schema validation to its instances.
 
     Instances of the decorated class are automatically validated after
-    instantiation and they are augmented to allow further validations with the
-    private method ``_validate()``.
+    instantiation, unless created inside ``skip_validation()``, and they are
+    augmented to allow further validations with the private method
+    ``_validate()``.
 
     The decorator also adds the class attribute ``schema`` with the schema used
     for validation, along with a class attribute ``shallow_schema`` used for
@@ -299,8 +325,13 @@ def bind_schema(schema):
 
 
 def _base_model_from_kwargs(cls, kwargs):
-    """Helper for BaseModel.__reduce__, expanding kwargs."""
-    return cls(**kwargs)
+    """Helper for BaseModel.__reduce__, expanding kwargs.
+
+    The model was validated when the pickled instance was created, so it is
+    not validated again.
+    """
+    with skip_validation():
+        return cls(**kwargs)
 
 
 class BaseModel(SimpleNamespace):
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Compilation of JSON schemas into checking functions.
+
+``compile_schema`` turns a draft 4 JSON schema into a function telling
+whether an instance is valid, built from closures specialized for each
+keyword of the schema. The checks follow the semantics of the ``jsonschema``
+``Draft4Validator`` (without format checking), but they only answer whether
+the instance is valid: errors are reported by running the ``jsonschema``
+validator on the invalid instances.
+"""
+
+import numbers
+import re
+from urllib.parse import unquote
+
+from jsonschema._utils import uniq
+
+
+class SchemaCompilationError(Exception):
+    """Raised when a schema uses features that can not be compiled."""
+    pass
+
+
+def _is_integer(instance):
+    return isinstance(instance, int) and not isinstance(instance, bool)
+
+
+def _is_number(instance):
+    return isinstance(instance, numbers.Number) and not isinstance(instance, bool)
+
+
+_TYPE_CHECKS = {
+    'array': lambda instance: isinstance(instance, list),
+    'boolean': lambda instance: isinstance(instance, bool),
+    'integer': _is_integer,
+    'null': lambda instance: instance is None,
+    'number': _is_number,
+    'object': lambda instance: isinstance(instance, dict),
+    'string': lambda instance: isinstance(instance, str),
+}
+
+
+def _always_valid(_):
+    return True
+
+
+def _never_valid(_):
+    return False
+
+
+def _all_of(checks):
+    """Return a check that is valid if all the checks are."""
+    if not checks:
+        return _always_valid
+    if len(checks) == 1:
+        return checks[0]
+
+    def _check(instance):
+        for check in checks:
+            if not check(instance):
+                return False
+        return True
+
+    return _check
+
+
+def compile_schema(schema):
+    """Compile a draft 4 JSON schema into a checking function.
+
+    Args:
+        schema (dict): JSON schema. References must point inside the schema.
+
+    Returns:
+        callable: function taking an instance and returning whether it is
+            valid against the schema.
+
+    Raises:
+        SchemaCompilationError: if the schema uses unsupported features, e.g.
+            remote references.
+    """
+    return _SchemaCompiler(schema).compile(schema)
+
+
+class _SchemaCompiler:
+    """Compiler of the subschemas of a root schema."""
+
+    def __init__(self, root):
+        self._root = root
+        # Map from reference to its compiled check, None while being compiled
+        self._refs = {}
+        self._keywords = {
+            'additionalItems': self._additional_items,
+            'additionalProperties': self._additional_properties,
+            'allOf': self._all_of,
+            'anyOf': self._any_of,
+            'dependencies': self._dependencies,
+            'enum': self._enum,
+            'items': self._items,
+            'maxItems': self._max_items,
+            'maxLength': self._max_length,
+            'maxProperties': self._max_properties,
+            'maximum': self._maximum,
+            'minItems': self._min_items,
+            'minLength': self._min_length,
+            'minProperties': self._min_properties,
+            'minimum': self._minimum,
+            'multipleOf': self._multiple_of,
+            'not': self._not,
+            'oneOf': self._one_of,
+            'pattern': self._pattern,
+            'patternProperties': self._pattern_properties,
+            'properties': self._properties,
+            'required': self._required,
+            'type': self._type,
+            'uniqueItems': self._unique_items,
+        }
+
+    def compile(self, schema):
+        """Return the check of a subschema."""
+        if not isinstance(schema, dict):
+            raise SchemaCompilationError('Schema {!r} is not an object.'.format(schema))
+        if 'id' in schema and schema is not self._root:
+            raise SchemaCompilationError('Subschema ids are not supported.')
+        if '$ref' in schema:
+            # As in jsonschema, the other keywords of a reference are ignored
+            return self._ref(schema['$ref'])
+
+        # 'format' is only checked by jsonschema when given a format checker
+        return _all_of([self._keywords[keyword](value, schema)
+                        for keyword, value in schema.items() if keyword in self._keywords])
+
+    def _ref(self, ref):
+        if ref not in self._refs:
+            self._refs[ref] = None
+            self._refs[ref] = self.compile(self._resolve(ref))
+        if self._refs[ref] is not None:
+            return self._refs[ref]
+
+        # recursive reference, looked up once compiled
+        refs = self._refs
+
+        def _check(instance):
+            return refs[ref](instance)
+
+        return _check
+
+    def _resolve(self, ref):
+        """Return the subschema of the root pointed by a local reference."""
+        if not ref.startswith('#'):
+            raise SchemaCompilationError('Reference {} is not local.'.format(ref))
+        fragment = unquote(ref[1:].lstrip('/'))
+        document = self._root
+        for part in fragment.split('/') if fragment else []:
+            part = part.replace('~1', '/').replace('~0', '~')
+            if isinstance(document, list):
+                part = int(part)
+            try:
+                document = document[part]
+            except (KeyError, IndexError, TypeError):
+                raise SchemaCompilationError('Unresolvable reference {}.'.format(ref))
+        return document
+
+    # Keywords
+
+    @staticmethod
+    def _type(types, _):
+        if isinstance(types, str):
+            types = [types]
+        try:
+            checks = [_TYPE_CHECKS[type_] for type_ in types]
+        except (KeyError, TypeError):
+            raise SchemaCompilationError('Unsupported type {!r}.'.format(types))
+        if len(checks) == 1:
+            return checks[0]
+        return lambda instance: any(check(instance) for check in checks)
+
+    def _properties(self, properties, _):
+        checks = [(name, self.compile(subschema)) for name, subschema in properties.items()]
+
+        def _check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for name, check in checks:
+                if name in instance and not check(instance[name]):
+                    return False
+            return True
+
+        return _check
+
+    def _pattern_properties(self, pattern_properties, _):
+        checks = [(re.compile(pattern), self.compile(subschema))
+                  for pattern, subschema in pattern_properties.items()]
+
+        def _check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for pattern, check in checks:
+                for name, value in instance.items():
+                    if pattern.search(name) and not check(value):
+                        return False
+            return True
+
+        return _check
+
+    def _additional_properties(self, additional, schema):
+        properties = schema.get('properties', {})
+        patterns = '|'.join(schema.get('patternProperties', {}))
+        patterns = re.compile(patterns) if patterns else None
+        if isinstance(additional, dict):
+            check_additional = self.compile(additional)
+        elif not additional:
+            check_additional = _never_valid
+        else:
+            return _always_valid
+
+        def _check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for name, value in instance.items():
+                if name in properties or (patterns is not None and patterns.search(name)):
+                    continue
+                if not check_additional(value):
+                    return False
+            return True
+
+        return _check
+
+    @staticmethod
+    def _required(required, _):
+        def _check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for name in required:
+                if name not in instance:
+                    return False
+            return True
+
+        return _check
+
+    def _dependencies(self, dependencies, _):
+        checks = []
+        for name, dependency in dependencies.items():
+            if isinstance(dependency, dict):
+                checks.append((name, self.compile(dependency)))
+            else:
+                names = [dependency] if isinstance(dependency, str) else dependency
+                checks.append((name, lambda instance, names=names:
+                               all(name in instance for name in names)))
+
+        def _check(instance):
+            if not isinstance(instance, dict):
+                return True
+            for name, check in checks:
+                if name in instance and not check(instance):
+                    return False
+            return True
+
+        return _check
+
+    def _items(self, items, _):
+        if isinstance(items, dict):
+            check_item = self.compile(items)
+
+            def _check(instance):
+                if not isinstance(instance, list):
+                    return True
+                for item in instance:
+                    if not check_item(item):
+                        return False
+                return True
+
+            return _check
+
+        checks = [self.compile(subschema) for subschema in items]
+
+        def _check_tuple(instance):
+            if not isinstance(instance, list):
+                return True
+            for item, check in zip(instance, checks):
+                if not check(item):
+                    return False
+            return True
+
+        return _check_tuple
+
+    def _additional_items(self, additional, schema):
+        items = schema.get('items', {})
+        if isinstance(items, dict):
+            return _always_valid
+        if isinstance(additional, dict):
+            check_additional = self.compile(additional)
+        elif not additional:
+            return lambda instance: not isinstance(instance, list) or len(instance) <= len(items)
+        else:
+            return _always_valid
+
+        def _check(instance):
+            if not isinstance(instance, list):
+                return True
+            for item in instance[len(items):]:
+                if not check_additional(item):
+                    return False
+            return True
+
+        return _check
+
+    @staticmethod
+    def _min_items(min_items, _):
+        return lambda instance: not isinstance(instance, list) or len(instance) >= min_items
+
+    @staticmethod
+    def _max_items(max_items, _):
+        return lambda instance: not isinstance(instance, list) or len(instance) <= max_items
+
+    @staticmethod
+    def _unique_items(unique_items, _):
+        if not unique_items:
+            return _always_valid
+        return lambda instance: not isinstance(instance, list) or uniq(instance)
+
+    @staticmethod
+    def _min_length(min_length, _):
+        return lambda instance: not isinstance(instance, str) or len(instance) >= min_length
+
+    @staticmethod
+    def _max_length(max_length, _):
+        return lambda instance: not isinstance(instance, str) or len(instance) <= max_length
+
+    @staticmethod
+    def _min_properties(min_properties, _):
+        return lambda instance: not isinstance(instance, dict) or len(instance) >= min_properties
+
+    @staticmethod
+    def _max_properties(max_properties, _):
+        return lambda instance: not isinstance(instance, dict) or len(instance) <= max_properties
+
+    @staticmethod
+    def _minimum(minimum, schema):
+        if schema.get('exclusiveMinimum', False):
+            return lambda instance: not _is_number(instance) or instance > minimum
+        return lambda instance: not _is_number(instance) or instance >= minimum
+
+    @staticmethod
+    def _maximum(maximum, schema):
+        if schema.get('exclusiveMaximum', False):
+            return lambda instance: not _is_number(instance) or instance < maximum
+        return lambda instance: not _is_number(instance) or instance <= maximum
+
+    @staticmethod
+    def _multiple_of(multiple_of, _):
+        def _check(instance):
+            if not _is_number(instance):
+                return True
+            if isinstance(multiple_of, float):
+                quotient = instance / multiple_of
+                return int(quotient) == quotient
+            return not instance % multiple_of
+
+        return _check
+
+    @staticmethod
+    def _enum(enum, _):
+        return lambda instance: instance in enum
+
+    @staticmethod
+    def _pattern(pattern, _):
+        pattern = re.compile(pattern)
+        return lambda instance: (not isinstance(instance, str)
+                                 or pattern.search(instance) is not None)
+
+    def _all_of(self, subschemas, _):
+        return _all_of([self.compile(subschema) for subschema in subschemas])
+
+    def _any_of(self, subschemas, _):
+        checks = [self.compile(subschema) for subschema in subschemas]
+        return lambda instance: any(check(instance) for check in checks)
+
+    def _one_of(self, subschemas, _):
+        checks = [self.compile(subschema) for subschema in subschemas]
+
+        def _check(instance):
+            valid = 0
+            for check in checks:
+                if check(instance):
+                    valid += 1
+                    if valid > 1:
+                        return False
+            return valid == 1
+
+        return _check
+
+    def _not(self, subschema, _):
+        check = self.compile(subschema)
+        return lambda instance: not check(instance)
@@ -19,6 +19,7 @@ import os
 import logging
 import jsonschema
 
+from .compiler import compile_schema, SchemaCompilationError
 from .exceptions import SchemaValidationError, _SummaryValidationError
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,8 @@ _DEFAULT_SCHEMA_PATHS = {
 # Schema and Validator storage
 _SCHEMAS = {}
 _VALIDATORS = {}
+# Compiled checks of the schemas, None for the schemas that can not be compiled
+_CHECKERS = {}
 
 
 def _load_schema(file_path, name=None):
@@ -96,6 +99,15 @@ def _get_validator(name, schema=None, check_schema=True,
         # Generate and store validator in _VALIDATORS
         _VALIDATORS[name] = validator_class(schema, **validator_kwargs)
 
+        # Compile the schema for the validations of valid instances. Only
+        # the default draft 4 validation can be compiled.
+        _CHECKERS[name] = None
+        if validator_class is jsonschema.Draft4Validator and not validator_kwargs:
+            try:
+                _CHECKERS[name] = compile_schema(schema)
+            except SchemaCompilationError as ex:
+                logger.debug('Schema %s is not compiled: %s', name, ex)
+
     validator = _VALIDATORS[name]
 
     if check_schema:
@@ -120,6 +132,10 @@ def validate_json_against_schema(json_dict, schema,
                                  err_msg=None):
     """Validates JSON dict against a schema.
 
+    The standard schemas are compiled once per process into checking
+    functions, and ``jsonschema`` only validates the instances they find
+    invalid, to report the errors.
+
     Args:
         json_dict (dict): JSON to be validated.
         schema (dict or str): JSON schema dictionary or the name of one of the
@@ -138,8 +154,10 @@ def validate_json_against_schema(json_dict, schema,
         if isinstance(schema, str):
             schema_name = schema
             schema = _SCHEMAS[schema_name]
-            validator = _get_validator(schema_name)
-            validator.validate(json_dict)
+            validator = _get_validator(schema_name, check_schema=False)
+            checker = _CHECKERS.get(schema_name)
+            if checker is None or not checker(json_dict):
+                validator.validate(json_dict)
         else:
             jsonschema.validate(json_dict, schema)
     except jsonschema.ValidationError as err:
@@ -152,6 +170,22 @@ def validate_json_against_schema(json_dict, schema,
         raise newerr
 
 
+def _is_valid_json(json_dict, schema_name):
+    """Return whether a JSON dict is valid against one of the standard schemas.
+
+    Args:
+        json_dict (dict): JSON to be validated.
+        schema_name (str): name of one of the standard schemas.
+
+    Returns:
+        bool: True if json_dict is valid.
+    """
+    checker = _CHECKERS.get(schema_name)
+    if checker is not None:
+        return checker(json_dict)
+    return _get_validator(schema_name, check_schema=False).is_valid(json_dict)
+
+
 def _format_causes(err, level=0):
     """Return a cascading explanation of the validation error.
 
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Assembly scaling with circuit width.
+Builds wide circuits with a layer of gates, measurements and conditional
+gates per qubit, and times assembling batches of them for increasing widths.
+Also times assembling the circuits of each batch serially and with
+parallel_map, to check the instruction threshold above which assemble()
+uses parallel_map (qiskit.assembler.assemble_circuits.PARALLEL_THRESHOLD).
+"""
+
+import argparse
+import time
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.assembler.assemble_circuits import _assemble_circuit
+from qiskit.compiler import assemble
+from qiskit.tools.parallel import parallel_map
+
+
+def wide_circuit(n_qubits, n_layers, n_cregs):
+    """Layers of h, cx, measure and conditional x on every qubit."""
+    qr = QuantumRegister(n_qubits, 'q')
+    creg_size = n_qubits // n_cregs
+    cregs = [ClassicalRegister(creg_size, 'c{}'.format(index)) for index in range(n_cregs)]
+    clbits = [clbit for creg in cregs for clbit in creg]
+    circ = QuantumCircuit(qr, *cregs)
+    for _ in range(n_layers):
+        for qubit in range(n_qubits):
+            circ.h(qr[qubit])
+            circ.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+            circ.measure(qr[qubit], clbits[qubit % len(clbits)])
+            circ.x(qr[qubit]).c_if(cregs[qubit % n_cregs], 1)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for assembling wide circuits.")
+    parser.add_argument('--widths', type=int, nargs='+', default=[50, 100, 200, 400],
+                        help='num qubits of the circuits')
+    parser.add_argument('--n_layers', type=int, default=4, help='num layers')
+    parser.add_argument('--n_cregs', type=int, default=5, help='num classical registers')
+    parser.add_argument('--n_circuits', type=int, default=8, help='num circuits per batch')
+    parser.add_argument('--processes', type=int, nargs='+', default=[2, 4],
+                        help='num processes of parallel_map')
+    args = parser.parse_args()
+
+    for width in args.widths:
+        circuits = [wide_circuit(width, args.n_layers, args.n_cregs)
+                    for _ in range(args.n_circuits)]
+        n_instructions = sum(len(circuit.data) for circuit in circuits)
+        tstart = time.time()
+        assemble(circuits, shots=1024)
+        elapsed = time.time() - tstart
+        print("---- width {}: {:.3f} s, {:.1f} us/instruction".format(
+            width, elapsed, 1e6 * elapsed / n_instructions))
+
+        tstart = time.time()
+        _ = [_assemble_circuit(circuit) for circuit in circuits]
+        elapsed = time.time() - tstart
+        print("---- width {}, {} instructions, serial: {:.3f} s".format(
+            width, n_instructions, elapsed))
+        for processes in args.processes:
+            # start the workers before timing
+            parallel_map(_assemble_circuit, circuits[:2], num_processes=processes)
+            tstart = time.time()
+            parallel_map(_assemble_circuit, circuits, num_processes=processes)
+            elapsed = time.time() - tstart
+            print("---- width {}, {} instructions, parallel_map with {} processes: "
+                  "{:.3f} s".format(width, n_instructions, processes, elapsed))
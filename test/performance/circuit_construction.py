@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Circuit construction and assembly.
+Times building circuits of numerically parameterized gates and
+assembling them into a Qobj.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+
+
+def build_circuit(n_qubits, n_gates, gate_angles):
+    """Circuit of u3, u1 and cx gates with numeric angles."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr)
+    for index in range(n_gates):
+        qubit = index % n_qubits
+        theta, phi, lam = gate_angles[index]
+        if index % 3 == 0:
+            circ.u3(theta, phi, lam, qr[qubit])
+        elif index % 3 == 1:
+            circ.u1(lam, qr[qubit])
+        else:
+            circ.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for circuit construction and assembly.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=3000, help='num gates per circuit')
+    parser.add_argument('--n_circuits', type=int, default=20, help='num circuits')
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(42)
+    angles = [rng.rand(args.n_gates, 3) * 2 * np.pi for _ in range(args.n_circuits)]
+
+    tstart = time.time()
+    circuits = [build_circuit(args.n_qubits, args.n_gates, circuit_angles)
+                for circuit_angles in angles]
+    elapsed = time.time() - tstart
+    print("---- construction: {:.3f} s, {:.0f} gates/s".format(
+        elapsed, args.n_circuits * args.n_gates / elapsed))
+
+    tstart = time.time()
+    assemble(circuits, shots=1024)
+    elapsed = time.time() - tstart
+    print("---- assembly: {:.3f} s, {:.0f} gates/s".format(
+        elapsed, args.n_circuits * args.n_gates / elapsed))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Circuit serialization.
+Times round trips of a batch of random circuits through the binary format
+of dump_circuits(), pickle and OpenQASM strings, and reports their sizes.
+"""
+
+import argparse
+import io
+import pickle
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import dump_circuits, load_circuits
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Circuit of random h, u3, rz and cx gates, and measurements."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr)
+    for _ in range(n_gates):
+        qubit, other = rng.choice(n_qubits, 2, replace=False).tolist()
+        kind = rng.randint(4)
+        if kind == 0:
+            circ.h(qr[qubit])
+        elif kind == 1:
+            circ.u3(*rng.rand(3).tolist(), qr[qubit])
+        elif kind == 2:
+            circ.rz(float(rng.rand()), qr[qubit])
+        else:
+            circ.cx(qr[qubit], qr[other])
+    circ.measure(qr, cr)
+    return circ
+
+
+def binary_round_trip(circuits):
+    """Return the size of circuits in the binary format, and read them back."""
+    buffer = io.BytesIO()
+    dump_circuits(circuits, buffer)
+    data = buffer.getvalue()
+    load_circuits(data)
+    return len(data)
+
+
+def pickle_round_trip(circuits):
+    """Return the size of pickled circuits, and unpickle them."""
+    data = pickle.dumps(circuits, pickle.HIGHEST_PROTOCOL)
+    pickle.loads(data)
+    return len(data)
+
+
+def qasm_round_trip(circuits):
+    """Return the size of the OpenQASM strings of circuits, and parse them."""
+    strings = [circuit.qasm() for circuit in circuits]
+    for string in strings:
+        QuantumCircuit.from_qasm_str(string)
+    return sum(len(string) for string in strings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for circuit serialization.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=500, help='num gates per circuit')
+    parser.add_argument('--n_circuits', type=int, default=20, help='num circuits')
+    args = parser.parse_args()
+
+    batch = [random_circuit(args.n_qubits, args.n_gates, seed)
+             for seed in range(args.n_circuits)]
+
+    for label, round_trip in [('binary', binary_round_trip),
+                              ('pickle', pickle_round_trip),
+                              ('qasm', qasm_round_trip)]:
+        tstart = time.time()
+        size = round_trip(batch)
+        print("---- {}: {:.3f} s, {:.0f} kB".format(label, time.time() - tstart, size / 1e3))
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Commutation analysis.
+Times the CommutationAnalysis and CommutativeCancellation passes on random
+circuits of standard gates of increasing sizes.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PropertySet
+from qiskit.transpiler.passes import CommutationAnalysis, CommutativeCancellation
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Random 1- and 2-qubit standard gates on random qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    one_qubit = [circ.h, circ.x, circ.z, circ.s, circ.t]
+    two_qubit = [circ.cx, circ.cz, circ.swap]
+    for _ in range(n_gates):
+        choice = rng.randint(len(one_qubit) + len(two_qubit) + 2)
+        if choice < len(one_qubit):
+            one_qubit[choice](qr[int(rng.randint(n_qubits))])
+        elif choice < len(one_qubit) + len(two_qubit):
+            qubits = rng.choice(n_qubits, 2, replace=False)
+            two_qubit[choice - len(one_qubit)](qr[int(qubits[0])], qr[int(qubits[1])])
+        else:
+            circ.rz(rng.uniform(0, 2 * np.pi), qr[int(rng.randint(n_qubits))])
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the commutation passes.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='num gates of the circuits')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        dag = circuit_to_dag(random_circuit(args.n_qubits, size, args.seed))
+        analysis = CommutationAnalysis()
+        analysis.property_set = PropertySet()
+        tstart = time.time()
+        analysis.run(dag)
+        analysis_time = time.time() - tstart
+        cancellation = CommutativeCancellation()
+        cancellation.property_set = analysis.property_set
+        tstart = time.time()
+        cancellation.run(dag)
+        cancellation_time = time.time() - tstart
+        print("---- {} gates: analysis {:.3f} s, cancellation {:.3f} s, "
+              "{} gates left".format(size, analysis_time, cancellation_time, dag.size()))
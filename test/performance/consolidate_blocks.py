@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Consolidate blocks.
+Times the ConsolidateBlocks pass, and transpilation at optimization level 3,
+on random circuits of u3 and cx gates of increasing sizes, with a line
+coupling map.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PropertySet
+from qiskit.transpiler.passes import Collect2qBlocks, ConsolidateBlocks
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Random u3 gates and cx gates on random qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        if rng.randint(2):
+            circ.u3(*rng.uniform(0, 2 * np.pi, 3), qr[int(rng.randint(n_qubits))])
+        else:
+            qubits = rng.choice(n_qubits, 2, replace=False)
+            circ.cx(qr[int(qubits[0])], qr[int(qubits[1])])
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the ConsolidateBlocks pass.")
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 300],
+                        help='num gates of the circuits')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    coupling_map = [[qubit, qubit + 1] for qubit in range(args.n_qubits - 1)]
+    for size in args.sizes:
+        circuit = random_circuit(args.n_qubits, size, args.seed)
+        dag = circuit_to_dag(circuit)
+        collect = Collect2qBlocks()
+        collect.property_set = PropertySet()
+        collect.run(dag)
+        consolidate = ConsolidateBlocks()
+        consolidate.property_set = collect.property_set
+        tstart = time.time()
+        consolidated = consolidate.run(dag)
+        consolidate_time = time.time() - tstart
+        tstart = time.time()
+        transpiled = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                               coupling_map=coupling_map, optimization_level=3,
+                               seed_transpiler=args.seed)
+        print("---- {} gates: consolidate {:.3f} s, {} blocks, level 3 {:.3f} s, "
+              "{} cx left".format(size, consolidate_time, consolidated.size(),
+                                  time.time() - tstart, transpiled.count_ops().get('cx', 0)))
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+DAGCircuit storage engines.
+Builds a large random circuit and times DAG construction and a few
+transpiler passes with each DAGCircuit graph storage engine.
+"""
+
+import argparse
+import copy
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.dagcircuit.graphs import GRAPH_STORAGES
+from qiskit.transpiler.passes import CXCancellation, Optimize1qGates, Unroller
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Random circuit of 1 and 2 qubit gates."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        kind = rng.randint(4)
+        if kind == 0:
+            circ.h(qr[rng.randint(n_qubits)])
+        elif kind == 1:
+            circ.u1(rng.rand(), qr[rng.randint(n_qubits)])
+        elif kind == 2:
+            circ.t(qr[rng.randint(n_qubits)])
+        else:
+            control, target = rng.choice(n_qubits, 2, replace=False)
+            circ.cx(qr[int(control)], qr[int(target)])
+    return circ
+
+
+def time_storage(storage, circ):
+    """Time DAG construction and passes using `storage`, return a dict of timings."""
+    DAGCircuit.default_storage = storage
+    timings = {}
+
+    tstart = time.time()
+    dag = circuit_to_dag(circ)
+    timings['circuit_to_dag'] = time.time() - tstart
+
+    tstart = time.time()
+    for _ in dag.topological_op_nodes():
+        pass
+    timings['topological_op_nodes'] = time.time() - tstart
+
+    tstart = time.time()
+    for _ in dag.topological_op_nodes():
+        pass
+    timings['topological (cached)'] = time.time() - tstart
+
+    tstart = time.time()
+    dag.depth()
+    timings['depth'] = time.time() - tstart
+
+    tstart = time.time()
+    for wire in dag.wires:
+        for _ in dag.nodes_on_wire(wire):
+            pass
+    timings['nodes_on_wire'] = time.time() - tstart
+
+    tstart = time.time()
+    dag.collect_runs(['u1', 't', 'h'])
+    timings['collect_runs'] = time.time() - tstart
+
+    tstart = time.time()
+    dag.fingerprint()
+    timings['fingerprint'] = time.time() - tstart
+
+    other = copy.deepcopy(dag)
+    tstart = time.time()
+    assert dag == other
+    timings['__eq__'] = time.time() - tstart
+
+    for pass_ in [Unroller(['u1', 'u2', 'u3', 'cx']), Optimize1qGates(), CXCancellation()]:
+        tstart = time.time()
+        dag = pass_.run(dag)
+        timings[pass_.name()] = time.time() - tstart
+
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the DAGCircuit storage engines.")
+    parser.add_argument('--n_qubits', type=int, default=50, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=100000, help='num gates')
+    parser.add_argument('--seed', type=int, default=42, help='random circuit seed')
+    args = parser.parse_args()
+
+    circuit = random_circuit(args.n_qubits, args.n_gates, args.seed)
+    results = {storage: time_storage(storage, circuit) for storage in sorted(GRAPH_STORAGES)}
+
+    print("---- Qubits: {}, gates: {}".format(args.n_qubits, args.n_gates))
+    print("{:<24}".format('') + ''.join('{:>14}'.format(s) for s in sorted(results)))
+    for step in results['networkx']:
+        print("{:<24}".format(step) +
+              ''.join('{:>14.3f}'.format(results[s][step]) for s in sorted(results)))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+BasicAer gate fusion.
+Times the statevector and unitary simulators on random circuits of u3 and cx
+gates for increasing widths, and reports how many operations are left once
+the gates of the circuits are fused.
+"""
+
+import argparse
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit, BasicAer
+from qiskit.compiler import assemble
+from qiskit.providers.basicaer.basicaertools import compile_instructions
+
+
+def random_circuit(n_qubits, depth, seed):
+    """Layers of random u3 gates, and cx gates between random pairs of qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    for _ in range(depth):
+        for qubit in range(n_qubits):
+            circ.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubit])
+        permutation = rng.permutation(n_qubits)
+        for index in range(0, n_qubits - 1, 2):
+            circ.cx(qr[int(permutation[index])], qr[int(permutation[index + 1])])
+    return circ
+
+
+def time_backend(backend, circuit):
+    """Return the time taken by backend to simulate circuit.
+
+    The job is run synchronously, and the time of the experiment reported in
+    its result excludes the conversion of the output state to a Result.
+    """
+    qobj = assemble(circuit, shots=1)
+    # pylint: disable=protected-access
+    return backend._run_job('benchmark', qobj).results[0].time_taken
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for BasicAer gate fusion.")
+    parser.add_argument('--widths', type=int, nargs='+', default=[10, 14, 18, 22, 24],
+                        help='num qubits of the statevector circuits')
+    parser.add_argument('--unitary_widths', type=int, nargs='+', default=[6, 8, 10],
+                        help='num qubits of the unitary circuits')
+    parser.add_argument('--depth', type=int, default=4, help='num layers')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    simulators = [('statevector', BasicAer.get_backend('statevector_simulator'), args.widths),
+                  ('unitary', BasicAer.get_backend('unitary_simulator'), args.unitary_widths)]
+    for label, simulator, widths in simulators:
+        for width in widths:
+            random_circ = random_circuit(width, args.depth, args.seed)
+            instructions = assemble(random_circ).experiments[0].instructions
+            n_fused = len(compile_instructions(instructions))
+            elapsed = time_backend(simulator, random_circ)
+            print("---- {} width {}: {:.3f} s, {} gates fused into {}".format(
+                label, width, elapsed, len(instructions), n_fused))
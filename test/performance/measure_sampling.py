@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Measurement sampling in the BasicAer qasm simulator.
+Times simulating a circuit with final measurements, whose outcomes are
+sampled from the final statevector, for increasing numbers of shots, with
+and without returning the memory of each shot.
+"""
+
+import argparse
+import time
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, BasicAer
+from qiskit.compiler import transpile, assemble
+
+
+def uniform_circuit(n_qubits):
+    """Circuit of an h gate on every qubit, and measurements."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr)
+    circ.h(qr)
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for BasicAer measurement sampling.")
+    parser.add_argument('--n_qubits', type=int, default=12, help='num qubits')
+    parser.add_argument('--shots', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='num shots')
+    args = parser.parse_args()
+
+    backend = BasicAer.get_backend('qasm_simulator')
+    circuit = transpile(uniform_circuit(args.n_qubits), backend)
+    for shots in args.shots:
+        for memory in [False, True]:
+            qobj = assemble(circuit, shots=shots, memory=memory, seed_simulator=42)
+            tstart = time.time()
+            backend.run(qobj).result()
+            print("---- {} shots, memory={}: {:.3f} s".format(
+                shots, memory, time.time() - tstart))
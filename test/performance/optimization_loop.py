@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Optimization loop.
+Times transpilation at optimization levels 2 and 3, whose optimization passes
+run in a loop until a fixed point, on random circuits of standard gates of
+increasing sizes, with a line coupling map.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+
+
+def random_circuit(n_qubits, n_gates, seed):
+    """Random 1-qubit standard gates and cx gates on neighbouring qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    one_qubit = [circ.h, circ.x, circ.z, circ.s, circ.t]
+    for _ in range(n_gates):
+        choice = rng.randint(len(one_qubit) + 2)
+        qubit = int(rng.randint(n_qubits - 1))
+        if choice < len(one_qubit):
+            one_qubit[choice](qr[qubit])
+        elif choice == len(one_qubit):
+            circ.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubit])
+        else:
+            circ.cx(qr[qubit], qr[qubit + 1])
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the optimization loop of levels 2 and 3.")
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000],
+                        help='num gates of the circuits')
+    parser.add_argument('--levels', type=int, nargs='+', default=[2, 3],
+                        help='optimization levels')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    coupling_map = [[qubit, qubit + 1] for qubit in range(args.n_qubits - 1)]
+    for level in args.levels:
+        for size in args.sizes:
+            circuit = random_circuit(args.n_qubits, size, args.seed)
+            tstart = time.time()
+            transpiled = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   coupling_map=coupling_map, optimization_level=level,
+                                   seed_transpiler=args.seed)
+            print("---- level {}, {} gates: {:.3f} s, {} gates left, depth {}".format(
+                level, size, time.time() - tstart, transpiled.size(), transpiled.depth()))
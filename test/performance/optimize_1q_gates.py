@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Optimize1qGates.
+Times the Optimize1qGates pass on circuits of runs of random u1, u2 and u3
+gates between cx gates, for increasing numbers of gates.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import Optimize1qGates
+
+
+def random_circuit(n_qubits, n_gates, length, seed):
+    """Runs of length random u1, u2 and u3 gates on random qubits,
+    followed by a cx gate."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    for _ in range(n_gates // (length + 1)):
+        qubit = int(rng.randint(n_qubits))
+        for _ in range(length):
+            angles = rng.uniform(0, 2 * np.pi, 3)
+            choice = rng.randint(3)
+            if choice == 0:
+                circ.u1(angles[0], qr[qubit])
+            elif choice == 1:
+                circ.u2(angles[0], angles[1], qr[qubit])
+            else:
+                circ.u3(*angles, qr[qubit])
+        circ.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the Optimize1qGates pass.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help='num gates of the circuits')
+    parser.add_argument('--run_lengths', type=int, nargs='+', default=[4, 50],
+                        help='num 1-qubit gates between cx gates')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    for run_length in args.run_lengths:
+        for size in args.sizes:
+            dag = circuit_to_dag(random_circuit(args.n_qubits, size, run_length, args.seed))
+            tstart = time.time()
+            optimized = Optimize1qGates().run(dag)
+            print("---- runs of {} gates, {} gates: {:.3f} s, {} gates left".format(
+                run_length, size, time.time() - tstart, optimized.size()))
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Parallel experiments.
+Times BasicAer qasm simulator jobs of parameter sweeps, running their
+experiments with increasing numbers of processes, and reports the sum of the
+times of the experiments of each job.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, BasicAer
+from qiskit.circuit import Parameter
+from qiskit.compiler import assemble, transpile
+
+
+def sweep_circuit(width, depth):
+    """Layers of parameterized rotations and cx gates, and measurements."""
+    theta = Parameter('theta')
+    qr = QuantumRegister(width, 'q')
+    cr = ClassicalRegister(width, 'c')
+    circ = QuantumCircuit(qr, cr)
+    for _ in range(depth):
+        for qubit in range(width):
+            circ.rx(theta, qr[qubit])
+        for qubit in range(width - 1):
+            circ.cx(qr[qubit], qr[qubit + 1])
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for running experiments in parallel.")
+    parser.add_argument('--sweeps', type=str, nargs='+', default=['4:500', '18:8'],
+                        help='num qubits and num experiments of the sweeps, as n:m')
+    parser.add_argument('--depth', type=int, default=4, help='num layers')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='max_parallel_experiments values')
+    args = parser.parse_args()
+
+    backend = BasicAer.get_backend('qasm_simulator')
+    for sweep in args.sweeps:
+        n_qubits, n_experiments = (int(value) for value in sweep.split(':'))
+        circuit = transpile(sweep_circuit(n_qubits, args.depth), backend)
+        binds = [{circuit.parameters.pop(): value}
+                 for value in np.linspace(0, np.pi, n_experiments)]
+        qobj = assemble(circuit, shots=1024, parameter_binds=binds, seed_simulator=42)
+        for workers in args.workers:
+            tstart = time.time()
+            result = backend.run(qobj, backend_options={
+                'max_parallel_experiments': workers}).result()
+            elapsed = time.time() - tstart
+            experiments_time = sum(res.time_taken for res in result.results)
+            print("---- {} qubits, {} experiments, {} workers: {:.3f} s, "
+                  "experiments {:.3f} s".format(n_qubits, n_experiments, workers, elapsed,
+                                                experiments_time))
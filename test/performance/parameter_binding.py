@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Parameter binding.
+Builds a layered variational ansatz and times binding many sets of
+parameter values, with and without transpiling once through a CircuitTemplate.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import assemble, transpile, CircuitTemplate
+from qiskit.test.mock import FakeMelbourne
+
+
+def ansatz(n_qubits, n_layers):
+    """Layers of parameterized ry rotations and a line of cx."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr)
+    for layer in range(n_layers):
+        for qubit in range(n_qubits):
+            circ.ry(Parameter('theta_{}_{}'.format(layer, qubit)), qr[qubit])
+        for qubit in range(n_qubits - 1):
+            circ.cx(qr[qubit], qr[qubit + 1])
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for parameter binding.")
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--n_layers', type=int, default=4, help='num ansatz layers')
+    parser.add_argument('--n_binds', type=int, default=200, help='num parameter binds')
+    args = parser.parse_args()
+
+    backend = FakeMelbourne()
+    circuit = ansatz(args.n_qubits, args.n_layers)
+    parameters = sorted(circuit.parameters, key=lambda parameter: parameter.name)
+    values = np.random.RandomState(42).rand(args.n_binds, len(parameters))
+    binds = [dict(zip(parameters, row)) for row in values]
+
+    tstart = time.time()
+    transpiled = transpile(circuit, backend, seed_transpiler=42)
+    print("---- transpile once: {:.3f}".format(time.time() - tstart))
+
+    tstart = time.time()
+    for bind in binds:
+        transpiled.bind_parameters(bind)
+    print("---- bind_parameters: {:.3f}".format(time.time() - tstart))
+
+    tstart = time.time()
+    transpiled.bind_parameters_batch(values, parameters)
+    print("---- bind_parameters_batch: {:.3f}".format(time.time() - tstart))
+
+    tstart = time.time()
+    template = CircuitTemplate(transpiled)
+    template.bind(values)
+    print("---- CircuitTemplate.bind: {:.3f}".format(time.time() - tstart))
+
+    tstart = time.time()
+    assemble(transpiled, backend, parameter_binds=binds)
+    print("---- assemble with parameter_binds: {:.3f}".format(time.time() - tstart))
+
+    tstart = time.time()
+    template.assemble(values, backend=backend)
+    print("---- CircuitTemplate.assemble: {:.3f}".format(time.time() - tstart))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Qobj construction.
+Times assembling a large circuit, whose Qobj models are built without
+validation, against building the same models with validation, and the
+optional bulk validation of the whole Qobj.
+"""
+
+import argparse
+import time
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.qobj import QasmQobjInstruction, QasmQobjExperiment, validate_qobj_against_schema
+
+
+def large_circuit(n_qubits, n_gates):
+    """Circuit of u3 and cx gates, and measurements."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr)
+    for index in range(n_gates):
+        qubit = index % n_qubits
+        if index % 2:
+            circ.u3(0.1, 0.2, 0.3, qr[qubit])
+        else:
+            circ.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for Qobj construction.")
+    parser.add_argument('--n_qubits', type=int, default=20, help='num qubits')
+    parser.add_argument('--n_gates', type=int, default=50000, help='num gates')
+    args = parser.parse_args()
+
+    circuit = large_circuit(args.n_qubits, args.n_gates)
+    n_instructions = len(circuit.data)
+
+    tstart = time.time()
+    qobj = assemble(circuit, shots=1024)
+    elapsed = time.time() - tstart
+    print("---- assemble: {:.3f} s, {:.0f} instructions/s".format(
+        elapsed, n_instructions / elapsed))
+
+    experiment = qobj.experiments[0]
+    tstart = time.time()
+    instructions = [QasmQobjInstruction(**vars(instruction))
+                    for instruction in experiment.instructions]
+    QasmQobjExperiment(instructions=instructions, header=experiment.header,
+                       config=experiment.config)
+    elapsed = time.time() - tstart
+    print("---- validated models: {:.3f} s, {:.0f} instructions/s".format(
+        elapsed, n_instructions / elapsed))
+
+    tstart = time.time()
+    qobj._validate()
+    print("---- bulk model validation: {:.3f} s".format(time.time() - tstart))
+
+    tstart = time.time()
+    validate_qobj_against_schema(qobj)
+    print("---- bulk schema validation: {:.3f} s".format(time.time() - tstart))
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Qobj serialization.
+Times writing and reading back a Qobj of many experiments as a single JSON
+document and with the streaming dump_qobj() and stream_qobj(), and reports
+the peak memory allocated by each.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.qobj import QasmQobj, dump_qobj, stream_qobj
+
+
+def small_circuit(n_qubits, n_layers, name):
+    """Circuit of layers of u3 and cx gates, and measurements."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr, name=name)
+    for _ in range(n_layers):
+        for qubit in range(n_qubits):
+            circ.u3(0.1, 0.2, 0.3, qr[qubit])
+            circ.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+    circ.measure(qr, cr)
+    return circ
+
+
+def measure(label, function):
+    """Print the time and peak memory of calling function."""
+    tracemalloc.start()
+    tstart = time.time()
+    function()
+    elapsed = time.time() - tstart
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("---- {}: {:.3f} s, peak {:.1f} MB".format(label, elapsed, peak / 1e6))
+
+
+def json_dump(qobj, path):
+    """Write qobj as a single JSON document."""
+    with open(path, 'w') as qobj_file:
+        json.dump(qobj.to_dict(), qobj_file)
+
+
+def json_load(path):
+    """Read and count the experiments of a single JSON document."""
+    with open(path, 'r') as qobj_file:
+        return len(QasmQobj.from_dict(json.load(qobj_file)).experiments)
+
+
+def stream_dump(qobj, path):
+    """Write qobj with dump_qobj."""
+    with open(path, 'w') as qobj_file:
+        dump_qobj(qobj, qobj_file)
+
+
+def stream_load(path):
+    """Read and count the experiments written by dump_qobj, one at a time."""
+    with open(path, 'r') as qobj_file:
+        _, experiments = stream_qobj(qobj_file)
+        return sum(1 for _ in experiments)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for Qobj serialization.")
+    parser.add_argument('--n_qubits', type=int, default=5, help='num qubits')
+    parser.add_argument('--n_layers', type=int, default=10, help='num layers per circuit')
+    parser.add_argument('--n_circuits', type=int, default=200, help='num circuits')
+    args = parser.parse_args()
+
+    circuit = small_circuit(args.n_qubits, args.n_layers, 'circ')
+    big_qobj = assemble([circuit] * args.n_circuits, shots=1024)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_path = os.path.join(tmpdir, 'qobj.json')
+        jsonl_path = os.path.join(tmpdir, 'qobj.jsonl')
+        measure('json dump', lambda: json_dump(big_qobj, json_path))
+        measure('stream dump', lambda: stream_dump(big_qobj, jsonl_path))
+        measure('json load', lambda: json_load(json_path))
+        measure('stream load', lambda: stream_load(jsonl_path))
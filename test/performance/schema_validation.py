@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Qobj schema validation.
+Times validating a Qobj of many experiments against the JSON schema with
+the jsonschema validator, with the compiled schema, and with the chunked
+validation of validate_qobj_against_schema().
+"""
+
+import argparse
+import time
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.qobj import validate_qobj_against_schema
+from qiskit.validation.jsonschema.schema_validation import _get_validator, _CHECKERS
+
+
+def random_layers(n_qubits, n_layers, name):
+    """Circuit of layers of u3 and cx gates, and measurements."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr, name=name)
+    for _ in range(n_layers):
+        for qubit in range(n_qubits):
+            circ.u3(0.1, 0.2, 0.3, qr[qubit])
+            circ.cx(qr[qubit], qr[(qubit + 1) % n_qubits])
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for Qobj schema validation.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--n_layers', type=int, default=20, help='num layers per circuit')
+    parser.add_argument('--n_circuits', type=int, default=50, help='num circuits')
+    args = parser.parse_args()
+
+    circuits = [random_layers(args.n_qubits, args.n_layers, 'circ{}'.format(index))
+                for index in range(args.n_circuits)]
+    qobj = assemble(circuits, shots=1024)
+    validator = _get_validator('qobj')
+    check = _CHECKERS['qobj']
+
+    tstart = time.time()
+    qobj_dict = qobj.to_dict()
+    print("---- to_dict: {:.3f} s".format(time.time() - tstart))
+
+    tstart = time.time()
+    validator.validate(qobj_dict)
+    print("---- jsonschema: {:.3f} s".format(time.time() - tstart))
+
+    tstart = time.time()
+    check(qobj_dict)
+    print("---- compiled schema: {:.3f} s".format(time.time() - tstart))
+
+    tstart = time.time()
+    validate_qobj_against_schema(qobj)
+    print("---- validate_qobj_against_schema: {:.3f} s".format(time.time() - tstart))
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Shot branching.
+Times the BasicAer qasm simulator on dynamic circuits, with mid-circuit
+measurements, resets and conditional gates, that can not be run by sampling
+the measurements of a final statevector.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, BasicAer
+from qiskit.compiler import assemble, transpile
+
+
+def dynamic_circuit(n_qubits, n_rounds, seed):
+    """Rounds of random gates, measurement and reset of the first qubit,
+    and a gate conditioned on the outcome."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cregs = [ClassicalRegister(1, 'm{}'.format(index)) for index in range(n_rounds)]
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, *cregs, cr)
+    for creg in cregs:
+        for qubit in range(n_qubits):
+            circ.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubit])
+        for qubit in range(n_qubits - 1):
+            circ.cx(qr[qubit], qr[qubit + 1])
+        circ.measure(qr[0], creg[0])
+        circ.reset(qr[0])
+        circ.x(qr[n_qubits - 1]).c_if(creg, 1)
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for simulating dynamic circuits.")
+    parser.add_argument('--widths', type=int, nargs='+', default=[4, 8, 12],
+                        help='num qubits of the circuits')
+    parser.add_argument('--n_rounds', type=int, default=3,
+                        help='num mid-circuit measurements')
+    parser.add_argument('--shots', type=int, default=8192, help='num shots')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    backend = BasicAer.get_backend('qasm_simulator')
+    for width in args.widths:
+        circuit = dynamic_circuit(width, args.n_rounds, args.seed)
+        qobj = assemble(transpile(circuit, backend), shots=args.shots,
+                        seed_simulator=args.seed)
+        tstart = time.time()
+        counts = backend.run(qobj).result().get_counts()
+        print("---- width {}: {:.3f} s, {} shots, {} distinct outcomes".format(
+            width, time.time() - tstart, args.shots, len(counts)))
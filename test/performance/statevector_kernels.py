@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Statevector kernels.
+Times the BasicAer qasm simulator on random circuits of u3 and cx gates for
+increasing widths, and reports the peak memory allocated during the
+simulation, compared to the size of the statevector.
+"""
+
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, BasicAer
+from qiskit.compiler import assemble
+
+
+def random_circuit(n_qubits, depth, seed):
+    """Layers of random u3 gates, and cx gates between random pairs of qubits,
+    followed by the measurement of all the qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circ = QuantumCircuit(qr, cr)
+    for _ in range(depth):
+        for qubit in range(n_qubits):
+            circ.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubit])
+        permutation = rng.permutation(n_qubits)
+        for index in range(0, n_qubits - 1, 2):
+            circ.cx(qr[int(permutation[index])], qr[int(permutation[index + 1])])
+    circ.measure(qr, cr)
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the BasicAer statevector kernels.")
+    parser.add_argument('--widths', type=int, nargs='+', default=[16, 20, 22],
+                        help='num qubits of the circuits')
+    parser.add_argument('--depth', type=int, default=4, help='num layers')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    backend = BasicAer.get_backend('qasm_simulator')
+    for width in args.widths:
+        circuit = random_circuit(width, args.depth, args.seed)
+        n_gates = len(circuit.data) - width
+        qobj = assemble(circuit, shots=1, seed_simulator=args.seed)
+        tracemalloc.start()
+        # pylint: disable=protected-access
+        elapsed = backend._run_job('benchmark', qobj).results[0].time_taken
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        statevector_size = 16 * 2 ** width
+        print("---- width {}: {:.3f} s, {:.1f} gates/s, peak memory {:.1f} MB "
+              "({:.2f} statevectors)".format(width, elapsed, n_gates / elapsed,
+                                             peak / 2 ** 20, peak / statevector_size))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Unroller.
+Times the Unroller pass on circuits of ccx gates, and of cu3 gates with a
+few distinct angles, on random qubits, of increasing sizes.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import Unroller
+
+
+def toffoli_circuit(n_qubits, n_gates, seed):
+    """ccx gates on random qubits."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        qubits = rng.choice(n_qubits, 3, replace=False)
+        circ.ccx(*(qr[int(qubit)] for qubit in qubits))
+    return circ
+
+
+def cu3_circuit(n_qubits, n_gates, seed):
+    """cu3 gates with 8 distinct angles on random qubits."""
+    rng = np.random.RandomState(seed)
+    angles = rng.uniform(0, 2 * np.pi, (8, 3))
+    qr = QuantumRegister(n_qubits, 'q')
+    circ = QuantumCircuit(qr)
+    for _ in range(n_gates):
+        qubits = rng.choice(n_qubits, 2, replace=False)
+        circ.cu3(*angles[rng.randint(len(angles))], qr[int(qubits[0])], qr[int(qubits[1])])
+    return circ
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Performance testing for the Unroller pass.")
+    parser.add_argument('--n_qubits', type=int, default=10, help='num qubits')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000],
+                        help='num gates of the circuits')
+    parser.add_argument('--basis', type=str, nargs='+', default=['u1', 'u2', 'u3', 'cx'],
+                        help='basis gates to unroll to')
+    parser.add_argument('--seed', type=int, default=42, help='random seed')
+    args = parser.parse_args()
+
+    for label, builder in [('ccx', toffoli_circuit), ('cu3', cu3_circuit)]:
+        for size in args.sizes:
+            dag = circuit_to_dag(builder(args.n_qubits, size, args.seed))
+            tstart = time.time()
+            unrolled = Unroller(args.basis).run(dag)
+            print("---- {} {} gates: {:.3f} s, {} gates unrolled".format(
+                label, size, time.time() - tstart, unrolled.size()))
@@ -15,10 +15,12 @@
 """BasicAer provider integration tests."""
 
 import unittest
+from unittest import mock
 
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import execute
+from qiskit.compiler import assemble
 from qiskit.result import Result
 from qiskit.test import QiskitTestCase
 
@@ -70,6 +72,18 @@ class TestBasicAerIntegration(QiskitTestCase):
         result = job.result()
         self.assertIsInstance(result, Result)
 
+    def test_basicaer_validate_qobj_option(self):
+        """Test the qobj validation can be disabled with a backend option."""
+        qobj = assemble(self._qc1)
+        with mock.patch('qiskit.providers.basicaer.basicaerjob.'
+                        'validate_qobj_against_schema') as validate:
+            self.backend.run(qobj).result()
+            self.assertEqual(validate.call_count, 1)
+            result = self.backend.run(qobj, backend_options={'validate_qobj': False}).result()
+            self.assertEqual(validate.call_count, 1)
+
+        self.assertEqual(result.get_counts(), {'0': 1024})
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
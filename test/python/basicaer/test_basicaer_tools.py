@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the statevector kernels of the BasicAer simulators."""
+
+import unittest
+
+import numpy as np
+
+from qiskit.providers.basicaer import basicaertools
+from qiskit.providers.basicaer.basicaertools import (apply_matrix, measure_probabilities,
+                                                     einsum_vecmul_index)
+from qiskit.test import QiskitTestCase
+
+
+class TestStatevectorKernels(QiskitTestCase):
+    """Tests for apply_matrix and measure_probabilities."""
+
+    def setUp(self):
+        super().setUp()
+        self.rng = np.random.RandomState(1234)
+
+    def random_statevector(self, number_of_qubits):
+        """Return a random rank-N statevector tensor."""
+        size = 2 ** number_of_qubits
+        statevector = self.rng.randn(size) + 1j * self.rng.randn(size)
+        return np.reshape(statevector / np.linalg.norm(statevector), number_of_qubits * [2])
+
+    def random_matrix(self, number_of_gate_qubits):
+        """Return a random complex matrix."""
+        dimension = 2 ** number_of_gate_qubits
+        return self.rng.randn(dimension, dimension) + 1j * self.rng.randn(dimension, dimension)
+
+    def assert_applied(self, number_of_qubits, matrix, qubits):
+        """Assert apply_matrix computes the same statevector as einsum."""
+        statevector = self.random_statevector(number_of_qubits)
+        indexes = einsum_vecmul_index(qubits, number_of_qubits)
+        expected = np.einsum(indexes, np.reshape(matrix, 2 * len(qubits) * [2]), statevector)
+        apply_matrix(statevector, matrix, qubits)
+        self.assertTrue(np.allclose(statevector, expected))
+
+    def test_apply_matrix(self):
+        """Test 1- and 2-qubit matrices are applied in place."""
+        for number_of_qubits in range(1, 7):
+            for qubit in range(number_of_qubits):
+                self.assert_applied(number_of_qubits, self.random_matrix(1), [qubit])
+                for other in range(number_of_qubits):
+                    if other != qubit:
+                        self.assert_applied(number_of_qubits, self.random_matrix(2),
+                                            [qubit, other])
+
+    def test_apply_diagonal_matrix(self):
+        """Test diagonal matrices are applied to the subarrays in place."""
+        matrix = np.diag(np.exp(1j * self.rng.uniform(0, 2 * np.pi, 4)))
+        self.assert_applied(5, matrix, [3, 1])
+        self.assertIsNone(apply_matrix(self.random_statevector(5), matrix, [3, 1]))
+
+    def test_apply_matrix_in_blocks(self):
+        """Test matrices are applied by blocks smaller than the statevector."""
+        block_size = basicaertools._BLOCK_SIZE
+        try:
+            basicaertools._BLOCK_SIZE = 4
+            for qubits in ([0], [5], [0, 1], [6, 0], [2, 4]):
+                self.assert_applied(7, self.random_matrix(len(qubits)), qubits)
+            scratch = apply_matrix(self.random_statevector(7), self.random_matrix(2), [2, 4])
+            self.assertLess(scratch.size, 2 ** 7)
+        finally:
+            basicaertools._BLOCK_SIZE = block_size
+
+    def test_measure_probabilities(self):
+        """Test the probabilities of the outcomes of measuring qubits."""
+        statevector = self.random_statevector(5)
+        qubits = [0, 2, 3]
+        probabilities = measure_probabilities(statevector, qubits)
+        flat = np.abs(np.reshape(statevector, 2 ** 5)) ** 2
+        for outcome in range(2 ** len(qubits)):
+            expected = sum(flat[index] for index in range(2 ** 5)
+                           if all((index >> qubit) & 1 == (outcome >> position) & 1
+                                  for position, qubit in enumerate(qubits)))
+            self.assertAlmostEqual(probabilities[outcome], expected)
+
+    def test_measure_probabilities_all_qubits(self):
+        """Test the probabilities of measuring all the qubits of a wide statevector."""
+        statevector = self.random_statevector(20)
+        probabilities = measure_probabilities(statevector, list(range(20)))
+        flat = np.abs(np.reshape(statevector, 2 ** 20)) ** 2
+        self.assertTrue(np.allclose(probabilities, flat))
+
+
+if __name__ == '__main__':
+    unittest.main()
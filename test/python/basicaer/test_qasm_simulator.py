@@ -15,13 +15,16 @@
 """Test QASM simulator."""
 
 import unittest
+from unittest.mock import patch
+from collections import Counter
 
 import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile, assemble
-from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import QasmSimulatorPy, BasicAerError
+from qiskit.providers.basicaer.basicaertools import compile_instructions, FusedGate
 from qiskit.test import Path
 from qiskit.test import providers
 
@@ -93,11 +96,107 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         self.assertEqual(counts_if_true, {'111': 100})
         self.assertEqual(counts_if_false, {'001': 100})
 
+    def test_conditional_gates_not_fused(self):
+        """Test conditional gates stop the fusion of the gates on their qubits."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[1], cr[0])
+        circuit.x(qr[0]).c_if(cr, 1)
+        circuit.h(qr[0])
+        circuit.h(qr[1])
+
+        circuit = transpile(circuit, backend=self.backend)
+        instructions = assemble(circuit).experiments[0].instructions
+        stream = compile_instructions(instructions)
+        self.assertEqual([None if isinstance(op, FusedGate) else op.name for op in stream],
+                         [None, 'measure', 'bfunc', None, None, None])
+        self.assertEqual([op.qubits for op in stream if isinstance(op, FusedGate)],
+                         [(0, 1), (0,), (0,), (1,)])
+        self.assertIsNotNone(stream[3].conditional)
+
+        result = execute(circuit, backend=self.backend, shots=100,
+                         seed_simulator=self.seed).result()
+        self.assertEqual(sum(result.get_counts().values()), 100)
+
+    def test_shot_branching(self):
+        """Test the shots of a dynamic circuit are simulated in branches."""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.reset(qr[0])
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[1])
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[2])
+
+        shots = 4000
+        qobj = assemble(transpile(circuit, backend=self.backend), shots=shots, memory=True,
+                        seed_simulator=self.seed)
+        add_unitary = QasmSimulatorPy._add_unitary
+        with patch.object(QasmSimulatorPy, '_add_unitary', side_effect=add_unitary,
+                          autospec=True) as mock_add_unitary:
+            # Run in this process to count the gates applied
+            result = self.backend._run_job('test', qobj)  # pylint: disable=protected-access
+        # Each h gate is applied once per branch
+        self.assertEqual(mock_add_unitary.call_count, 1 + 2 + 4)
+
+        counts = result.get_counts()
+        memory = result.get_memory()
+        self.assertLess(result.results[0].time_taken, result.time_taken + 1)
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(dict(Counter(memory)), counts)
+        # the memory is not grouped by branch
+        self.assertLess(sum(first == second for first, second in zip(memory, memory[1:])),
+                        shots / 2)
+        target = {format(value, '03b'): shots / 8 for value in range(8)}
+        self.assertDictAlmostEqual(counts, target, 0.04 * shots)
+
+    def test_parallel_experiments(self):
+        """Test experiments run in parallel give the results of serial runs."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuits = []
+        for index in range(6):
+            circuit = QuantumCircuit(qr, cr, name='circuit{}'.format(index))
+            circuit.rx(0.3 * (index + 1), qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuit.measure(qr[0], cr[0])
+            circuit.x(qr[2]).c_if(cr, 1)
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        qobj = assemble(transpile(circuits, backend=self.backend), shots=500)
+        for index, experiment in enumerate(qobj.experiments):
+            experiment.config.seed_simulator = self.seed + index
+
+        results = []
+        for max_parallel_experiments in (1, 3, 0):
+            results.append(self.backend.run(qobj, backend_options={
+                'max_parallel_experiments': max_parallel_experiments}).result())
+        for result in results[1:]:
+            self.assertEqual([res.header.name for res in result.results],
+                             [circuit.name for circuit in circuits])
+            self.assertEqual([res.seed_simulator for res in result.results],
+                             [self.seed + index for index in range(len(circuits))])
+            self.assertEqual([result.get_counts(circuit) for circuit in circuits],
+                             [results[0].get_counts(circuit) for circuit in circuits])
+            for res in result.results:
+                self.assertGreater(res.time_taken, 0)
+
+    def test_invalid_max_parallel_experiments(self):
+        """Test a negative number of parallel experiments is rejected."""
+        with self.assertRaises(BasicAerError):
+            self.backend.run(self.qobj, backend_options={'max_parallel_experiments': -1})
+
     def test_teleport(self):
         """Test teleportation as in tutorials"""
         self.log.info('test_teleport')
         pi = np.pi
-        shots = 2000
+        shots = 20000
         qr = QuantumRegister(3, 'qr')
         cr0 = ClassicalRegister(1, 'cr0')
         cr1 = ClassicalRegister(1, 'cr1')
@@ -160,6 +259,44 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         for mem in memory:
             self.assertIn(mem, ['10 00', '10 11'])
 
+    def test_sampled_memory_and_counts(self):
+        """Test sampled measurements give memory consistent with the counts."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(4, 'cr')
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[2])
+        circ.h(qr[1])
+        circ.measure(qr[2], cr[0])
+        circ.measure(qr[1], cr[3])
+        circ.measure(qr[0], cr[1])
+        circ.measure(qr[0], cr[2])
+
+        shots = 2000
+        result = execute(circ, backend=self.backend, shots=shots, memory=True,
+                         seed_simulator=self.seed).result()
+        memory = result.get_memory()
+        counts = result.get_counts()
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(dict(Counter(memory)), counts)
+        self.assertEqual(set(counts), {'0000', '0111', '1000', '1111'})
+
+    def test_sampled_memory_wider_than_int64(self):
+        """Test sampled measurements into classical bits beyond the 64th."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(70, 'cr')
+        circ = QuantumCircuit(qr, cr)
+        circ.x(qr[0])
+        circ.h(qr[1])
+        circ.measure(qr[0], cr[69])
+        circ.measure(qr[1], cr[0])
+
+        result = execute(circ, backend=self.backend, shots=100,
+                         seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'1' + '0' * 69, '1' + '0' * 68 + '1'})
+        self.assertEqual(sum(counts.values()), 100)
+
 
 if __name__ == '__main__':
     unittest.main()
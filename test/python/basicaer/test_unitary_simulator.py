@@ -20,7 +20,10 @@ import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.compiler import assemble
 from qiskit.providers.basicaer import UnitarySimulatorPy
+from qiskit.providers.basicaer.basicaertools import compile_instructions, FusedGate
+from qiskit.quantum_info import Operator
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 
@@ -42,6 +45,33 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
         for norm in norms:
             self.assertAlmostEqual(norm, 8)
 
+    def test_fused_gates(self):
+        """Test the unitary of circuits whose gates are fused."""
+        rng = np.random.RandomState(12)
+        qr = QuantumRegister(4)
+        circuit = QuantumCircuit(qr)
+        for _ in range(60):
+            qubits = [qr[int(qubit)] for qubit in rng.choice(4, size=2, replace=False)]
+            kind = rng.randint(4)
+            if kind == 0:
+                circuit.cx(qubits[0], qubits[1])
+            elif kind == 1:
+                circuit.u3(*rng.uniform(0, 2 * np.pi, 3), qubits[0])
+            elif kind == 2:
+                circuit.u1(rng.uniform(0, 2 * np.pi), qubits[0])
+            else:
+                circuit.cx(qubits[0], qubits[1])
+                circuit.cx(qubits[1], qubits[0])
+            circuit.iden(qubits[1])
+
+        instructions = assemble(circuit).experiments[0].instructions
+        stream = compile_instructions(instructions)
+        self.assertTrue(all(isinstance(gate, FusedGate) for gate in stream))
+        self.assertLess(len(stream), len(instructions))
+
+        result = execute(circuit, backend=self.backend).result()
+        self.assertTrue(np.allclose(result.get_unitary(circuit), Operator(circuit).data))
+
     def _test_circuits(self):
         """Return test circuits for unitary simulator"""
         qr = QuantumRegister(3)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the binary serialization of QuantumCircuit."""
+
+import io
+import os
+import tempfile
+
+import numpy as np
+
+import qiskit.extensions.simulator  # pylint: disable=unused-import
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter, dump_circuits, load_circuits, CircuitBatchFile
+from qiskit.circuit.serialization import FORMAT_VERSION
+from qiskit.exceptions import QiskitError
+from qiskit.test import QiskitTestCase
+
+
+def _dumps(circuits, allow_pickle=False):
+    buffer = io.BytesIO()
+    dump_circuits(circuits, buffer, allow_pickle=allow_pickle)
+    return buffer.getvalue()
+
+
+class TestCircuitSerialization(QiskitTestCase):
+    """Tests for dump_circuits, load_circuits and CircuitBatchFile."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'q')
+        cr = ClassicalRegister(3, 'c')
+        cr2 = ClassicalRegister(2, 'd')
+        self.circuit = QuantumCircuit(qr, cr, cr2, name='test')
+        self.circuit.h(qr[0])
+        self.circuit.u3(0.1, 2, -0.3, qr[1])
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.ccx(qr[2], qr[0], qr[1])
+        self.circuit.barrier()
+        self.circuit.measure(qr, cr)
+        self.circuit.x(qr[0]).c_if(cr, 5)
+        self.circuit.u1(0.5, qr[2]).c_if(cr2, 3)
+        self.circuit.reset(qr[1])
+        self.circuit.measure(qr[0], cr2[1])
+
+    def test_round_trip(self):
+        """Test a circuit is read back as written."""
+        loaded = load_circuits(_dumps(self.circuit))
+        self.assertIsInstance(loaded, QuantumCircuit)
+        self.assertEqual(loaded, self.circuit)
+        self.assertEqual(loaded.name, 'test')
+        self.assertEqual(loaded.qregs, self.circuit.qregs)
+        self.assertEqual(loaded.cregs, self.circuit.cregs)
+        self.assertEqual(loaded.qasm(), self.circuit.qasm())
+
+    def test_round_trip_file(self):
+        """Test reading circuits from a file object."""
+        buffer = io.BytesIO(_dumps([self.circuit, self.circuit]))
+        loaded = load_circuits(buffer)
+        self.assertEqual(loaded, [self.circuit, self.circuit])
+
+    def test_instructions_are_independent(self):
+        """Test instructions sharing an opcode are distinct objects."""
+        qr = QuantumRegister(1, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.rz(0.1, qr[0])
+        circuit.rz(0.2, qr[0])
+        loaded = load_circuits(_dumps(circuit))
+        loaded.data[0][0].params[0] = 0.3
+        self.assertEqual(loaded.data[1][0].params, [0.2])
+        self.assertEqual(loaded.data[0][0].definition[0][0].params, [0.3])
+
+    def test_parameters(self):
+        """Test standard gates with Parameter params are written without pickle."""
+        qr = QuantumRegister(2, 'q')
+        theta = Parameter('theta')
+        phi = Parameter('phi')
+        circuit = QuantumCircuit(qr)
+        circuit.rz(theta, qr[0])
+        circuit.u3(0.1, theta, phi, qr[1])
+        circuit.cu1(phi, qr[0], qr[1])
+        loaded = load_circuits(_dumps(circuit))
+        self.assertEqual(loaded.qasm(), circuit.qasm())
+        parameters = {parameter.name: parameter for parameter in loaded.parameters}
+        self.assertEqual(set(parameters), {'theta', 'phi'})
+        self.assertEqual(loaded.bind_parameters({parameters['theta']: 0.4,
+                                                 parameters['phi']: 0.5}),
+                         circuit.bind_parameters({theta: 0.4, phi: 0.5}))
+
+    def test_pickled_instructions(self):
+        """Test other instructions are only written and read with allow_pickle."""
+        qr = QuantumRegister(2, 'q')
+        theta = Parameter('theta')
+        circuit = QuantumCircuit(qr)
+        circuit.initialize([1 / np.sqrt(2), 1j / np.sqrt(2)], [qr[0]])
+        circuit.snapshot('label')
+        circuit.rz(theta, qr[0])
+        with self.assertRaises(QiskitError):
+            _dumps(circuit)
+        data = _dumps(circuit, allow_pickle=True)
+        with self.assertRaises(QiskitError):
+            load_circuits(data)
+        loaded = load_circuits(data, allow_pickle=True)
+        self.assertEqual(loaded.qasm(), circuit.qasm())
+        self.assertEqual(len(loaded.parameters), 1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'circuits.bin')
+            with open(path, 'wb') as file_obj:
+                file_obj.write(data)
+            with CircuitBatchFile(path) as batch:
+                with self.assertRaises(QiskitError):
+                    batch[0]  # pylint: disable=pointless-statement
+            with CircuitBatchFile(path, allow_pickle=True) as batch:
+                self.assertEqual(batch[0].qasm(), circuit.qasm())
+
+    def test_custom_instruction(self):
+        """Test an instruction defined by a circuit, pickled."""
+        qr = QuantumRegister(2, 'q')
+        sub_circuit = QuantumCircuit(qr, name='sub')
+        sub_circuit.h(qr[0])
+        sub_circuit.cx(qr[0], qr[1])
+        circuit = QuantumCircuit(qr)
+        circuit.append(sub_circuit.to_instruction(), [qr[0], qr[1]])
+        circuit.append(sub_circuit.to_instruction(), [qr[1], qr[0]])
+        loaded = load_circuits(_dumps(circuit, allow_pickle=True), allow_pickle=True)
+        self.assertEqual(loaded, circuit)
+        self.assertEqual(loaded.decompose(), circuit.decompose())
+
+    def test_unknown_instruction_class(self):
+        """Test an opcode of a class that is not a standard gate is rejected."""
+        qr = QuantumRegister(1, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        class_path = b'qiskit.extensions.standard.h.HGate'
+        data = _dumps(circuit)
+        self.assertIn(class_path, data)
+        data = data.replace(class_path, b'subprocess.Popen'.ljust(len(class_path), b'_'))
+        with self.assertRaises(QiskitError):
+            load_circuits(data)
+
+    def test_batch_file(self):
+        """Test reading circuits on demand from a memory-mapped file."""
+        circuits = []
+        for index in range(5):
+            circuit = self.circuit.copy(name='circuit{}'.format(index))
+            circuit.rx(0.1 * index, circuit.qregs[0][0])
+            circuits.append(circuit)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'circuits.bin')
+            with open(path, 'wb') as file_obj:
+                dump_circuits(iter(circuits), file_obj)
+            with CircuitBatchFile(path) as batch:
+                self.assertEqual(len(batch), 5)
+                self.assertEqual(batch[3], circuits[3])
+                self.assertEqual(batch[-1].name, 'circuit4')
+                self.assertEqual(list(batch), circuits)
+                with self.assertRaises(IndexError):
+                    batch[5]  # pylint: disable=pointless-statement
+
+    def test_invalid_data(self):
+        """Test reading data that does not hold circuits raises."""
+        with self.assertRaises(QiskitError):
+            load_circuits(b'not circuits at all, really not')
+        data = bytearray(_dumps(self.circuit))
+        data[6:8] = (FORMAT_VERSION + 1).to_bytes(2, 'little')
+        with self.assertRaises(QiskitError):
+            load_circuits(bytes(data))
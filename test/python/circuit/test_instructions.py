@@ -16,6 +16,8 @@
 
 import unittest
 
+import numpy
+
 from qiskit.circuit import Gate
 from qiskit.circuit import Parameter
 from qiskit.circuit import Instruction
@@ -70,6 +72,17 @@ class TestInstructions(QiskitTestCase):
         self.assertNotEqual(Instruction('u', 1, 0, [0.3, phi, 0.4]),
                             Instruction('u', 1, 0, [theta, phi, 0.5]))
 
+    def test_numeric_params(self):
+        """Test numeric params are stored as Python numbers."""
+        theta = Parameter('theta')
+        instruction = Instruction('u', 1, 0, [1, 0.5, numpy.float32(0.25), 1j, theta])
+
+        self.assertEqual(instruction.params, [1, 0.5, 0.25, 1j, theta])
+        self.assertEqual([type(param) for param in instruction.params],
+                         [int, float, float, complex, Parameter])
+        self.assertEqual(instruction.qasm(), 'u(1,0.500000000000000,0.250000000000000,'
+                                             '1.0*I,theta)')
+
     def circuit_instruction_circuit_roundtrip(self):
         """test converting between circuit and instruction and back
         preserves the circuit"""
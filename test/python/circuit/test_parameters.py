@@ -129,6 +129,63 @@ class TestParameters(QiskitTestCase):
             self.assertEqual(qobj.experiments[index].instructions[0].params[0],
                              theta_i)
 
+    def test_bind_parameters_batch(self):
+        """Test binding rows of values into a circuit per row."""
+        theta = Parameter('theta')
+        phi = Parameter('phi')
+        qr = QuantumRegister(2)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr)
+        qc.cx(qr[0], qr[1])
+        qc.u3(phi, theta, 0.3, qr[1])
+        values = numpy.array([[0.1, 0.2], [0.3, 0.4]])
+        circuits = qc.bind_parameters_batch(values, [theta, phi])
+
+        self.assertEqual(len(circuits), 2)
+        for circuit, (theta_i, phi_i) in zip(circuits, values):
+            self.assertEqual(circuit, qc.bind_parameters({theta: theta_i, phi: phi_i}))
+            self.assertEqual(circuit.parameters, set())
+            self.assertIs(circuit.data[2][0], qc.data[2][0])
+        self.assertEqual(qc.parameters, {theta, phi})
+
+    def test_bind_parameters_batch_default_order(self):
+        """Test the columns default to the parameters sorted by name."""
+        theta = Parameter('theta')
+        phi = Parameter('phi')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr)
+        qc.rz(phi, qr)
+        circuit = qc.bind_parameters_batch([[0.1, 0.2]])[0]
+
+        self.assertEqual(circuit, qc.bind_parameters({phi: 0.1, theta: 0.2}))
+
+    def test_bind_parameters_batch_partial(self):
+        """Test the parameters not in the columns stay in the bound circuits."""
+        theta = Parameter('theta')
+        phi = Parameter('phi')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.u3(theta, phi, 0.3, qr)
+        circuits = qc.bind_parameters_batch([[0.1], [0.2]], [theta])
+
+        for circuit, theta_i in zip(circuits, [0.1, 0.2]):
+            self.assertEqual(circuit.parameters, {phi})
+            self.assertEqual(circuit.bind_parameters({phi: 0.5}),
+                             qc.bind_parameters({theta: theta_i, phi: 0.5}))
+
+    def test_bind_parameters_batch_raises(self):
+        """Test the batch binding raises on unknown parameters and wrong rows."""
+        theta = Parameter('theta')
+        qr = QuantumRegister(1)
+        qc = QuantumCircuit(qr)
+        qc.rx(theta, qr)
+
+        with self.assertRaises(QiskitError):
+            qc.bind_parameters_batch([[0.1]], [Parameter('phi')])
+        with self.assertRaises(QiskitError):
+            qc.bind_parameters_batch([[0.1, 0.2]])
+
     def test_circuit_composition(self):
         """Test preservation of parameters when combining circuits."""
         theta = Parameter('θ')
@@ -23,7 +23,7 @@ from qiskit.circuit import Instruction, Parameter
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.compiler.assemble import assemble
 from qiskit.exceptions import QiskitError
-from qiskit.qobj import QasmQobj
+from qiskit.qobj import QasmQobj, validate_qobj_against_schema
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeOpenPulse2Q
 
@@ -182,6 +182,60 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertTrue(hasattr(h_op, 'conditional'))
         self.assertEqual(bfunc_op.register, h_op.conditional)
 
+    def test_value_wider_than_register(self):
+        """Verify the bits of a conditional value beyond its register are dropped."""
+        qr = QuantumRegister(1)
+        cr1 = ClassicalRegister(1)
+        cr2 = ClassicalRegister(2)
+        qc = QuantumCircuit(qr, cr1, cr2)
+
+        qc.h(qr[0]).c_if(cr2, 7)
+
+        qobj = assemble(qc)
+
+        bfunc_op, _ = qobj.experiments[0].instructions
+
+        self.assertEqual(bfunc_op.mask, '0x6')
+        self.assertEqual(bfunc_op.val, '0x6')
+
+    def test_bit_indices_across_registers(self):
+        """Verify bits of several registers are indexed in register order."""
+        qr1 = QuantumRegister(2, 'qr1')
+        qr2 = QuantumRegister(3, 'qr2')
+        cr1 = ClassicalRegister(2, 'cr1')
+        cr2 = ClassicalRegister(3, 'cr2')
+        qc = QuantumCircuit(qr1, qr2, cr1, cr2)
+        qc.cx(qr2[2], qr1[1])
+        qc.measure(qr2[1], cr2[2])
+        qc.measure(qr1[0], cr1[1])
+        small = QuantumCircuit(qr1, cr1)
+        small.measure(qr1[1], cr1[0])
+
+        qobj = assemble([qc, small])
+
+        cx_op, measure_op1, measure_op2 = qobj.experiments[0].instructions
+        self.assertEqual(cx_op.qubits, [4, 1])
+        self.assertEqual((measure_op1.qubits, measure_op1.memory), ([3], [4]))
+        self.assertEqual((measure_op2.qubits, measure_op2.memory), ([0], [1]))
+        measure_op3, = qobj.experiments[1].instructions
+        self.assertEqual((measure_op3.qubits, measure_op3.memory), ([1], [0]))
+        self.assertEqual((qobj.config.n_qubits, qobj.config.memory_slots), (5, 5))
+
+    def test_assembled_qobj_validates(self):
+        """Verify the qobj built without validating its models validates in bulk."""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        qc = QuantumCircuit(qr, cr)
+        qc.u3(0.1, 0.2, 0.3, qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.measure(qr, cr)
+        qc.x(qr[0]).c_if(cr, 1)
+
+        qobj = assemble(qc)
+
+        qobj._validate()
+        validate_qobj_against_schema(qobj)
+
     def test_assemble_circuits_raises_for_bind_circuit_mismatch(self):
         """Verify assemble_circuits raises error for parameterized circuits without matching
         binds."""
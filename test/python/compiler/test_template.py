@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the CircuitTemplate of parameterized circuits."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import assemble, transpile, CircuitTemplate
+from qiskit.exceptions import QiskitError
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeMelbourne
+
+
+class TestCircuitTemplate(QiskitTestCase):
+    """Tests for CircuitTemplate."""
+
+    def setUp(self):
+        self.theta = Parameter('theta')
+        self.phi = Parameter('phi')
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        self.circuit = QuantumCircuit(qr, cr, name='ansatz')
+        self.circuit.ry(self.theta, qr)
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.cx(qr[1], qr[2])
+        self.circuit.rz(self.phi, qr[2])
+        self.circuit.u3(self.theta, self.phi, 0.3, qr[1])
+        self.circuit.measure(qr, cr)
+        self.backend = FakeMelbourne()
+        self.transpiled = transpile(self.circuit, self.backend, seed_transpiler=42,
+                                    optimization_level=1)
+        self.template = CircuitTemplate(self.transpiled)
+        self.values = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
+    def test_parameters(self):
+        """The template parameters are sorted by name."""
+        self.assertEqual(self.template.parameters, [self.phi, self.theta])
+
+    def test_bind(self):
+        """Bound circuits are the transpiled circuit with bound parameters."""
+        circuits = self.template.bind(self.values)
+
+        self.assertEqual(len(circuits), 3)
+        for circuit, (phi, theta) in zip(circuits, self.values):
+            expected = self.transpiled.bind_parameters({self.phi: phi, self.theta: theta})
+            self.assertEqual(circuit, expected)
+            self.assertEqual(circuit.parameters, set())
+        self.assertEqual(self.transpiled.parameters, {self.phi, self.theta})
+
+    def test_bind_dict(self):
+        """Binds can be given as dicts."""
+        circuits = self.template.bind([{self.theta: 0.2, self.phi: 0.1}])
+
+        self.assertEqual(circuits, self.template.bind([[0.1, 0.2]]))
+
+    def test_bind_broadcast_instruction(self):
+        """An instruction applied to several qubits is bound once per circuit."""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.rz(self.theta, qr)
+        template = CircuitTemplate(circuit)
+        bound = template.bind([[0.5], [0.7]])
+
+        self.assertEqual(len({id(inst) for inst, _, _ in bound[0].data}), 1)
+        self.assertEqual([inst.params for inst, _, _ in bound[1].data], [[0.7]] * 3)
+        self.assertEqual([inst.params for inst, _, _ in circuit.data], [[self.theta]] * 3)
+
+    def test_bind_wrong_values(self):
+        """Binds must give a value to every parameter."""
+        with self.assertRaises(QiskitError):
+            self.template.bind([[0.1]])
+        with self.assertRaises(QiskitError):
+            self.template.bind([{self.theta: 0.1}])
+
+    def test_assemble(self):
+        """The template assembles like the circuit with parameter_binds."""
+        qobj = self.template.assemble(self.values, backend=self.backend, shots=100,
+                                      qobj_id='template')
+        binds = [{self.phi: phi, self.theta: theta} for phi, theta in self.values]
+        expected = assemble(self.transpiled, self.backend, shots=100, qobj_id='template',
+                            parameter_binds=binds)
+
+        self.assertEqual(qobj.to_dict(), expected.to_dict())
+
+    def test_assemble_conditional(self):
+        """Parameterized instructions are found in experiments with conditionals."""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.u1(self.theta, qr[0]).c_if(cr, 1)
+        circuit.u1(self.theta, qr[0])
+        qobj = CircuitTemplate(circuit).assemble([[0.5]], qobj_id='template')
+        expected = assemble(circuit, qobj_id='template', parameter_binds=[{self.theta: 0.5}])
+
+        self.assertEqual(qobj.to_dict(), expected.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
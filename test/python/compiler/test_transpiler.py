@@ -14,8 +14,10 @@
 
 """Tests basic functionality of the transpile function"""
 
+import importlib
 import math
 import unittest
+import unittest.mock
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import BasicAer
@@ -380,6 +382,24 @@ class TestTranspile(QiskitTestCase):
         circuits = transpile(circuits, backend)
         self.assertIsInstance(circuits[0], QuantumCircuit)
 
+    def test_transpile_circuits_shared_config(self):
+        """Circuits transpiled with the same options send a single TranspileConfig.
+        """
+        backend = FakeRueschlikon()
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+
+        transpile_module = importlib.import_module('qiskit.compiler.transpile')
+        with unittest.mock.patch.object(transpile_module, 'parallel_map',
+                                        side_effect=transpile_module.parallel_map) as mock:
+            circuits = transpile([circuit] * 4, backend, seed_transpiler=[1, 1, 1, 2])
+
+        (_, values), kwargs = mock.call_args
+        self.assertEqual([config_index for _, config_index in values], [0, 0, 0, 1])
+        self.assertEqual(len(kwargs['task_args'][0]), 2)
+        self.assertEqual(circuits[0], circuits[1])
+
     def test_wrong_initial_layout(self):
         """Test transpile with a bad initial layout.
         """
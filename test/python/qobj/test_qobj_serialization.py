@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the streaming serialization of Qobj."""
+
+import copy
+import io
+import json
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, pulse
+from qiskit.assembler.disassemble import disassemble
+from qiskit.compiler import assemble
+from qiskit.exceptions import QiskitError
+from qiskit.qobj import (PulseQobj, QasmQobj, QasmQobjExperiment,
+                         dump_qobj, load_qobj, stream_qobj)
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeOpenPulse2Q
+
+
+class TestQobjSerialization(QiskitTestCase):
+    """Tests for dump_qobj, load_qobj and stream_qobj."""
+
+    def setUp(self):
+        qr = QuantumRegister(2, 'q')
+        cr = ClassicalRegister(2, 'c')
+        self.circuits = []
+        for index in range(5):
+            circ = QuantumCircuit(qr, cr, name='circ{}'.format(index))
+            circ.h(qr[0])
+            circ.u3(0.1 * index, 0.2, 0.3, qr[1])
+            circ.cx(qr[0], qr[1])
+            circ.measure(qr[0], cr[0])
+            circ.x(qr[1]).c_if(cr, 1)
+            circ.measure(qr[1], cr[1])
+            self.circuits.append(circ)
+        self.qobj = assemble(self.circuits, shots=100, memory=True, seed=42)
+
+    def test_qasm_round_trip(self):
+        """Test a QasmQobj is read back as written."""
+        buffer = io.StringIO()
+        self.assertEqual(dump_qobj(self.qobj, buffer), 5)
+        buffer.seek(0)
+        qobj = load_qobj(buffer)
+        self.assertIsInstance(qobj, QasmQobj)
+        self.assertEqual(qobj.to_dict(), self.qobj.to_dict())
+
+    def test_round_trip_disassemble(self):
+        """Test the read Qobj disassembles to the same circuits and config."""
+        buffer = io.StringIO()
+        dump_qobj(self.qobj, buffer)
+        buffer.seek(0)
+        circuits, run_config, headers = disassemble(load_qobj(buffer))
+        expected_circuits, expected_run_config, expected_headers = disassemble(self.qobj)
+        self.assertEqual(circuits, expected_circuits)
+        self.assertEqual(run_config, expected_run_config)
+        self.assertEqual(headers, expected_headers)
+
+    def test_complex_params_round_trip(self):
+        """Test complex instruction params are read back as complex and disassembled."""
+        qr = QuantumRegister(2, 'q')
+        circ = QuantumCircuit(qr, name='init')
+        circ.initialize([1 / np.sqrt(2), 1j / np.sqrt(2), 0, 0], qr)
+        qobj = assemble(circ)
+        buffer = io.StringIO()
+        dump_qobj(qobj, buffer)
+        buffer.seek(0)
+        read_qobj = load_qobj(buffer)
+        self.assertEqual(read_qobj.experiments[0].instructions[0].params,
+                         [1 / np.sqrt(2), 1j / np.sqrt(2), 0, 0])
+        self.assertEqual(read_qobj.to_dict(), qobj.to_dict())
+        circuits, _, _ = disassemble(read_qobj)
+        expected_circuits, _, _ = disassemble(qobj)
+        self.assertEqual(circuits, expected_circuits)
+
+    def test_one_experiment_per_line(self):
+        """Test the Qobj is written as a line for the Qobj and a line per experiment."""
+        buffer = io.StringIO()
+        dump_qobj(self.qobj, buffer)
+        lines = buffer.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(json.loads(lines[0])['experiments'], [])
+        for line, experiment in zip(lines[1:], self.qobj.experiments):
+            self.assertEqual(json.loads(line), experiment.to_dict())
+
+    def test_stream_experiments(self):
+        """Test writing experiments from a generator and reading them one at a time."""
+        experiments = self.qobj.experiments
+        shell = copy.copy(self.qobj)
+        shell.experiments = []
+        buffer = io.StringIO()
+        dump_qobj(shell, buffer, experiments=(experiment for experiment in experiments))
+        buffer.seek(0)
+
+        qobj, read_experiments = stream_qobj(buffer)
+        self.assertEqual(qobj.experiments, [])
+        self.assertEqual(qobj.qobj_id, self.qobj.qobj_id)
+        for read_experiment, experiment in zip(read_experiments, experiments):
+            self.assertIsInstance(read_experiment, QasmQobjExperiment)
+            self.assertEqual(read_experiment.to_dict(), experiment.to_dict())
+        self.assertEqual(list(read_experiments), [])
+
+    def test_pulse_round_trip(self):
+        """Test a PulseQobj is read back as written."""
+        device = pulse.DeviceSpecification.create_from(FakeOpenPulse2Q())
+        test_pulse = pulse.SamplePulse(samples=np.array([0.02, 0.05j, 0.05], dtype=np.complex128))
+        schedule = pulse.Schedule(name='fake_experiment')
+        schedule = schedule.insert(0, test_pulse(device.q[0].drive))
+        schedule = schedule.insert(5, pulse.Acquire(5)(device.q, device.mem))
+        pulse_qobj = assemble([schedule, schedule], qubit_lo_freq=[4.9, 5.0],
+                              meas_lo_freq=[6.5, 6.6], meas_level=1, memory_slots=2,
+                              memory_slot_size=100, meas_return='avg', rep_time=100)
+        buffer = io.StringIO()
+        dump_qobj(pulse_qobj, buffer)
+        buffer.seek(0)
+        qobj = load_qobj(buffer)
+        self.assertIsInstance(qobj, PulseQobj)
+        self.assertEqual(qobj.to_dict(), pulse_qobj.to_dict())
+
+    def test_not_a_qobj(self):
+        """Test reading a file that does not hold a Qobj raises."""
+        with self.assertRaises(QiskitError):
+            load_qobj(io.StringIO('{"qobj_id": "1"}\n'))
+        with self.assertRaises(QiskitError):
+            load_qobj(io.StringIO(''))
@@ -15,7 +15,9 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
+import unittest.mock
 
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit import QuantumRegister
@@ -29,7 +31,7 @@ from qiskit.extensions.standard.cx import CnotGate
 from qiskit.extensions.standard.x import XGate
 from qiskit.extensions.standard.barrier import Barrier
 from qiskit.dagcircuit.exceptions import DAGCircuitError
-from qiskit.converters import circuit_to_dag
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.test import QiskitTestCase
 
 
@@ -81,6 +83,10 @@ class TestDagRegisters(QiskitTestCase):
         cr = ClassicalRegister(2)
         self.assertRaises(DAGCircuitError, dag.add_qreg, cr)
 
+    def test_unknown_storage(self):
+        """Creating a DAGCircuit with an unknown storage engine is not allowed."""
+        self.assertRaises(DAGCircuitError, DAGCircuit, storage='nosuchstorage')
+
     def test_rename_register(self):
         """The rename_register() method. """
         dag = DAGCircuit()
@@ -119,6 +125,19 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(len(list(self.dag.nodes())), 16)
         self.assertEqual(len(list(self.dag.edges())), 17)
 
+    def test_changed_wires(self):
+        """Adding and removing nodes marks their wires as changed."""
+        self.dag.changed_wires.clear()
+        self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        x_node = self.dag.apply_operation_back(XGate(), [self.qubit2], [],
+                                               condition=self.condition)
+        self.assertEqual(self.dag.changed_wires,
+                         {self.qubit0, self.qubit2, self.clbit0, self.clbit1})
+
+        self.dag.changed_wires.clear()
+        self.dag.remove_op_node(x_node)
+        self.assertEqual(self.dag.changed_wires, {self.qubit2, self.clbit0, self.clbit1})
+
     def test_apply_operation_front(self):
         """The apply_operation_front() method"""
         self.dag.apply_operation_back(HGate(), [self.qubit0], [])
@@ -326,6 +345,47 @@ class TestDagOperations(QiskitTestCase):
 
         self.assertEqual(node_names, ['cx', 'h', 'cx'])
 
+    def test_dag_nodes_on_wire_after_removal(self):
+        """Test that nodes_on_wire follows the wire after nodes are removed and substituted."""
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        h_node = self.dag.apply_operation_back(HGate(), [self.qubit1], [])
+        cx_node = self.dag.apply_operation_back(CnotGate(), [self.qubit1, self.qubit2], [])
+        self.dag.apply_operation_back(XGate(), [self.qubit1], [])
+
+        self.dag.remove_op_node(h_node)
+        flipped_cx = DAGCircuit()
+        v = QuantumRegister(2, "v")
+        flipped_cx.add_qreg(v)
+        flipped_cx.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+        self.dag.substitute_node_with_dag(cx_node, flipped_cx, wires=[v[0], v[1]])
+
+        nodes = self.dag.nodes_on_wire(self.qubit1, only_ops=True)
+        self.assertEqual([nd.name for nd in nodes], ['cx', 'h', 'cx', 'x'])
+        nodes = self.dag.nodes_on_wire(self.qubit2)
+        self.assertEqual([nd.type for nd in nodes], ['in', 'op', 'out'])
+
+    def test_collect_runs(self):
+        """Test that collect_runs groups consecutive nodes on the same wires.
+
+        Only the first node of a run has to be unconditional.
+        """
+        self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit1, self.qubit0], [])
+        self.dag.apply_operation_back(HGate(), [self.qubit1], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit1, self.qubit2], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit1, self.qubit2], [],
+                                      condition=self.condition)
+
+        runs = self.dag.collect_runs(['cx'])
+        self.assertEqual({tuple(len(node.qargs) for node in run) for run in runs},
+                         {(2, 2, 2), (2, 2)})
+        self.assertEqual(sorted(len(run) for run in runs), [2, 3])
+        self.assertEqual([node.condition for node in min(runs, key=len)],
+                         [None, self.condition])
+
     def test_remove_op_node(self):
         """Test remove_op_node method."""
         self.dag.apply_operation_back(HGate(), [self.qubit0])
@@ -362,6 +422,81 @@ class TestDagOperations(QiskitTestCase):
         self.assertRaises(DAGCircuitError, self.dag.remove_op_node, in_node)
 
 
+class TestDagTopologicalOrder(QiskitTestCase):
+    """Test the cached topological order of the dag"""
+
+    def setUp(self):
+        self.dag = DAGCircuit()
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(2, 'cr')
+        self.dag.add_qreg(qreg)
+        self.dag.add_creg(creg)
+        self.qreg = qreg
+        self.creg = creg
+
+        self.dag.apply_operation_back(HGate(), [qreg[0]], [])
+        self.dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+        self.dag.apply_operation_back(XGate(), [qreg[2]], [], condition=(creg, 1))
+        self.dag.apply_operation_back(CnotGate(), [qreg[2], qreg[1]], [])
+        self.dag.apply_operation_back(Measure(), [qreg[1]], [creg[0]])
+        # Fill the cache
+        list(self.dag.topological_nodes())
+
+    def assertOrderIsSorted(self, dag):
+        """Assert the topological order of dag is the one of a fresh sort."""
+        fresh = copy.deepcopy(dag)
+        fresh._invalidate_topological_order()
+        self.assertEqual([node._node_id for node in dag.topological_nodes()],
+                         [node._node_id for node in fresh.topological_nodes()])
+
+    def test_cached_order_is_reused(self):
+        """Reading the topological order twice sorts the graph once."""
+        with unittest.mock.patch.object(self.dag._multi_graph, 'topological_sort') as sort:
+            list(self.dag.topological_op_nodes())
+            list(self.dag.topological_nodes())
+        sort.assert_not_called()
+
+    def test_apply_operation_back(self):
+        """The order is updated, not recomputed, after apply_operation_back()."""
+        self.dag.apply_operation_back(HGate(), [self.qreg[1]], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qreg[2], self.qreg[0]], [])
+        self.dag.apply_operation_back(XGate(), [self.qreg[0]], [], condition=(self.creg, 2))
+        with unittest.mock.patch.object(self.dag._multi_graph, 'topological_sort') as sort:
+            self.dag.apply_operation_back(Measure(), [self.qreg[2]], [self.creg[1]])
+            list(self.dag.topological_nodes())
+        sort.assert_not_called()
+        self.assertOrderIsSorted(self.dag)
+
+    def test_remove_last_op_node(self):
+        """The order is updated after removing the last node of its wires."""
+        measure = self.dag.named_nodes('measure')[0]
+        self.dag.remove_op_node(measure)
+        self.assertIsNotNone(self.dag._topological_order)
+        self.assertOrderIsSorted(self.dag)
+
+    def test_remove_op_node(self):
+        """The order is still sorted after removing a node in the middle."""
+        self.dag.remove_op_node(self.dag.named_nodes('x')[0])
+        self.assertOrderIsSorted(self.dag)
+
+    def test_substitute_node_with_dag(self):
+        """The order is still sorted after substituting nodes."""
+        flipped_cx_circuit = DAGCircuit()
+        v = QuantumRegister(2, "v")
+        flipped_cx_circuit.add_qreg(v)
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[1]], [])
+        flipped_cx_circuit.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx_circuit.apply_operation_back(HGate(), [v[1]], [])
+
+        self.dag.apply_operation_back(CnotGate(), [self.qreg[0], self.qreg[2]], [])
+        for cx_node in self.dag.named_nodes('cx'):
+            self.dag.substitute_node_with_dag(cx_node, copy.deepcopy(flipped_cx_circuit),
+                                              wires=[v[0], v[1]])
+            self.assertOrderIsSorted(self.dag)
+
+
 class TestDagLayers(QiskitTestCase):
     """Test finding layers on the dag"""
 
@@ -525,6 +660,68 @@ class TestDagEquivalence(QiskitTestCase):
 
         self.assertNotEqual(self.dag1, dag2)
 
+    def test_dag_neq_extra_wire(self):
+        """DAG equivalence check: False. Same gates, one more idle wire."""
+        circ2 = dag_to_circuit(self.dag1)
+        circ2.add_register(QuantumRegister(1, 'qr3'))
+        dag2 = circuit_to_dag(circ2)
+
+        self.assertNotEqual(self.dag1, dag2)
+        self.assertNotEqual(self.dag1.fingerprint(), dag2.fingerprint())
+
+    def test_dag_eq_barrier_qarg_order(self):
+        """DAG equivalence check: True. The qarg order of barriers does not matter."""
+        circ1 = QuantumCircuit(self.qr1)
+        circ1.barrier(self.qr1[0], self.qr1[1])
+        circ2 = QuantumCircuit(self.qr1)
+        circ2.barrier(self.qr1[1], self.qr1[0])
+        dag1, dag2 = circuit_to_dag(circ1), circuit_to_dag(circ2)
+
+        self.assertEqual(dag1, dag2)
+        self.assertEqual(dag1.fingerprint(), dag2.fingerprint())
+
+    def test_fingerprint_eq(self):
+        """Equal DAGs built in different orders have the same fingerprint."""
+        circ2 = QuantumCircuit(self.qr1, self.qr2)
+        circ2.cx(self.qr1[2], self.qr1[3])
+        circ2.u2(0.1, 0.2, self.qr1[3])
+        circ2.h(self.qr1[0])
+        circ2.h(self.qr1[2])
+        circ2.t(self.qr1[2])
+        circ2.ch(self.qr1[2], self.qr1[1])
+        circ2.ccx(self.qr2[0], self.qr2[1], self.qr1[0])
+        dag2 = circuit_to_dag(circ2)
+
+        self.assertEqual(self.dag1.fingerprint(), dag2.fingerprint())
+        self.assertEqual(self.dag1.fingerprint(), copy.deepcopy(self.dag1).fingerprint())
+
+    def test_fingerprint_neq(self):
+        """DAGs with a different gate, parameter or condition have different fingerprints."""
+        fingerprints = set()
+        cr = ClassicalRegister(1, 'cr')
+        for gate_name, param, condition in [('u1', 0.1, None), ('u1', 0.2, None),
+                                            ('rz', 0.1, None), ('u1', 0.1, 1),
+                                            ('u1', 0.1, 0)]:
+            circuit = QuantumCircuit(self.qr1, cr)
+            getattr(circuit, gate_name)(param, self.qr1[0])
+            if condition is not None:
+                circuit.data[-1][0].c_if(cr, condition)
+            fingerprints.add(circuit_to_dag(circuit).fingerprint())
+
+        self.assertEqual(len(fingerprints), 5)
+
+    def test_fingerprint_composite_gate(self):
+        """Composite gates with the same name and different definitions differ."""
+        fingerprints = set()
+        for gate_name in ['h', 'x']:
+            sub_circuit = QuantumCircuit(self.qr2, name='composite')
+            getattr(sub_circuit, gate_name)(self.qr2[0])
+            circuit = QuantumCircuit(self.qr2)
+            circuit.append(sub_circuit.to_instruction(), self.qr2[:])
+            fingerprints.add(circuit_to_dag(circuit).fingerprint())
+
+        self.assertEqual(len(fingerprints), 2)
+
 
 class TestDagSubstitute(QiskitTestCase):
     """Test substituting a dag node with a sub-dag"""
@@ -564,6 +761,19 @@ class TestDagSubstitute(QiskitTestCase):
 
         self.assertEqual(self.dag.count_ops()['h'], 5)
 
+    def test_substitute_marks_changed_wires(self):
+        """The method substitute_node_with_dag() marks the wires of the node as changed."""
+        x_node = self.dag.op_nodes(op=XGate).pop()
+        self.dag.changed_wires.clear()
+
+        replacement = DAGCircuit()
+        v = QuantumRegister(1, "v")
+        replacement.add_qreg(v)
+        replacement.apply_operation_back(HGate(), [v[0]], [])
+        self.dag.substitute_node_with_dag(x_node, replacement)
+
+        self.assertEqual(self.dag.changed_wires, {self.qubit1})
+
     def test_substitute_circuit_one_front(self):
         """The method substitute_node_with_dag() replaces a leaf-in-the-front node with a DAG."""
         pass
@@ -642,5 +852,100 @@ class TestDagProperties(QiskitTestCase):
         self.assertEqual(dag.depth(), 6)
 
 
+class WireGraphStorageMixin:
+    """Run the tests with the wiregraph DAGCircuit storage engine."""
+
+    def setUp(self):
+        """Make wiregraph the default storage for the duration of the test."""
+        self.addCleanup(setattr, DAGCircuit, 'default_storage', DAGCircuit.default_storage)
+        DAGCircuit.default_storage = 'wiregraph'
+        super().setUp()
+
+
+class TestDagOperationsWireGraph(WireGraphStorageMixin, TestDagOperations):
+    """Test ops inside the dag, with the wiregraph storage engine."""
+
+
+class TestDagTopologicalOrderWireGraph(WireGraphStorageMixin, TestDagTopologicalOrder):
+    """Test the cached topological order, with the wiregraph storage engine."""
+
+
+class TestDagLayersWireGraph(WireGraphStorageMixin, TestDagLayers):
+    """Test finding layers on the dag, with the wiregraph storage engine."""
+
+
+class TestCircuitPropertiesWireGraph(WireGraphStorageMixin, TestCircuitProperties):
+    """DAGCircuit properties test, with the wiregraph storage engine."""
+
+
+class TestDagEquivalenceWireGraph(WireGraphStorageMixin, TestDagEquivalence):
+    """DAGCircuit equivalence check, with the wiregraph storage engine."""
+
+
+class TestDagSubstituteWireGraph(WireGraphStorageMixin, TestDagSubstitute):
+    """Test substituting a dag node with a sub-dag, with the wiregraph storage engine."""
+
+
+class TestDagPropertiesWireGraph(WireGraphStorageMixin, TestDagProperties):
+    """Test the DAG properties, with the wiregraph storage engine."""
+
+
+class TestDagStorage(QiskitTestCase):
+    """Test the DAGCircuit graph storage engines agree."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        self.circuit = QuantumCircuit(qr, cr)
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.x(qr[2]).c_if(cr, 1)
+        self.circuit.measure(qr[1], cr[0])
+        self.circuit.ccx(qr[0], qr[1], qr[2])
+
+    def _dag(self, storage):
+        """DAG of the test circuit using the given storage engine."""
+        self.addCleanup(setattr, DAGCircuit, 'default_storage', DAGCircuit.default_storage)
+        DAGCircuit.default_storage = storage
+        return circuit_to_dag(self.circuit)
+
+    def test_storages_equal(self):
+        """DAGs with different storage engines compare equal."""
+        nx_dag = self._dag('networkx')
+        wire_dag = self._dag('wiregraph')
+        self.assertEqual(wire_dag.storage, 'wiregraph')
+        self.assertEqual(nx_dag, wire_dag)
+
+    def test_storages_fingerprint(self):
+        """The fingerprint does not depend on the storage engine."""
+        self.assertEqual(self._dag('networkx').fingerprint(),
+                         self._dag('wiregraph').fingerprint())
+
+    def test_storages_topological_order(self):
+        """Both storage engines yield the same topological order."""
+        nx_dag = self._dag('networkx')
+        wire_dag = self._dag('wiregraph')
+        self.assertEqual([node._node_id for node in nx_dag.topological_nodes()],
+                         [node._node_id for node in wire_dag.topological_nodes()])
+
+    def test_storages_to_networkx(self):
+        """to_networkx() returns the same graph for both storage engines."""
+        nx_graph = self._dag('networkx').to_networkx()
+        wire_graph = self._dag('wiregraph').to_networkx()
+        self.assertEqual(sorted(node._node_id for node in nx_graph.nodes),
+                         sorted(node._node_id for node in wire_graph.nodes))
+        self.assertEqual(sorted((u._node_id, v._node_id, data['name'])
+                                for u, v, data in nx_graph.edges(data=True)),
+                         sorted((u._node_id, v._node_id, data['name'])
+                                for u, v, data in wire_graph.edges(data=True)))
+
+    def test_layers_keep_storage(self):
+        """Layers use the storage engine of the DAG they come from."""
+        wire_dag = self._dag('wiregraph')
+        for layer in wire_dag.layers():
+            self.assertEqual(layer['graph'].storage, 'wiregraph')
+            self.assertEqual(layer['graph'].size(), len(layer['graph'].op_nodes()))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,13 +13,19 @@
 # that they have been altered from the originals.
 
 """Tests for qiskit/tools/parallel"""
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+import sys
 import time
 
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools import parallel
+from qiskit.tools.parallel import parallel_map, shutdown_pool
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
+_STATE_VALUE = 7
+
 
 def _parfunc(x):
     """Function for testing parallel_map
@@ -28,6 +34,25 @@ def _parfunc(x):
     return x
 
 
+def _getpid(_):
+    """Return the id of the process running the function."""
+    time.sleep(0.1)
+    return os.getpid()
+
+
+def _read_state(_):
+    """Return the value of a module attribute and the level of the qiskit logger."""
+    time.sleep(0.1)
+    return _STATE_VALUE, logging.getLogger('qiskit').level, os.getpid()
+
+
+def _raise_on_three(x):
+    """Raise a ValueError for 3, return x otherwise."""
+    if x == 3:
+        raise ValueError(x)
+    return x
+
+
 def _build_simple(_):
     qreg = QuantumRegister(2)
     creg = ClassicalRegister(2)
@@ -53,3 +78,100 @@ class TestParallel(QiskitTestCase):
         out_circs = parallel_map(_build_simple, list(range(10)))
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
+
+    def test_parallel_order(self):
+        """Results are in the order of the values when sent in chunks"""
+        ans = parallel_map(pow, list(range(1000)), task_args=(2,))
+        self.assertEqual(ans, [x ** 2 for x in range(1000)])
+
+    def test_parallel_pool_reused(self):
+        """The worker processes are reused by the next call"""
+        first = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        workers = {process.pid for process in parallel._POOL._pool}
+        second = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        self.assertLessEqual(first | second, workers)
+        self.assertNotIn(os.getpid(), workers)
+
+        shutdown_pool()
+        self.assertIsNone(parallel._POOL)
+        third = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        self.assertFalse(third & workers)
+
+    def test_parallel_pool_new_main_definitions(self):
+        """New workers are forked by shutdown_pool() to see functions defined in __main__"""
+        parallel_map(_getpid, list(range(8)), num_processes=2)
+        workers = {process.pid for process in parallel._POOL._pool}
+        main = vars(sys.modules['__main__'])
+        exec('def _parallel_test_task(_):\n'  # pylint: disable=exec-used
+             '    import os\n'
+             '    return os.getpid()\n', main)
+        try:
+            shutdown_pool()
+            pids = set(parallel_map(main['_parallel_test_task'], list(range(8)),
+                                    num_processes=2))
+        finally:
+            del main['_parallel_test_task']
+        self.assertFalse(pids & workers)
+
+    def test_parallel_pool_main_rebound(self):
+        """The workers are reused when names of __main__ are rebound"""
+        parallel_map(_getpid, list(range(8)), num_processes=2)
+        workers = {process.pid for process in parallel._POOL._pool}
+        main = vars(sys.modules['__main__'])
+        for index in range(3):
+            main['_parallel_test_value'] = [index]
+            main['_parallel_test_function'] = lambda _: None
+            pids = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+            self.assertLessEqual(pids, workers)
+        del main['_parallel_test_value']
+        del main['_parallel_test_function']
+
+    def test_parallel_pool_size_changed(self):
+        """New workers are forked when the number of processes changes"""
+        parallel_map(_getpid, list(range(8)), num_processes=2)
+        workers = {process.pid for process in parallel._POOL._pool}
+        pids = set(parallel_map(_getpid, list(range(8)), num_processes=3))
+        self.assertFalse(pids & workers)
+        self.assertEqual(len(parallel._POOL._pool), 3)
+
+    def test_parallel_pool_parent_state(self):
+        """Reused workers see the logger levels of the parent, and new workers
+        the module attributes set before shutdown_pool()"""
+        module = sys.modules[__name__]
+        qiskit_logger = logging.getLogger('qiskit')
+        level = qiskit_logger.level
+        self.addCleanup(qiskit_logger.setLevel, level)
+        self.addCleanup(setattr, module, '_STATE_VALUE', 7)
+
+        qiskit_logger.setLevel(logging.DEBUG)
+        results = parallel_map(_read_state, list(range(8)), num_processes=2)
+        self.assertEqual({result[:2] for result in results}, {(7, logging.DEBUG)})
+        workers = {process.pid for process in parallel._POOL._pool}
+
+        qiskit_logger.setLevel(logging.WARNING)
+        results = parallel_map(_read_state, list(range(8)), num_processes=2)
+        self.assertEqual({result[:2] for result in results}, {(7, logging.WARNING)})
+        self.assertLessEqual({result[2] for result in results}, workers)
+
+        module._STATE_VALUE = 9
+        shutdown_pool()
+        results = parallel_map(_read_state, list(range(8)), num_processes=2)
+        self.assertEqual({result[:2] for result in results}, {(9, logging.WARNING)})
+        self.assertFalse({result[2] for result in results} & workers)
+
+    def test_parallel_threads(self):
+        """parallel_map can be called from several threads at once"""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(parallel_map, pow, list(range(100)), (2,),
+                                       num_processes=num_processes)
+                       for num_processes in (2, 3, 2, 3)]
+            for future in futures:
+                self.assertEqual(future.result(), [x ** 2 for x in range(100)])
+
+    def test_parallel_exception(self):
+        """Exceptions are raised and the parallel env flag is reset"""
+        with self.assertRaises(ValueError):
+            parallel_map(_raise_on_three, list(range(10)), num_processes=2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+        ans = parallel_map(_raise_on_three, [0, 1, 2], num_processes=2)
+        self.assertEqual(ans, [0, 1, 2])
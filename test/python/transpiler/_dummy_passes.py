@@ -226,3 +226,41 @@ class PassM_AP_NR_NP(DummyAP):
         super().run(dag)
         self.argument1 *= 2
         logging.getLogger(logger).info('self.argument1 = %s', self.argument1)
+
+
+class PassN_TP_remove_h(DummyTP):
+    """ A dummy transformation pass that logs the wires changed since its last run, and
+    removes the first h gate of the dag.
+    TP: Transformation Pass
+    """
+
+    marks_changed_wires = True
+
+    def run(self, dag):
+        super().run(dag)
+        dirty_wires = self.property_set['dirty_wires']
+        if dirty_wires is None:
+            logging.getLogger(logger).info('dirty wires unknown')
+        else:
+            logging.getLogger(logger).info('dirty wires: %s', sorted(
+                '%s[%s]' % (wire[0].name, wire[1]) for wire in dirty_wires))
+        for node in dag.topological_op_nodes():
+            if node.name == 'h':
+                dag.remove_op_node(node)
+                break
+        return dag
+
+
+class PassO_TP_halve_u1(DummyTP):
+    """ A dummy transformation pass that halves in place the angle of the u1 gates above 0.25,
+    without going through the DAGCircuit methods.
+    TP: Transformation Pass
+    """
+
+    def run(self, dag):
+        super().run(dag)
+        for node in dag.named_nodes('u1'):
+            if node.op.params[0] > 0.25:
+                node.op.params[0] /= 2
+            logging.getLogger(logger).info('u1 angle = %s', node.op.params[0])
+        return dag
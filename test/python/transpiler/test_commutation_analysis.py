@@ -16,10 +16,14 @@
 """Commutation analysis and transformation pass testing"""
 
 import unittest
+from unittest import mock
 
-from qiskit import QuantumRegister, QuantumCircuit
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Gate
+from qiskit.extensions.standard import HGate, ZGate
 from qiskit.transpiler import PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis
+from qiskit.transpiler.passes import commutation_analysis
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 
@@ -286,6 +290,83 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[9], [13, 16, 19], [10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_gates_without_rules(self):
+        """Test gates compared by rules and by matrices
+
+        qr0:--.----|-----.---.---X---X---.--
+              |    |Rzz  |   |   |   |   |
+        qr1:-[Rz]--|----[u1]-(+)-X---X--[H]-
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.crz(0.1, qr[0], qr[1])
+        circuit.rzz(0.2, qr[0], qr[1])
+        circuit.cu1(0.3, qr[1], qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.swap(qr[0], qr[1])
+        circuit.swap(qr[1], qr[0])
+        circuit.ch(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+
+        expected = {'qr[0]': [[1], [5, 6, 7], [8], [9, 10], [11], [2]],
+                    'qr[1]': [[3], [5, 6, 7], [8], [9, 10], [11], [4]]}
+        self.assertCommutationSet(self.pset["commutation_set"], expected)
+
+    def test_conditional_gates(self):
+        """Test conditional gates do not commute
+
+        qr0:--[Z]--[Z]--[Z]--
+                    |
+        cr0:-------=o=-------
+        """
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.z(qr[0])
+        circuit.z(qr[0]).c_if(cr, 0)
+        circuit.z(qr[0])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+
+        expected = {'qr[0]': [[1], [5], [6], [7], [2]],
+                    'cr[0]': [[3], [6], [4]]}
+        self.assertCommutationSet(self.pset["commutation_set"], expected)
+
+    def test_commutation_cache(self):
+        """Test the commutation of gates without rules is computed once per pair"""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        for _ in range(10):
+            circuit.swap(qr[0], qr[1])
+            circuit.h(qr[0])
+        dag = circuit_to_dag(circuit)
+        commutation_analysis._COMMUTATION_CACHE.clear()
+
+        with mock.patch.object(commutation_analysis, '_matrix_commute',
+                               wraps=commutation_analysis._matrix_commute) as matrix_commute:
+            self.pass_.run(dag)
+
+        # swap and h on qr[0], h and swap on qr[0], and swap and swap on qr[1]
+        self.assertEqual(matrix_commute.call_count, 3)
+        self.assertEqual(len(self.pset['commutation_set']['qr[0]']), 22)
+
+    def test_custom_gates_same_name(self):
+        """Test custom gates with the same name are not mistaken for one another"""
+        qr = QuantumRegister(1, 'qr')
+        for definition, expected in [(ZGate(), {'qr[0]': [[1], [3, 4, 5], [2]]}),
+                                     (HGate(), {'qr[0]': [[1], [3], [4], [5], [2]]})]:
+            gate = Gate('mygate', 1, [])
+            gate.definition = [(definition, [qr[0]], [])]
+            circuit = QuantumCircuit(qr)
+            circuit.z(qr[0])
+            circuit.append(gate, [qr[0]])
+            circuit.z(qr[0])
+            self.pass_.run(circuit_to_dag(circuit))
+            self.assertCommutationSet(self.pset["commutation_set"], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
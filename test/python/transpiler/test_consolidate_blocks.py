@@ -19,12 +19,14 @@ Tests for the ConsolidateBlocks transpiler pass.
 import unittest
 import numpy as np
 
-from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import QuantumCircuit, QuantumRegister, Gate
 from qiskit.extensions import UnitaryGate
+from qiskit.extensions.standard import HGate, ZGate
 from qiskit.converters import circuit_to_dag
 from qiskit.execute import execute
 from qiskit.transpiler.passes import ConsolidateBlocks
 from qiskit.providers.basicaer import UnitarySimulatorPy
+from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.operators.measures import process_fidelity
 from qiskit.test import QiskitTestCase
 
@@ -146,6 +148,116 @@ class TestConsolidateBlocks(QiskitTestCase):
         fidelity = process_fidelity(new_dag.op_nodes()[0].op.to_matrix(), unitary.to_matrix())
         self.assertAlmostEqual(fidelity, 1.0, places=7)
 
+    def test_2q_block_matrix(self):
+        """the unitary of a 2-qubit block of gates on both wire orders is correct."""
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.h(qr[0])
+        qc.u3(0.1, 0.2, 0.3, qr[1])
+        qc.cx(qr[1], qr[0])
+        qc.cz(qr[0], qr[1])
+        qc.rzz(0.4, qr[1], qr[0])
+        qc.cu3(0.5, 0.6, 0.7, qr[1], qr[0])
+        qc.t(qr[1])
+        dag = circuit_to_dag(qc)
+
+        pass_ = ConsolidateBlocks()
+        pass_.property_set['block_list'] = [list(dag.topological_op_nodes())]
+        new_dag = pass_.run(dag)
+
+        sim = UnitarySimulatorPy()
+        result = execute(qc, sim).result()
+        self.assertEqual(len(new_dag.op_nodes()), 1)
+        fidelity = process_fidelity(new_dag.op_nodes()[0].op.to_matrix(), result.get_unitary())
+        self.assertAlmostEqual(fidelity, 1.0, places=7)
+
+    def test_keep_blocks_not_made_cheaper(self):
+        """blocks whose resynthesis needs as many cx gates are kept when not forced.
+
+        qr0:--[u1]--.----.--(+)--.--      qr0:--[u1]--.----.--(+)--.--
+                    |    |   |   |    =               |    |   |   |
+        qr1:--[u2]-(+)--(+)--.--(+)-      qr1:--[u2]-(+)--(+)--.--(+)-
+        """
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.u1(0.5, qr[0])
+        qc.u2(0.2, 0.6, qr[1])
+        qc.cx(qr[0], qr[1])
+        qc.cx(qr[0], qr[1])
+        qc.cx(qr[1], qr[0])
+        qc.cx(qr[0], qr[1])
+        dag = circuit_to_dag(qc)
+        topo_ops = list(dag.topological_op_nodes())
+
+        pass_ = ConsolidateBlocks(force_consolidate=False)
+        pass_.property_set['block_list'] = [topo_ops[:3], topo_ops[3:]]
+        new_dag = pass_.run(dag)
+
+        self.assertEqual(new_dag.count_ops(), {'u1': 1, 'u2': 1, 'cx': 4})
+
+    def test_consolidate_blocks_made_cheaper(self):
+        """blocks whose resynthesis needs fewer cx gates are consolidated when not forced.
+
+        qr0:--.----.----.--      qr0:--|   |--
+              |    |    |     =        | U |
+        qr1:-(+)--(+)--(+)-      qr1:--|   |--
+        """
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.cx(qr[0], qr[1])
+        qc.cx(qr[0], qr[1])
+        qc.cx(qr[0], qr[1])
+        dag = circuit_to_dag(qc)
+
+        pass_ = ConsolidateBlocks(force_consolidate=False)
+        pass_.property_set['block_list'] = [dag.op_nodes()]
+        new_dag = pass_.run(dag)
+
+        self.assertEqual(new_dag.count_ops(), {'unitary': 1})
+        unitary = new_dag.op_nodes()[0].op
+        self.assertEqual(unitary.definition.count_ops()['cx'], 1)
+        fidelity = process_fidelity(unitary.to_matrix(), Operator(qc).data)
+        self.assertAlmostEqual(fidelity, 1.0, places=7)
+
+    def test_unchanged_blocks_not_recomputed(self):
+        """blocks of the same content as in the last run reuse its unitary."""
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.u1(0.5, qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.u2(0.2, 0.6, qr[1])
+        dag = circuit_to_dag(qc)
+
+        pass_ = ConsolidateBlocks()
+        pass_.property_set['block_list'] = [dag.op_nodes()]
+        first = pass_.run(dag)
+        dag = circuit_to_dag(qc)
+        pass_.property_set['block_list'] = [dag.op_nodes()]
+        second = pass_.run(dag)
+
+        self.assertIs(first.op_nodes()[0].op, second.op_nodes()[0].op)
+
+    def test_custom_gates_same_name(self):
+        """custom gates with the same name but different definitions get their own unitary."""
+        qr = QuantumRegister(2, "qr")
+        pass_ = ConsolidateBlocks()
+        for definition in (ZGate(), HGate()):
+            gate = Gate('mygate', 1, [])
+            gate.definition = [(definition, [qr[0]], [])]
+            qc = QuantumCircuit(qr)
+            qc.append(gate, [qr[0]])
+            qc.cx(qr[0], qr[1])
+            dag = circuit_to_dag(qc)
+            pass_.property_set['block_list'] = [list(dag.topological_op_nodes())]
+            new_dag = pass_.run(dag)
+
+            expected = QuantumCircuit(qr)
+            expected.append(definition, [qr[0]])
+            expected.cx(qr[0], qr[1])
+            fidelity = process_fidelity(new_dag.op_nodes()[0].op.to_matrix(),
+                                        Operator(expected).data)
+            self.assertAlmostEqual(fidelity, 1.0, places=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,7 +22,8 @@ from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister
 from qiskit.transpiler import PassManager
 from qiskit.compiler import transpile
 from qiskit.transpiler.passes import Optimize1qGates, Unroller
-from qiskit.converters import circuit_to_dag
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.quantum_info.operators import Operator
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeRueschlikon
 from qiskit.circuit import Parameter
@@ -114,16 +115,14 @@ class TestOptimize1qGates(QiskitTestCase):
         dag = circuit_to_dag(circ)
         simplified_dag = Optimize1qGates().run(dag)
 
-        params = set()
-        for node in simplified_dag.named_nodes('u1'):
-            params.add(node.op.params[0])
+        params = sorted(node.op.params[0] for node in simplified_dag.named_nodes('u1'))
 
-        expected_params = {sympy.Number(-3 * np.pi / 2),
-                           sympy.Number(1.0 + 0.55 * np.pi),
-                           sympy.Number(-0.479425538604203),
-                           sympy.Number(0.3 + np.pi + np.pi ** 2)}
+        expected_params = sorted([-3 * np.pi / 2,
+                                  1.0 + 0.55 * np.pi,
+                                  -0.479425538604203,
+                                  0.3 + np.pi + np.pi ** 2])
 
-        self.assertEqual(params, expected_params)
+        np.testing.assert_allclose(params, expected_params)
 
     def test_ignores_conditional_rotations(self):
         """Conditional rotations should not be considered in the chain.
@@ -225,6 +224,53 @@ class TestOptimize1qGates(QiskitTestCase):
 
         self.assertEqual(circuit_to_dag(expected), after)
 
+    def test_merge_runs_of_u3_gates(self):
+        """Runs of u2 and u3 gates are merged into a gate equivalent up to a global phase.
+
+        qr0:--[U3]-[U2]-[U1]-[U3]- ... -[U3]--    qr0:--[U3]--
+        qr1:--[U3]-[U3]^-1--------------------    qr1:--------
+        qr2:--[U2]-[U2]-[U2]------------------    qr2:--[U2]--
+        """
+        rng = np.random.RandomState(1234)
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        for _ in range(20):
+            circuit.u3(*rng.uniform(0, 2 * np.pi, 3), qr[0])
+            circuit.u2(*rng.uniform(0, 2 * np.pi, 2), qr[0])
+            circuit.u1(rng.uniform(0, 2 * np.pi), qr[0])
+        circuit.u3(0.1, 0.2, 0.3, qr[1])
+        circuit.u3(-0.1, -0.3, -0.2, qr[1])
+        circuit.u2(0, np.pi, qr[2])
+        circuit.u2(0, np.pi, qr[2])
+        circuit.u2(0, np.pi, qr[2])
+
+        after = Optimize1qGates().run(circuit_to_dag(circuit))
+
+        self.assertEqual(after.count_ops(), {'u3': 1, 'u2': 1})
+        self.assertEqual(after.named_nodes('u2')[0].op.params, [0, np.pi])
+        product = np.dot(np.conj(Operator(circuit).data.T), Operator(dag_to_circuit(after)).data)
+        self.assertAlmostEqual(abs(np.trace(product)), 8)
+
+    def test_only_dirty_wires(self):
+        """Only the runs on the wires changed since the last run of the pass are merged.
+
+        qr0:--[U1]-[U1]--    qr0:--[U1]--------
+        qr1:--[U1]-[U1]--    qr1:--[U1]-[U1]---
+        """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u1(0.1, qr[0])
+        circuit.u1(0.2, qr[0])
+        circuit.u1(0.1, qr[1])
+        circuit.u1(0.2, qr[1])
+
+        pass_ = Optimize1qGates()
+        pass_.property_set['dirty_wires'] = {qr[0]}
+        after = pass_.run(circuit_to_dag(circuit))
+
+        self.assertEqual(len(list(after.nodes_on_wire(qr[0], only_ops=True))), 1)
+        self.assertEqual(len(list(after.nodes_on_wire(qr[1], only_ops=True))), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
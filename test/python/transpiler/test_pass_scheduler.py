@@ -22,13 +22,15 @@ from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PassManager
 from qiskit.compiler import transpile
 from qiskit.transpiler import TranspilerAccessError, TranspilerError
+from qiskit.transpiler.passes import DAGFixedPoint
 from qiskit.transpiler.passmanager import DoWhileController, ConditionalController, \
     FlowController, FlowControllerLinear
 from qiskit.test import QiskitTestCase
 from ._dummy_passes import (PassA_TP_NR_NP, PassB_TP_RA_PA, PassC_TP_RA_PA,
                             PassD_TP_NR_NP, PassE_AP_NR_NP, PassF_reduce_dag_property,
                             PassH_Bad_TP, PassI_Bad_AP, PassJ_Bad_NoReturn,
-                            PassK_check_fixed_point_property, PassM_AP_NR_NP)
+                            PassK_check_fixed_point_property, PassM_AP_NR_NP,
+                            PassN_TP_remove_h, PassO_TP_halve_u1)
 
 logger = "LocalLogger"
 
@@ -454,6 +456,41 @@ class TestUseCases(SchedulerTestCase):
                                     'run transformation pass PassF_reduce_dag_property',
                                     'dag property = 5'], TranspilerError)
 
+    def test_dirty_wires(self):
+        """ A pass is given the wires changed since its last run, and a loop stops at
+        the first iteration that changes nothing. """
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.h(qr[1])
+        self.passmanager.append(
+            [PassN_TP_remove_h(), DAGFixedPoint()],
+            do_while=lambda property_set: not property_set['dag_fixed_point'])
+        self.assertScheduler(circuit, self.passmanager,
+                             ['run transformation pass PassN_TP_remove_h',
+                              'dirty wires unknown',
+                              'run transformation pass PassN_TP_remove_h',
+                              "dirty wires: ['qr[0]']",
+                              'run transformation pass PassN_TP_remove_h',
+                              "dirty wires: ['qr[1]']"])
+
+    def test_dirty_wires_unknown(self):
+        """ A loop does not stop before the DAG stops changing when a pass changes it
+        without marking the changed wires. """
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u1(1, qr[0])
+        self.passmanager.append(
+            [PassO_TP_halve_u1(), DAGFixedPoint()],
+            do_while=lambda property_set: not property_set['dag_fixed_point'])
+        self.assertScheduler(circuit, self.passmanager,
+                             ['run transformation pass PassO_TP_halve_u1',
+                              'u1 angle = 0.5',
+                              'run transformation pass PassO_TP_halve_u1',
+                              'u1 angle = 0.25',
+                              'run transformation pass PassO_TP_halve_u1',
+                              'u1 angle = 0.25'])
+
     def test_fresh_initial_state(self):
         """ New construction gives fresh instance """
         self.passmanager.append(PassM_AP_NR_NP(argument1=1))
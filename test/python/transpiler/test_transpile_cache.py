@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the cache of transpiled circuits."""
+
+import importlib
+import os
+import tempfile
+import unittest.mock
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import transpile
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeMelbourne
+from qiskit.transpiler import PassManager, TranspileCache
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Test the TranspileCache of transpile()."""
+
+    def setUp(self):
+        self.backend = FakeMelbourne()
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        self.circuit = QuantumCircuit(qr, cr, name='ghz')
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.cx(qr[0], qr[2])
+        self.circuit.measure(qr, cr)
+
+    def _transpile_mock(self):
+        """Mock counting the circuits transpiled by transpile()."""
+        transpile_module = importlib.import_module('qiskit.compiler.transpile')
+        transpile_circuit = transpile_module.transpile_circuit
+        return unittest.mock.patch.object(transpile_module, 'transpile_circuit',
+                                          side_effect=transpile_circuit)
+
+    def test_hit(self):
+        """A circuit transpiled twice is only transpiled once."""
+        cache = TranspileCache()
+        with self._transpile_mock() as transpile_circuit:
+            first = transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+            second = transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+
+        self.assertEqual(transpile_circuit.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_hit_returns_copy(self):
+        """Modifying a returned circuit does not modify the cached one."""
+        cache = TranspileCache()
+        first = transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+        expected = first.copy()
+        first.x(first.qregs[0][0])
+        second = transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+
+        self.assertEqual(second, expected)
+
+    def test_same_structure_hit(self):
+        """A structurally identical circuit with another name is a hit."""
+        cache = TranspileCache()
+        transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+        circuit = self.circuit.copy(name='other')
+        result = transpile(circuit, self.backend, seed_transpiler=42, cache=cache)
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(result.name, 'other')
+
+    def test_multiple_circuits(self):
+        """Only the circuits missing from the cache are transpiled, in order."""
+        cache = TranspileCache()
+        other = self.circuit.copy(name='other')
+        other.x(other.qregs[0][0])
+        first = transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+        results = transpile([other, self.circuit], self.backend, seed_transpiler=42,
+                            cache=cache)
+
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual([result.name for result in results], ['other', 'ghz'])
+        self.assertEqual(results[1], first)
+
+    def test_options_miss(self):
+        """Different transpile options are cache misses."""
+        cache = TranspileCache()
+        transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+        transpile(self.circuit, self.backend, seed_transpiler=43, cache=cache)
+        transpile(self.circuit, self.backend, seed_transpiler=42,
+                  optimization_level=0, cache=cache)
+        transpile(self.circuit, basis_gates=['u3', 'cx'], cache=cache)
+
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+
+    def test_pass_manager_not_cached(self):
+        """Circuits transpiled with a custom pass manager are not cached."""
+        cache = TranspileCache()
+        transpile(self.circuit, pass_manager=PassManager(), cache=cache)
+        transpile(self.circuit, pass_manager=PassManager(), cache=cache)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_parameters(self):
+        """A hit uses the Parameter objects of the circuit being transpiled."""
+        cache = TranspileCache()
+        results = []
+        for _ in range(2):
+            theta = Parameter('theta')
+            qr = QuantumRegister(1, 'qr')
+            circuit = QuantumCircuit(qr)
+            circuit.rz(theta, qr[0])
+            result = transpile(circuit, basis_gates=['u1', 'u3'], cache=cache)
+            self.assertEqual(result.parameters, {theta})
+            results.append(result.bind_parameters({theta: 0.5}))
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(results[0], results[1])
+
+    def test_lru_eviction(self):
+        """The least recently used circuit is evicted from memory."""
+        cache = TranspileCache(max_size=2)
+        circuits = [self.circuit.copy() for _ in range(3)]
+        for index, circuit in enumerate(circuits):
+            circuit.x(circuit.qregs[0][index])
+        for circuit in circuits[:2] + [circuits[0]] + circuits[2:]:
+            transpile(circuit, self.backend, seed_transpiler=42, cache=cache)
+        transpile(circuits[1], self.backend, seed_transpiler=42, cache=cache)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_disk_tier(self):
+        """Circuits are shared through the cache directory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = transpile(self.circuit, self.backend, seed_transpiler=42,
+                              cache=TranspileCache(cache_dir=cache_dir))
+            cache = TranspileCache(cache_dir=cache_dir)
+            second = transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(first, second)
+
+            cache.clear()
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_disk_size_cap(self):
+        """The cache directory is trimmed to max_disk_size bytes."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TranspileCache(cache_dir=cache_dir)
+            transpile(self.circuit, self.backend, seed_transpiler=42, cache=cache)
+            size = os.path.getsize(os.path.join(cache_dir, os.listdir(cache_dir)[0]))
+
+            cache = TranspileCache(cache_dir=cache_dir, max_disk_size=int(1.5 * size))
+            transpile(self.circuit, self.backend, seed_transpiler=43, cache=cache)
+
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,12 +16,16 @@
 
 """Test the Unroller pass"""
 
+from unittest import mock
+
 from sympy import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.extensions.simulator import snapshot
+from qiskit.quantum_info.operators import Operator
 from qiskit.transpiler.passes import Unroller
-from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import unroller
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.test import QiskitTestCase
 from qiskit.exceptions import QiskitError
 from qiskit.circuit import Parameter
@@ -94,6 +98,34 @@ class TestUnroller(QiskitTestCase):
         ref_dag = circuit_to_dag(ref_circuit)
         self.assertEqual(unrolled_dag, ref_dag)
 
+    def test_unroll_cached_decompositions(self):
+        """Test the decomposition of a gate is unrolled once and reused.
+        """
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+        circuit.ccx(qr[2], qr[0], qr[1])
+        circuit.ccx(qr[1], qr[2], qr[0]).c_if(cr, 1)
+        circuit.ccx(qr[0], qr[2], qr[1])
+        dag = circuit_to_dag(circuit)
+        unroller._UNROLLED_CACHE.clear()
+
+        with mock.patch.object(Unroller, '_unroll_definition', autospec=True,
+                               side_effect=Unroller._unroll_definition) as unroll_definition:
+            unrolled_dag = Unroller(['u1', 'u2', 'u3', 'cx']).run(dag)
+
+        unrolled_names = [call[0][1].name for call in unroll_definition.call_args_list]
+        self.assertEqual(unrolled_names.count('ccx'), 1)
+        conditions = [node.condition for node in unrolled_dag.op_nodes()]
+        self.assertEqual(conditions.count(None), 45)
+        self.assertEqual(conditions.count((cr, 1)), 15)
+
+        unconditional = QuantumCircuit(qr)
+        unconditional.ccx(qr[0], qr[2], qr[1])
+        unrolled = Unroller(['u1', 'u2', 'u3', 'cx']).run(circuit_to_dag(unconditional))
+        self.assertEqual(Operator(unconditional), Operator(dag_to_circuit(unrolled)))
+
     def test_unroll_no_basis(self):
         """Test when a given gate has no decompositions.
         """
@@ -14,10 +14,11 @@
 
 """Models tests."""
 
+import pickle
 from datetime import datetime
 
 from qiskit.validation import fields
-from qiskit.validation.base import BaseModel, BaseSchema, bind_schema
+from qiskit.validation.base import BaseModel, BaseSchema, bind_schema, skip_validation
 from qiskit.validation.exceptions import ModelValidationError
 from qiskit.test import QiskitTestCase
 
@@ -91,6 +92,29 @@ class TestModels(QiskitTestCase):
         with self.assertRaises(ModelValidationError):
             _ = Person.from_dict({'name': 1})
 
+    def test_instantiate_skip_validation(self):
+        """Test model instantiation without validation."""
+        with skip_validation():
+            person = Person(name=1)
+            with skip_validation():
+                _ = Person()
+            _ = Book(title='Foo', author='Bar')
+        self.assertEqual(person.name, 1)
+
+        with self.assertRaises(ModelValidationError):
+            _ = Person(name=1)
+
+    def test_unpickle_without_validation(self):
+        """Test unpickled models are not validated again."""
+        with skip_validation():
+            person = Person(name=1)
+        book = Book(title='Foo', author=Person(name='Bar'))
+        self.assertEqual(pickle.loads(pickle.dumps(person)).name, 1)
+        self.assertEqual(pickle.loads(pickle.dumps(book)), book)
+
+        with self.assertRaises(ModelValidationError):
+            _ = Person(name=1)
+
     def test_instantiate_deserialized_types(self):
         """Test model instantiation with fields of deserialized type."""
         birth_date = datetime(2000, 1, 1).date()
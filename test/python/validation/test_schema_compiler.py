@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the compilation of JSON schemas."""
+
+import copy
+import json
+import os
+
+import jsonschema
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.qobj import validate_qobj_against_schema
+from qiskit.test import QiskitTestCase, Path
+from qiskit.validation.jsonschema import SchemaValidationError
+from qiskit.validation.jsonschema.compiler import compile_schema, SchemaCompilationError
+from qiskit.validation.jsonschema.schema_validation import (
+    _get_validator, _CHECKERS, _DEFAULT_SCHEMA_PATHS)
+
+
+def _mutations(instance):
+    """Yield copies of instance with one value changed or removed."""
+    values = [None, -1, 'x']
+    if isinstance(instance, dict):
+        for key in instance:
+            removed = dict(instance)
+            del removed[key]
+            yield removed
+            for value in values:
+                changed = dict(instance)
+                changed[key] = value
+                yield changed
+        added = dict(instance)
+        added['unexpected'] = 1
+        yield added
+    elif isinstance(instance, list) and instance:
+        yield []
+        yield instance + instance[:1]
+        for value in values:
+            yield [value] + instance[1:]
+
+
+def _subinstances(instance):
+    """Yield the instance and all its nested values, with a way to replace them."""
+    yield instance, lambda value: value
+    if isinstance(instance, dict):
+        items = instance.items()
+    elif isinstance(instance, list):
+        items = enumerate(instance)
+    else:
+        return
+    for key, value in list(items):
+        for subinstance, rebuild in _subinstances(value):
+            def _rebuild(new, key=key, rebuild=rebuild):
+                container = copy.copy(instance)
+                container[key] = rebuild(new)
+                return container
+            yield subinstance, _rebuild
+
+
+class TestSchemaCompiler(QiskitTestCase):
+    """Tests for compile_schema."""
+
+    def assertSameValidity(self, schema, instances):
+        """Assert the compiled schema agrees with jsonschema on the instances."""
+        check = compile_schema(schema)
+        validator = jsonschema.Draft4Validator(schema)
+        for instance in instances:
+            self.assertEqual(check(instance), validator.is_valid(instance),
+                             'Validity differs for {!r}'.format(instance))
+
+    def test_types(self):
+        """Test the type keyword, with booleans not being numbers."""
+        instances = [None, True, 0, 1.5, 'a', [], {}]
+        for type_ in ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string',
+                      ['integer', 'string']]:
+            self.assertSameValidity({'type': type_}, instances)
+
+    def test_numeric_keywords(self):
+        """Test minimum, maximum and multipleOf."""
+        instances = [-1, 0, 0.5, 1, 2, 2.5, True, 'a']
+        self.assertSameValidity({'minimum': 0, 'maximum': 2}, instances)
+        self.assertSameValidity({'minimum': 0, 'exclusiveMinimum': True,
+                                 'maximum': 2, 'exclusiveMaximum': True}, instances)
+        self.assertSameValidity({'multipleOf': 2}, instances)
+        self.assertSameValidity({'multipleOf': 0.5}, instances)
+
+    def test_object_keywords(self):
+        """Test properties, patternProperties, additionalProperties and co."""
+        schema = {'properties': {'a': {'type': 'integer'}},
+                  'patternProperties': {'^x_': {'type': 'string'}},
+                  'additionalProperties': False,
+                  'required': ['a'],
+                  'dependencies': {'x_b': ['a'], 'x_c': {'maxProperties': 2}}}
+        instances = [{}, {'a': 1}, {'a': 'b'}, {'a': 1, 'x_b': 'c'}, {'a': 1, 'x_b': 1},
+                     {'a': 1, 'b': 1}, {'a': 1, 'x_c': 'c'}, {'a': 1, 'x_b': '', 'x_c': ''},
+                     [], 1]
+        self.assertSameValidity(schema, instances)
+        self.assertSameValidity({'additionalProperties': {'type': 'string'},
+                                 'minProperties': 1}, instances)
+
+    def test_array_keywords(self):
+        """Test items, additionalItems, minItems, maxItems and uniqueItems."""
+        instances = [[], [1], [1, 1], [1, 'a'], [1, 'a', None], ['a'], {}, 'a']
+        self.assertSameValidity({'items': {'type': 'integer'}, 'minItems': 1}, instances)
+        self.assertSameValidity({'items': [{'type': 'integer'}, {'type': 'string'}],
+                                 'additionalItems': False}, instances)
+        self.assertSameValidity({'items': [{'type': 'integer'}],
+                                 'additionalItems': {'type': 'string'}}, instances)
+        self.assertSameValidity({'uniqueItems': True, 'maxItems': 2}, instances)
+
+    def test_string_keywords(self):
+        """Test minLength, maxLength, pattern and enum."""
+        instances = ['', 'a', 'ab', 'abc', 'ba', 1]
+        self.assertSameValidity({'minLength': 1, 'maxLength': 2, 'pattern': '^a'}, instances)
+        self.assertSameValidity({'enum': ['a', 1]}, instances)
+
+    def test_combinators(self):
+        """Test allOf, anyOf, oneOf and not."""
+        integer = {'type': 'integer'}
+        positive = {'minimum': 0}
+        instances = [-1, 1, 0.5, -0.5, 'a']
+        self.assertSameValidity({'allOf': [integer, positive]}, instances)
+        self.assertSameValidity({'anyOf': [integer, positive]}, instances)
+        self.assertSameValidity({'oneOf': [integer, positive]}, instances)
+        self.assertSameValidity({'not': integer}, instances)
+
+    def test_recursive_reference(self):
+        """Test a reference to a definition containing itself."""
+        schema = {'definitions': {'tree': {'type': 'array',
+                                           'items': {'$ref': '#/definitions/tree'}}},
+                  '$ref': '#/definitions/tree'}
+        self.assertSameValidity(schema, [[], [[], [[]]], [[], [1]], 1])
+
+    def test_remote_reference(self):
+        """Test that remote references are not compiled."""
+        with self.assertRaises(SchemaCompilationError):
+            compile_schema({'$ref': 'http://example.com/schema.json'})
+
+    def test_default_schemas(self):
+        """Test the compiled default schemas agree with jsonschema on mutated examples."""
+        examples_path = os.path.join(Path.SCHEMAS.value, 'examples')
+        examples = {'backend_configuration': ['backend_configuration_openqasm_example.json'],
+                    'qobj': ['qobj_openqasm_example.json', 'qobj_openpulse_example.json'],
+                    'result': ['result_openqasm_example.json']}
+        for schema_name, file_names in examples.items():
+            validator = _get_validator(schema_name)
+            check = _CHECKERS[schema_name]
+            self.assertIsNotNone(check)
+            for file_name in file_names:
+                with open(os.path.join(examples_path, file_name), 'r') as example_file:
+                    example = json.load(example_file)
+                self.assertTrue(check(example))
+                for subinstance, rebuild in _subinstances(example):
+                    for mutation in _mutations(subinstance):
+                        instance = rebuild(mutation)
+                        self.assertEqual(check(instance), validator.is_valid(instance),
+                                         'Validity differs in {} for {!r}'.format(
+                                             file_name, mutation))
+
+    def test_all_default_schemas_compile(self):
+        """Test all the default schemas have a compiled check."""
+        for schema_name in _DEFAULT_SCHEMA_PATHS:
+            _get_validator(schema_name)
+            self.assertIsNotNone(_CHECKERS[schema_name])
+
+
+class TestQobjSchemaValidation(QiskitTestCase):
+    """Tests for the validation of Qobj against the schema."""
+
+    def setUp(self):
+        qr = QuantumRegister(2, 'q')
+        cr = ClassicalRegister(2, 'c')
+        circuits = []
+        for index in range(10):
+            circ = QuantumCircuit(qr, cr, name='circ{}'.format(index))
+            circ.h(qr[0])
+            circ.cx(qr[0], qr[1])
+            circ.measure(qr, cr)
+            circuits.append(circ)
+        self.qobj = assemble(circuits, shots=100)
+
+    def test_valid_qobj(self):
+        """Test a valid Qobj with many experiments validates."""
+        validate_qobj_against_schema(self.qobj)
+
+    def test_invalid_experiment_same_error(self):
+        """Test an invalid experiment raises the same error as the whole Qobj validation."""
+        self.qobj.experiments[7].instructions[0].qubits = [0, 1]
+        with self.assertRaises(SchemaValidationError) as chunked:
+            validate_qobj_against_schema(self.qobj)
+
+        expected = None
+        try:
+            jsonschema.Draft4Validator(_get_validator('qobj').schema).validate(
+                self.qobj.to_dict())
+        except jsonschema.ValidationError as err:
+            expected = err
+        self.assertIsNotNone(expected)
+        error = chunked.exception.__cause__.validation_error
+        self.assertEqual(error.message, expected.message)
+        self.assertEqual(list(error.absolute_path), list(expected.absolute_path))
+        self.assertEqual(list(error.schema_path), list(expected.schema_path))
+
+    def test_invalid_shell(self):
+        """Test an invalid field outside of the experiments is reported."""
+        self.qobj.config.shots = 0
+        with self.assertRaises(SchemaValidationError):
+            validate_qobj_against_schema(self.qobj)